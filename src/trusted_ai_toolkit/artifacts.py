@@ -1,32 +1,234 @@
-"""Artifact store utilities for deterministic outputs and templated docs."""
+"""Artifact store utilities for deterministic outputs and templated docs.
+
+JSON artifacts are written according to a serialization policy: ``pretty``
+(indented, the default) or ``compact``, optionally compressed with gzip or
+zstd.  Compressed artifacts keep their ``.json`` name so required-output
+lists, manifests and catalog lookups are unaffected; ``load_json_artifact``
+detects the compression from the file's magic bytes, so every reader handles
+all policies transparently.  zstd needs the optional ``zstandard`` package
+(``pip install trusted_ai_toolkit[zstd]``).
+"""
 
 from __future__ import annotations
 
+import gzip
 import hashlib
 import json
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from trusted_ai_toolkit.schemas import ArtifactManifest, ArtifactManifestItem, ToolkitConfig
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without the zstd extra
+    zstandard = None
+
+ZSTD_AVAILABLE: bool = zstandard is not None
+
+JSON_STYLES = ("pretty", "compact")
+JSON_COMPRESSIONS = ("none", "gzip", "zstd")
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+# Outputs each artifact profile leaves out of a prompt-workflow run.  A stage
+# whose outputs are all skipped does not run at all (``minimal`` skips the
+# reasoning report and therefore every XAI engine).  Evidence completeness
+# only requires what the store's profile produces; see ``required_outputs_for``.
+_STANDARD_SKIPPED_OUTPUTS = frozenset(
+    {
+        "system_card.md",
+        "data_card.md",
+        "model_card.md",
+        "artifact_manifest.md",
+        "scorecard.md",
+    }
+)
+ARTIFACT_PROFILES: dict[str, frozenset[str]] = {
+    "full": frozenset(),
+    "standard": _STANDARD_SKIPPED_OUTPUTS,
+    "minimal": _STANDARD_SKIPPED_OUTPUTS
+    | {
+        "embedding_trace.json",
+        "reasoning_report.md",
+        "reasoning_report.json",
+        "lineage_report.md",
+        "authoritative_data_index.json",
+        "artifact_manifest.json",
+        "scorecard.html",
+        "incident_report.md",
+    },
+}
+
+
+# Outputs a refresh rewrites in place (the scorecard renderings and the
+# manifest itself).  A same-size rewrite within the filesystem's timestamp
+# granularity keeps both size and mtime, so these are always hashed again;
+# other outputs are written once per run and reuse their recorded digest.
+_REWRITTEN_OUTPUT_STEMS = frozenset({"scorecard", "artifact_manifest"})
+
+
+def required_outputs_for(config: ToolkitConfig, store: ArtifactStore) -> list[str]:
+    """Return the risk tier's required outputs that ``store``'s artifact profile produces."""
+
+    required = config.artifact_policy.required_outputs_by_risk_tier.get(config.risk_tier, [])
+    return [name for name in required if store.produces(name)]
+
+
+def encode_json_artifact(payload: Any, style: str = "pretty", compression: str = "none") -> bytes:
+    """Serialize ``payload`` under the given style and compression policy."""
+
+    if style == "compact":
+        text = json.dumps(payload, separators=(",", ":"), default=str)
+    else:
+        text = json.dumps(payload, indent=2, default=str)
+    data = text.encode("utf-8")
+    if compression == "gzip":
+        # mtime=0 keeps the bytes (and manifest digests) deterministic.
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd artifact compression requires the 'zstandard' package (trusted_ai_toolkit[zstd])")
+        compressed: bytes = zstandard.ZstdCompressor(level=3).compress(data)
+        return compressed
+    return data
+
+
+def decode_json_artifact(raw: bytes) -> Any:
+    """Parse JSON artifact bytes written under any serialization policy."""
+
+    if raw.startswith(_GZIP_MAGIC):
+        raw = gzip.decompress(raw)
+    elif raw.startswith(_ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError("reading a zstd-compressed artifact requires the 'zstandard' package")
+        raw = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    return json.loads(raw.decode("utf-8"))
 
-from jinja2 import Environment, FileSystemLoader
 
-from trusted_ai_toolkit.schemas import ArtifactManifest, ArtifactManifestItem
+def load_json_artifact(path: str | Path) -> Any:
+    """Read and parse a JSON artifact, decompressing it when needed."""
+
+    return decode_json_artifact(Path(path).read_bytes())
+
+_DEFAULT_TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+
+# One Jinja environment per (templates dir, bytecode cache dir) for the whole
+# process.  Jinja keeps compiled templates on the environment, so sharing it
+# means each template is parsed and compiled once per process rather than once
+# per ArtifactStore; the bytecode cache carries that work across processes.
+_TEMPLATE_ENVIRONMENTS: dict[tuple[str, str | None], Environment] = {}
+_TEMPLATE_ENVIRONMENTS_LOCK = threading.Lock()
+
+
+def template_environment(templates_dir: str | Path, bytecode_cache_dir: str | Path | None = None) -> Environment:
+    """
+    Return the process-wide Jinja environment for ``templates_dir``.
+
+    When ``bytecode_cache_dir`` is given, compiled template bytecode is
+    persisted there so a fresh process skips parsing and compilation too.
+    An unusable cache directory degrades to in-process caching only.
+    Templates edited on disk are still picked up (Jinja checks mtimes).
+    """
+
+    templates_path = Path(templates_dir).resolve()
+    cache_path = Path(bytecode_cache_dir).resolve() if bytecode_cache_dir is not None else None
+    key = (str(templates_path), str(cache_path) if cache_path is not None else None)
+    with _TEMPLATE_ENVIRONMENTS_LOCK:
+        environment = _TEMPLATE_ENVIRONMENTS.get(key)
+        if environment is None:
+            bytecode_cache = None
+            if cache_path is not None:
+                try:
+                    cache_path.mkdir(parents=True, exist_ok=True)
+                    bytecode_cache = FileSystemBytecodeCache(str(cache_path))
+                except OSError:
+                    bytecode_cache = None
+            environment = Environment(
+                loader=FileSystemLoader(str(templates_path)),
+                autoescape=False,
+                bytecode_cache=bytecode_cache,
+            )
+            _TEMPLATE_ENVIRONMENTS[key] = environment
+        return environment
 
 
 class ArtifactStore:
     """Utility for writing artifacts into output_dir/run_id."""
 
-    def __init__(self, output_dir: str | Path, run_id: str, templates_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        output_dir: str | Path,
+        run_id: str,
+        templates_dir: Path | None = None,
+        template_cache_dir: str | Path | None = None,
+        json_style: str = "pretty",
+        json_compression: str = "none",
+        profile: Literal["minimal", "standard", "full"] = "full",
+    ) -> None:
+        if profile not in ARTIFACT_PROFILES:
+            raise ValueError(f"unknown artifact profile {profile!r}; expected one of {tuple(ARTIFACT_PROFILES)}")
+        if json_style not in JSON_STYLES:
+            raise ValueError(f"unknown json_style {json_style!r}; expected one of {JSON_STYLES}")
+        if json_compression not in JSON_COMPRESSIONS:
+            raise ValueError(f"unknown json_compression {json_compression!r}; expected one of {JSON_COMPRESSIONS}")
+        if json_compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ValueError("json_compression 'zstd' requires the 'zstandard' package (trusted_ai_toolkit[zstd])")
+        self.profile = profile
+        self.skipped_outputs = ARTIFACT_PROFILES[profile]
+        self.json_style = json_style
+        self.json_compression = json_compression
         self.output_dir = Path(output_dir)
         self.run_id = run_id
         self.run_dir = self.output_dir / run_id
         self.run_dir.mkdir(parents=True, exist_ok=True)
 
         if templates_dir is None:
-            templates_dir = Path(__file__).resolve().parent / "templates"
+            templates_dir = _DEFAULT_TEMPLATES_DIR
 
         self.templates_dir = templates_dir
-        self.jinja_env = Environment(loader=FileSystemLoader(str(self.templates_dir)), autoescape=False)
+        self.jinja_env = template_environment(self.templates_dir, template_cache_dir)
+
+    @classmethod
+    def for_config(
+        cls,
+        config: ToolkitConfig,
+        run_id: str,
+        output_dir: str | Path | None = None,
+        apply_profile: bool = False,
+    ) -> ArtifactStore:
+        """
+        Build a store for ``run_id`` honouring the config's artifact policy.
+
+        The artifact profile is applied only when ``apply_profile`` is set, as
+        the prompt workflow does; standalone commands that were asked for a
+        specific artifact always produce it.
+        """
+
+        policy = config.artifact_policy
+        template_cache_dir = None
+        if policy.template_bytecode_cache:
+            # Dot-directories are never treated as run directories.
+            template_cache_dir = policy.template_cache_dir or Path(config.output_dir) / ".template_cache"
+        return cls(
+            output_dir if output_dir is not None else config.output_dir,
+            run_id,
+            template_cache_dir=template_cache_dir,
+            json_style=policy.json_style,
+            json_compression=policy.json_compression,
+            profile=policy.profile if apply_profile else "full",
+        )
+
+    def produces(self, name: str) -> bool:
+        """Return whether this store's artifact profile includes output ``name``."""
+
+        return name not in self.skipped_outputs
 
     def path_for(self, name: str) -> Path:
         """Return deterministic path in the active run directory."""
@@ -34,12 +236,17 @@ class ArtifactStore:
         return self.run_dir / name
 
     def write_json(self, name: str, payload: Any) -> Path:
-        """Write a JSON file artifact."""
+        """Write a JSON file artifact using the store's serialization policy."""
 
         path = self.path_for(name)
-        path.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+        path.write_bytes(encode_json_artifact(payload, self.json_style, self.json_compression))
         return path
 
+    def read_json(self, name: str) -> Any:
+        """Read a JSON artifact from the run directory, whatever policy wrote it."""
+
+        return load_json_artifact(self.path_for(name))
+
     def write_jsonl(self, name: str, rows: list[dict[str, Any]]) -> Path:
         """Write a JSONL file artifact."""
 
@@ -78,21 +285,41 @@ class ArtifactStore:
 
         return self.write_html(output_name, self.render_template(template_name, context))
 
-    def build_manifest(self, required_outputs: list[str], present_outputs: list[str] | None = None) -> ArtifactManifest:
-        """Build manifest for all files in run_dir with completeness metadata."""
+    def build_manifest(
+        self,
+        required_outputs: list[str],
+        present_outputs: list[str] | None = None,
+        previous: ArtifactManifest | None = None,
+    ) -> ArtifactManifest:
+        """Build manifest for all files in run_dir with completeness metadata.
+
+        When ``previous`` is given, files whose size and modification time are
+        unchanged keep their recorded digest, so only new or rewritten files
+        are hashed again.  That assumes a file is not rewritten with the same
+        size within one mtime tick; the outputs a refresh rewrites in place
+        (``scorecard.*``, ``artifact_manifest.*``) are always re-hashed.
+        """
 
+        known = {item.path: item for item in previous.items} if previous is not None else {}
         items: list[ArtifactManifestItem] = []
         for path in sorted(self.run_dir.glob("*")):
             if not path.is_file():
                 continue
-            digest = hashlib.sha256(path.read_bytes()).hexdigest()
             stat = path.stat()
+            modified_at = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+            prior = known.get(str(path))
+            if path.name.split(".", 1)[0] in _REWRITTEN_OUTPUT_STEMS:
+                prior = None
+            if prior is not None and prior.size_bytes == stat.st_size and prior.modified_at == modified_at:
+                items.append(prior)
+                continue
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
             items.append(
                 ArtifactManifestItem(
                     path=str(path),
                     sha256=digest,
                     size_bytes=stat.st_size,
-                    modified_at=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+                    modified_at=modified_at,
                 )
             )
         generated_names = {Path(item.path).name for item in items}
@@ -0,0 +1,986 @@
+"""SQLite-backed benchmark registry of per-run metric values."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import sqlite3
+import tempfile
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+# Suffixes that name the SQLite store directly; any other configured path
+# (the historical ``metric_registry.json``) is a JSON registry whose runs are
+# imported into a sibling ``.sqlite`` file.
+SQLITE_SUFFIXES = frozenset({".sqlite", ".sqlite3", ".db"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL UNIQUE,
+    project_name TEXT,
+    cohort_key TEXT,
+    risk_tier TEXT,
+    task TEXT,
+    model_name TEXT,
+    recorded_at TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_cohort ON runs (project_name, cohort_key, seq);
+CREATE TABLE IF NOT EXISTS run_metrics (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    metric_id TEXT NOT NULL,
+    value REAL,
+    threshold REAL,
+    passed INTEGER,
+    PRIMARY KEY (run_id, metric_id)
+);
+CREATE TABLE IF NOT EXISTS metric_stats (
+    project_name TEXT NOT NULL,
+    cohort_key TEXT NOT NULL,
+    metric_id TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    mean REAL NOT NULL,
+    m2 REAL NOT NULL,
+    PRIMARY KEY (project_name, cohort_key, metric_id)
+);
+CREATE TABLE IF NOT EXISTS baseline_windows (
+    project_name TEXT NOT NULL,
+    cohort_key TEXT NOT NULL,
+    baseline TEXT NOT NULL,
+    start_seq INTEGER,
+    start_time TEXT,
+    run_count INTEGER NOT NULL,
+    PRIMARY KEY (project_name, cohort_key, baseline)
+);
+CREATE TABLE IF NOT EXISTS window_stats (
+    project_name TEXT NOT NULL,
+    cohort_key TEXT NOT NULL,
+    baseline TEXT NOT NULL,
+    metric_id TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    mean REAL NOT NULL,
+    spread REAL NOT NULL,
+    PRIMARY KEY (project_name, cohort_key, baseline, metric_id)
+);
+CREATE TABLE IF NOT EXISTS ewma_contributions (
+    project_name TEXT NOT NULL,
+    cohort_key TEXT NOT NULL,
+    baseline TEXT NOT NULL,
+    metric_id TEXT NOT NULL,
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    value REAL NOT NULL,
+    prior_mean REAL NOT NULL,
+    prior_square REAL NOT NULL,
+    PRIMARY KEY (project_name, cohort_key, baseline, metric_id, run_id)
+);
+CREATE INDEX IF NOT EXISTS ewma_contributions_position
+    ON ewma_contributions (project_name, cohort_key, baseline, metric_id, position);
+CREATE TABLE IF NOT EXISTS registry_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_RUN_COLUMNS = ("run_id", "project_name", "cohort_key", "risk_tier", "task", "model_name", "recorded_at")
+
+
+def registry_store_path(path: str | Path) -> Path:
+    """Return the SQLite file backing the registry configured at ``path``."""
+
+    configured = Path(path)
+    if configured.suffix in SQLITE_SUFFIXES:
+        return configured
+    return configured.with_suffix(".sqlite")
+
+
+@dataclass(slots=True)
+class RunningStats:
+    """
+    Welford accumulator for one (cohort, metric) baseline.
+
+    ``m2`` is the running sum of squared deviations from the mean, so the
+    sample variance is ``m2 / (n - 1)``.  Values can be removed again, which
+    is how a re-recorded run replaces its previous contribution.
+    """
+
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float) -> None:
+        if self.n <= 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        previous_mean = self.mean
+        self.n -= 1
+        self.mean = (previous_mean * (self.n + 1) - value) / self.n
+        # Guard against a tiny negative residue from floating-point cancellation.
+        self.m2 = max(0.0, self.m2 - (value - previous_mean) * (value - self.mean))
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+
+@dataclass(slots=True)
+class EwmaStats:
+    """
+    Exponentially weighted mean and variance for one (cohort, metric) baseline.
+
+    Each new value moves the mean by ``alpha`` of its deviation, so a run's
+    weight decays by ``1 - alpha`` with every later run.  Mean and
+    ``variance + mean**2`` are weighted sums of the values, so one value can
+    be taken out exactly given the state before it was added; see
+    ``remove_contribution``.  Removing it from the stored baseline would
+    shift every later state, so deleting a run rebuilds from the registry.
+    """
+
+    alpha: float
+    n: int = 0
+    mean: float = 0.0
+    variance: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.n += 1
+        if self.n == 1:
+            self.mean, self.variance = value, 0.0
+            return
+        delta = value - self.mean
+        increment = self.alpha * delta
+        self.mean += increment
+        self.variance = (1.0 - self.alpha) * (self.variance + delta * increment)
+
+    def remove_contribution(
+        self,
+        value: float,
+        position: int,
+        prior_mean: float,
+        prior_square: float,
+        next_value: float | None = None,
+    ) -> None:
+        """
+        Drop the value that was added as the ``position``-th (1-based).
+
+        ``prior_mean``/``prior_square`` are the mean and ``variance + mean**2``
+        just before it was added.  Values after it keep their weights and
+        values before it regain one ``1 - alpha`` decay step, which reduces
+        to one correction term.  The first value's weight is shared with the
+        second, so removing it needs ``next_value``.
+        """
+
+        if self.n <= 1:
+            self.n, self.mean, self.variance = 0, 0.0, 0.0
+            return
+        square = self.variance + self.mean * self.mean
+        if position == 1:
+            if next_value is None:
+                raise ValueError("removing the first value needs the second value")
+            weight = (1.0 - self.alpha) ** (self.n - 1)
+            self.mean -= weight * (value - next_value)
+            square -= weight * (value * value - next_value * next_value)
+        else:
+            weight = self.alpha * (1.0 - self.alpha) ** (self.n - position)
+            self.mean -= weight * (value - prior_mean)
+            square -= weight * (value * value - prior_square)
+        self.n -= 1
+        self.variance = max(0.0, square - self.mean * self.mean) if self.n > 1 else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.variance) if self.n > 1 else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class BaselineWindow:
+    """
+    The part of a cohort's history a baseline covers.
+
+    ``all`` is every run; ``last_runs`` the newest ``runs`` runs; ``last_days``
+    the runs recorded within ``days`` of now; ``ewma`` every run, decayed by
+    ``alpha``.  ``key`` names the baseline's accumulators in the store.
+    """
+
+    mode: str = "all"
+    runs: int = 50
+    days: float = 30.0
+    alpha: float = 0.1
+
+    @property
+    def key(self) -> str:
+        if self.mode == "last_runs":
+            return f"last_runs:{self.runs}"
+        if self.mode == "last_days":
+            return f"last_days:{self.days:g}"
+        if self.mode == "ewma":
+            return f"ewma:{self.alpha:g}"
+        return "all"
+
+    @classmethod
+    def from_key(cls, key: str) -> BaselineWindow:
+        mode, _, parameter = key.partition(":")
+        if mode == "last_runs":
+            return cls(mode=mode, runs=int(parameter))
+        if mode == "last_days":
+            return cls(mode=mode, days=float(parameter))
+        if mode == "ewma":
+            return cls(mode=mode, alpha=float(parameter))
+        return cls()
+
+    def new_stats(self) -> RunningStats | EwmaStats:
+        return EwmaStats(alpha=self.alpha) if self.mode == "ewma" else RunningStats()
+
+
+@dataclass(slots=True)
+class _RecordedRun:
+    run_id: str
+    project_name: str
+    cohort_key: str
+    seq: int
+    recorded_at: str | None
+    values: dict[str, float]
+
+
+@dataclass(slots=True)
+class _WindowState:
+    start_seq: int | None = None
+    start_time: str | None = None
+    run_count: int = 0
+    stats: dict[str, RunningStats | EwmaStats] = field(default_factory=dict)
+    # EWMA only: (metric_id, run_id, position, value, prior_mean, prior_square)
+    # rows added since the state was loaded, and whether it was rebuilt.
+    contributions: list[tuple[str, str, int, float, float, float]] = field(default_factory=list)
+    rebuilt: bool = False
+
+
+def _in_time_window(run: _RecordedRun, state: _WindowState) -> bool:
+    return run.recorded_at is not None and state.start_time is not None and run.recorded_at >= state.start_time
+
+
+def _utc_iso(value: datetime) -> str:
+    """Normalise to a UTC ISO string so lexical order matches time order."""
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _recorded_at(value: Any) -> str | None:
+    if isinstance(value, datetime):
+        return _utc_iso(value)
+    if isinstance(value, str):
+        try:
+            return _utc_iso(datetime.fromisoformat(value))
+        except ValueError:
+            return None
+    return None
+
+
+@contextmanager
+def _transaction(connection: sqlite3.Connection, immediate: bool = True) -> Iterator[sqlite3.Connection]:
+    """
+    Run a block in one SQLite transaction.
+
+    Writers take the write lock up front (``BEGIN IMMEDIATE``) so their
+    read-modify-write of the running statistics cannot interleave with
+    another process; concurrent writers queue on the busy timeout instead of
+    losing updates.  Readers use a deferred transaction for a consistent
+    snapshot across their queries.
+    """
+
+    connection.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    try:
+        yield connection
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+def _numeric(value: Any) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+class BenchmarkRegistry:
+    """
+    Indexed store of the metric values each run contributed to its cohort.
+
+    Runs are keyed by ``run_id``: recording a run that is already present
+    replaces its metrics and moves it to the end of the registry, as the
+    JSON registry did.  Cohort lookups go through an index on
+    ``(project_name, cohort_key)``.  Each recorded value also updates a
+    ``RunningStats`` accumulator per (project, cohort, metric), so a cohort
+    baseline is read without touching the runs that built it.  Windowed and
+    decayed baselines (``BaselineWindow``) keep their own accumulators, built
+    from history the first time they are requested and then maintained as
+    runs are recorded, evicting runs as they leave the window.
+
+    Every write is a single transaction holding the database write lock,
+    so parallel ``tat`` processes and Databricks tasks sharing a registry
+    serialise their updates rather than overwriting each other.
+
+    When ``path`` is a JSON registry, the store is a sibling ``.sqlite`` file
+    and the JSON runs it does not hold yet are imported on first use (and
+    again whenever the JSON file changes, e.g. after pulling an updated
+    checked-in registry).  The JSON file itself is never rewritten; use
+    ``export_json`` to refresh it.
+
+    Args:
+        path: Configured ``benchmark_registry_path``.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.source_path = Path(path)
+        self.path = registry_store_path(path)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode: transactions are opened explicitly by ``_transaction``.
+        connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.executescript(_SCHEMA)
+        self._migrate_schema(connection)
+        if self._setup_pending(connection):
+            with _transaction(connection):
+                self._ensure_running_stats(connection)
+                self._import_json_source(connection)
+        return connection
+
+    def _migrate_schema(self, connection: sqlite3.Connection) -> None:
+        columns = {row["name"] for row in connection.execute("PRAGMA table_info(runs)")}
+        if "recorded_at" not in columns:
+            try:
+                connection.execute("ALTER TABLE runs ADD COLUMN recorded_at TEXT")
+            except sqlite3.OperationalError:
+                # Another process added the column first.
+                pass
+            # Runs recorded before timestamps existed are dated by the store's last write.
+            modified = datetime.fromtimestamp(self.path.stat().st_mtime, tz=timezone.utc)
+            connection.execute("UPDATE runs SET recorded_at = ? WHERE recorded_at IS NULL", (_utc_iso(modified),))
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS runs_cohort_time ON runs (project_name, cohort_key, recorded_at)"
+        )
+        if connection.execute("SELECT 1 FROM registry_meta WHERE key = 'ewma_contributions'").fetchone() is None:
+            # EWMA baselines stored before their contributions were kept are rebuilt on next request.
+            connection.execute("DELETE FROM window_stats WHERE baseline LIKE 'ewma:%'")
+            connection.execute("DELETE FROM baseline_windows WHERE baseline LIKE 'ewma:%'")
+            connection.execute("INSERT OR IGNORE INTO registry_meta (key, value) VALUES ('ewma_contributions', '1')")
+
+    def _json_signature(self) -> str | None:
+        if self.source_path == self.path or not self.source_path.is_file():
+            return None
+        stat = self.source_path.stat()
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def _setup_pending(self, connection: sqlite3.Connection) -> bool:
+        meta = dict(connection.execute("SELECT key, value FROM registry_meta").fetchall())
+        signature = self._json_signature()
+        return "running_stats" not in meta or (signature is not None and meta.get("json_source") != signature)
+
+    def _ensure_running_stats(self, connection: sqlite3.Connection) -> None:
+        # Stores written before the accumulators existed are backfilled once.
+        if connection.execute("SELECT 1 FROM registry_meta WHERE key = 'running_stats'").fetchone() is not None:
+            return
+        connection.execute("DELETE FROM metric_stats")
+        rows = connection.execute(
+            "SELECT runs.project_name, runs.cohort_key, run_metrics.metric_id, run_metrics.value "
+            "FROM runs JOIN run_metrics USING (run_id) ORDER BY runs.seq"
+        ).fetchall()
+        accumulators: dict[tuple[str, str, str], RunningStats] = {}
+        for row in rows:
+            if row["project_name"] is None or row["cohort_key"] is None or row["value"] is None:
+                continue
+            key = (row["project_name"], row["cohort_key"], row["metric_id"])
+            accumulators.setdefault(key, RunningStats()).add(row["value"])
+        for key, stats in accumulators.items():
+            self._store_stats(connection, key, stats)
+        connection.execute("INSERT INTO registry_meta (key, value) VALUES ('running_stats', '1')")
+
+    @staticmethod
+    def _load_stats(connection: sqlite3.Connection, key: tuple[str, str, str]) -> RunningStats:
+        row = connection.execute(
+            "SELECT n, mean, m2 FROM metric_stats WHERE project_name = ? AND cohort_key = ? AND metric_id = ?",
+            key,
+        ).fetchone()
+        return RunningStats(row["n"], row["mean"], row["m2"]) if row is not None else RunningStats()
+
+    @staticmethod
+    def _store_stats(connection: sqlite3.Connection, key: tuple[str, str, str], stats: RunningStats) -> None:
+        if stats.n == 0:
+            connection.execute(
+                "DELETE FROM metric_stats WHERE project_name = ? AND cohort_key = ? AND metric_id = ?",
+                key,
+            )
+            return
+        connection.execute(
+            "INSERT INTO metric_stats (project_name, cohort_key, metric_id, n, mean, m2) "
+            "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (project_name, cohort_key, metric_id) "
+            "DO UPDATE SET n = excluded.n, mean = excluded.mean, m2 = excluded.m2",
+            (*key, stats.n, stats.mean, stats.m2),
+        )
+
+    @staticmethod
+    def _cohort_runs(
+        connection: sqlite3.Connection,
+        project_name: str,
+        cohort_key: str,
+        condition: str = "",
+        params: tuple[Any, ...] = (),
+        order: str = "seq",
+        limit: int | None = None,
+    ) -> list[_RecordedRun]:
+        """Return the cohort runs matching ``condition`` with their metric values, oldest first."""
+
+        selection = (
+            f"SELECT run_id FROM runs WHERE project_name = ? AND cohort_key = ? {condition} ORDER BY {order}"
+            + (" LIMIT ?" if limit is not None else "")
+        )
+        rows = connection.execute(
+            "SELECT runs.run_id, runs.seq, runs.recorded_at, run_metrics.metric_id, run_metrics.value "
+            f"FROM runs LEFT JOIN run_metrics USING (run_id) WHERE runs.run_id IN ({selection}) ORDER BY runs.seq",
+            (project_name, cohort_key, *params, *(() if limit is None else (limit,))),
+        ).fetchall()
+        runs: dict[str, _RecordedRun] = {}
+        for row in rows:
+            run = runs.get(row["run_id"])
+            if run is None:
+                run = runs[row["run_id"]] = _RecordedRun(
+                    row["run_id"], project_name, cohort_key, row["seq"], row["recorded_at"], {}
+                )
+            if row["value"] is not None:
+                run.values[row["metric_id"]] = row["value"]
+        return list(runs.values())
+
+    def _recorded_run(self, connection: sqlite3.Connection, run_id: str) -> _RecordedRun | None:
+        row = connection.execute(
+            "SELECT project_name, cohort_key FROM runs WHERE run_id = ?",
+            (run_id,),
+        ).fetchone()
+        if row is None or row["project_name"] is None or row["cohort_key"] is None:
+            return None
+        found = self._cohort_runs(connection, row["project_name"], row["cohort_key"], "AND run_id = ?", (run_id,))
+        return found[0] if found else None
+
+    def _apply_run_stats(self, connection: sqlite3.Connection, run: _RecordedRun, remove: bool) -> None:
+        """Add (or remove) one recorded run's values to (from) its cohort accumulators."""
+
+        for metric_id, value in run.values.items():
+            key = (run.project_name, run.cohort_key, metric_id)
+            stats = self._load_stats(connection, key)
+            if remove:
+                stats.remove(value)
+            else:
+                stats.add(value)
+            self._store_stats(connection, key, stats)
+
+    @staticmethod
+    def _active_windows(
+        connection: sqlite3.Connection,
+        project_name: str,
+        cohort_key: str,
+    ) -> list[BaselineWindow]:
+        rows = connection.execute(
+            "SELECT baseline FROM baseline_windows WHERE project_name = ? AND cohort_key = ?",
+            (project_name, cohort_key),
+        ).fetchall()
+        return [BaselineWindow.from_key(row["baseline"]) for row in rows]
+
+    @staticmethod
+    def _load_window(
+        connection: sqlite3.Connection,
+        project_name: str,
+        cohort_key: str,
+        window: BaselineWindow,
+    ) -> _WindowState | None:
+        key = (project_name, cohort_key, window.key)
+        row = connection.execute(
+            "SELECT start_seq, start_time, run_count FROM baseline_windows "
+            "WHERE project_name = ? AND cohort_key = ? AND baseline = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+        state = _WindowState(row["start_seq"], row["start_time"], row["run_count"])
+        for stats_row in connection.execute(
+            "SELECT metric_id, n, mean, spread FROM window_stats "
+            "WHERE project_name = ? AND cohort_key = ? AND baseline = ?",
+            key,
+        ):
+            stats = window.new_stats()
+            stats.n, stats.mean = stats_row["n"], stats_row["mean"]
+            if isinstance(stats, EwmaStats):
+                stats.variance = stats_row["spread"]
+            else:
+                stats.m2 = stats_row["spread"]
+            state.stats[stats_row["metric_id"]] = stats
+        return state
+
+    @staticmethod
+    def _store_window(
+        connection: sqlite3.Connection,
+        project_name: str,
+        cohort_key: str,
+        window: BaselineWindow,
+        state: _WindowState,
+    ) -> None:
+        key = (project_name, cohort_key, window.key)
+        connection.execute(
+            "INSERT INTO baseline_windows (project_name, cohort_key, baseline, start_seq, start_time, run_count) "
+            "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (project_name, cohort_key, baseline) DO UPDATE SET "
+            "start_seq = excluded.start_seq, start_time = excluded.start_time, run_count = excluded.run_count",
+            (*key, state.start_seq, state.start_time, state.run_count),
+        )
+        connection.execute(
+            "DELETE FROM window_stats WHERE project_name = ? AND cohort_key = ? AND baseline = ?",
+            key,
+        )
+        connection.executemany(
+            "INSERT INTO window_stats (project_name, cohort_key, baseline, metric_id, n, mean, spread) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    *key,
+                    metric_id,
+                    stats.n,
+                    stats.mean,
+                    stats.variance if isinstance(stats, EwmaStats) else stats.m2,
+                )
+                for metric_id, stats in state.stats.items()
+                if stats.n > 0
+            ],
+        )
+        if state.rebuilt:
+            connection.execute(
+                "DELETE FROM ewma_contributions WHERE project_name = ? AND cohort_key = ? AND baseline = ?",
+                key,
+            )
+        connection.executemany(
+            "INSERT OR REPLACE INTO ewma_contributions (project_name, cohort_key, baseline, metric_id, run_id, "
+            "position, value, prior_mean, prior_square) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(*key, *contribution) for contribution in state.contributions],
+        )
+
+    @staticmethod
+    def _window_add_values(window: BaselineWindow, state: _WindowState, run: _RecordedRun) -> None:
+        for metric_id, value in run.values.items():
+            stats = state.stats.setdefault(metric_id, window.new_stats())
+            if isinstance(stats, EwmaStats):
+                # Kept so a read can exclude this run without replaying the history.
+                prior_square = stats.variance + stats.mean * stats.mean
+                state.contributions.append((metric_id, run.run_id, stats.n + 1, value, stats.mean, prior_square))
+            stats.add(value)
+        state.run_count += 1
+
+    @staticmethod
+    def _window_remove_values(state: _WindowState, run: _RecordedRun) -> None:
+        for metric_id, value in run.values.items():
+            stats = state.stats.get(metric_id)
+            if isinstance(stats, RunningStats):
+                stats.remove(value)
+        state.run_count -= 1
+
+    def _build_window(
+        self,
+        connection: sqlite3.Connection,
+        project_name: str,
+        cohort_key: str,
+        window: BaselineWindow,
+        now: datetime,
+        exclude_run_id: str | None = None,
+    ) -> _WindowState:
+        """Build a baseline from the cohort's history; the one-off path, not the per-run one."""
+
+        condition, params = ("AND run_id != ?", (exclude_run_id,)) if exclude_run_id is not None else ("", ())
+        state = _WindowState(rebuilt=True)
+        if window.mode == "last_runs":
+            runs = self._cohort_runs(
+                connection, project_name, cohort_key, condition, params, order="seq DESC", limit=window.runs
+            )
+            state.start_seq = runs[0].seq if runs else None
+        elif window.mode == "last_days":
+            state.start_time = _utc_iso(now - timedelta(days=window.days))
+            runs = self._cohort_runs(
+                connection,
+                project_name,
+                cohort_key,
+                f"{condition} AND recorded_at >= ?",
+                (*params, state.start_time),
+            )
+        else:
+            runs = self._cohort_runs(connection, project_name, cohort_key, condition, params)
+        for run in runs:
+            self._window_add_values(window, state, run)
+        return state
+
+    def _advance_window(
+        self,
+        connection: sqlite3.Connection,
+        window: BaselineWindow,
+        state: _WindowState,
+        project_name: str,
+        cohort_key: str,
+        now: datetime,
+    ) -> None:
+        """Evict runs that have aged out of a ``last_days`` window since it was last moved."""
+
+        cutoff = _utc_iso(now - timedelta(days=window.days))
+        if window.mode != "last_days" or state.start_time is None or cutoff <= state.start_time:
+            return
+        expired = self._cohort_runs(
+            connection,
+            project_name,
+            cohort_key,
+            "AND recorded_at >= ? AND recorded_at < ?",
+            (state.start_time, cutoff),
+        )
+        for run in expired:
+            self._window_remove_values(state, run)
+        state.start_time = cutoff
+
+    def _window_add(
+        self,
+        connection: sqlite3.Connection,
+        window: BaselineWindow,
+        state: _WindowState,
+        run: _RecordedRun,
+        now: datetime,
+    ) -> None:
+        if window.mode == "last_days":
+            self._advance_window(connection, window, state, run.project_name, run.cohort_key, now)
+            if _in_time_window(run, state):
+                self._window_add_values(window, state, run)
+            return
+        self._window_add_values(window, state, run)
+        if window.mode != "last_runs":
+            return
+        if state.start_seq is None:
+            state.start_seq = run.seq
+        while state.run_count > window.runs:
+            oldest = self._cohort_runs(
+                connection,
+                run.project_name,
+                run.cohort_key,
+                "AND seq >= ? AND run_id != ?",
+                (state.start_seq, run.run_id),
+                limit=1,
+            )
+            if not oldest:
+                break
+            self._window_remove_values(state, oldest[0])
+            state.start_seq = oldest[0].seq + 1
+
+    def _window_remove(
+        self,
+        connection: sqlite3.Connection,
+        window: BaselineWindow,
+        state: _WindowState,
+        run: _RecordedRun,
+    ) -> bool:
+        """Take ``run`` out of a baseline; returns False when the baseline must be rebuilt instead."""
+
+        if window.mode == "ewma":
+            return False
+        if window.mode == "last_days":
+            if _in_time_window(run, state):
+                self._window_remove_values(state, run)
+            return True
+        if state.start_seq is None or run.seq < state.start_seq:
+            return True
+        self._window_remove_values(state, run)
+        # The newest run before the window slides back in to keep it ``runs`` long.
+        previous = self._cohort_runs(
+            connection,
+            run.project_name,
+            run.cohort_key,
+            "AND seq < ? AND run_id != ?",
+            (state.start_seq, run.run_id),
+            order="seq DESC",
+            limit=1,
+        )
+        if previous:
+            self._window_add_values(window, state, previous[0])
+            state.start_seq = previous[0].seq
+        return True
+
+    @staticmethod
+    def _ewma_exclude(
+        connection: sqlite3.Connection,
+        window: BaselineWindow,
+        state: _WindowState,
+        run: _RecordedRun,
+    ) -> bool:
+        """Take ``run`` out of a copy of an EWMA baseline; False when its contributions are unknown."""
+
+        key = (run.project_name, run.cohort_key, window.key)
+        rows = connection.execute(
+            "SELECT metric_id, position, value, prior_mean, prior_square FROM ewma_contributions "
+            "WHERE project_name = ? AND cohort_key = ? AND baseline = ? AND run_id = ?",
+            (*key, run.run_id),
+        ).fetchall()
+        if {row["metric_id"] for row in rows} != set(run.values) & set(state.stats):
+            return False
+        for row in rows:
+            stats = state.stats[row["metric_id"]]
+            if not isinstance(stats, EwmaStats):
+                return False
+            next_value = None
+            if row["position"] == 1 and stats.n > 1:
+                following = connection.execute(
+                    "SELECT value FROM ewma_contributions WHERE project_name = ? AND cohort_key = ? "
+                    "AND baseline = ? AND metric_id = ? AND position = 2",
+                    (*key, row["metric_id"]),
+                ).fetchone()
+                if following is None:
+                    return False
+                next_value = following["value"]
+            stats.remove_contribution(
+                row["value"], row["position"], row["prior_mean"], row["prior_square"], next_value
+            )
+        state.run_count -= 1
+        return True
+
+    def _add_run(self, connection: sqlite3.Connection, run_id: str, now: datetime) -> None:
+        run = self._recorded_run(connection, run_id)
+        if run is None:
+            return
+        self._apply_run_stats(connection, run, remove=False)
+        for window in self._active_windows(connection, run.project_name, run.cohort_key):
+            state = self._load_window(connection, run.project_name, run.cohort_key, window)
+            if state is not None:
+                self._window_add(connection, window, state, run, now)
+                self._store_window(connection, run.project_name, run.cohort_key, window, state)
+
+    def _delete_run(self, connection: sqlite3.Connection, run_id: str, now: datetime) -> None:
+        run = self._recorded_run(connection, run_id)
+        if run is None:
+            connection.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            return
+        rebuild: list[BaselineWindow] = []
+        self._apply_run_stats(connection, run, remove=True)
+        for window in self._active_windows(connection, run.project_name, run.cohort_key):
+            state = self._load_window(connection, run.project_name, run.cohort_key, window)
+            if state is None:
+                continue
+            if self._window_remove(connection, window, state, run):
+                self._store_window(connection, run.project_name, run.cohort_key, window, state)
+            else:
+                rebuild.append(window)
+        connection.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+        for window in rebuild:
+            state = self._build_window(connection, run.project_name, run.cohort_key, window, now)
+            self._store_window(connection, run.project_name, run.cohort_key, window, state)
+
+    def _import_json_source(self, connection: sqlite3.Connection) -> None:
+        signature = self._json_signature()
+        if signature is None:
+            return
+        # Re-checked under the write lock: another process may have just imported it.
+        row = connection.execute("SELECT value FROM registry_meta WHERE key = 'json_source'").fetchone()
+        if row is not None and row["value"] == signature:
+            return
+        try:
+            payload = json.loads(self.source_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = {}
+        runs = payload.get("runs") if isinstance(payload, dict) else None
+        # JSON entries carry no timestamp; the file's modification time is the
+        # best available bound on when they were recorded.
+        modified = datetime.fromtimestamp(self.source_path.stat().st_mtime, tz=timezone.utc)
+        for entry in runs if isinstance(runs, list) else []:
+            if isinstance(entry, dict) and isinstance(entry.get("run_id"), str):
+                # Runs recorded since the last import are newer than the JSON copy.
+                exists = connection.execute("SELECT 1 FROM runs WHERE run_id = ?", (entry["run_id"],)).fetchone()
+                if exists is None:
+                    self._insert(connection, entry, modified)
+                    self._add_run(connection, entry["run_id"], modified)
+        connection.execute(
+            "INSERT INTO registry_meta (key, value) VALUES ('json_source', ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (signature,),
+        )
+
+    @staticmethod
+    def _insert(connection: sqlite3.Connection, entry: dict[str, Any], now: datetime) -> None:
+        row = {column: entry.get(column) for column in _RUN_COLUMNS}
+        row["recorded_at"] = _recorded_at(entry.get("recorded_at")) or _utc_iso(now)
+        placeholders = ", ".join(f":{column}" for column in _RUN_COLUMNS)
+        connection.execute(f"INSERT INTO runs ({', '.join(_RUN_COLUMNS)}) VALUES ({placeholders})", row)
+        metrics = entry.get("metrics")
+        rows = []
+        for metric_id, details in (metrics.items() if isinstance(metrics, dict) else []):
+            if not isinstance(metric_id, str) or not isinstance(details, dict):
+                continue
+            passed = details.get("passed")
+            rows.append(
+                (
+                    entry["run_id"],
+                    metric_id,
+                    _numeric(details.get("value")),
+                    _numeric(details.get("threshold")),
+                    None if passed is None else int(bool(passed)),
+                )
+            )
+        connection.executemany(
+            "INSERT INTO run_metrics (run_id, metric_id, value, threshold, passed) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def record_run(self, entry: dict[str, Any], now: datetime | None = None) -> Path:
+        """
+        Insert or replace the registry entry for ``entry["run_id"]``; returns the store path.
+
+        A run that is already recorded first has its old values removed from
+        the cohort accumulators, then the new values are added.  ``recorded_at``
+        defaults to ``now`` (the current time).
+        """
+
+        now = now or datetime.now(timezone.utc)
+        with closing(self._connect()) as connection, _transaction(connection):
+            self._delete_run(connection, entry["run_id"], now)
+            self._insert(connection, entry, now)
+            self._add_run(connection, entry["run_id"], now)
+        return self.path
+
+    def replace_all(self, runs: list[dict[str, Any]]) -> Path:
+        """Replace the whole registry with ``runs``, in order."""
+
+        now = datetime.now(timezone.utc)
+        with closing(self._connect()) as connection, _transaction(connection):
+            for table in ("runs", "metric_stats", "baseline_windows", "window_stats"):
+                connection.execute(f"DELETE FROM {table}")
+            for entry in runs:
+                if isinstance(entry, dict) and isinstance(entry.get("run_id"), str):
+                    self._delete_run(connection, entry["run_id"], now)
+                    self._insert(connection, entry, now)
+                    self._add_run(connection, entry["run_id"], now)
+        return self.path
+
+    def cohort_stats(
+        self,
+        project_name: str,
+        cohort_key: str,
+        exclude_run_id: str | None = None,
+        window: BaselineWindow | None = None,
+        now: datetime | None = None,
+    ) -> dict[str, RunningStats | EwmaStats]:
+        """
+        Return the running statistics per metric for one project cohort.
+
+        Reads one accumulator row per metric.  When ``exclude_run_id`` is
+        recorded in this cohort (a re-scored or refreshed run), its values
+        are removed from the returned copies so a run is never standardised
+        against itself.  ``window`` selects a windowed or decayed baseline
+        instead of the whole history.
+        """
+
+        if window is not None and window.mode != "all":
+            return self._window_stats(project_name, cohort_key, window, exclude_run_id, now)
+        with closing(self._connect()) as connection, _transaction(connection, immediate=False):
+            rows = connection.execute(
+                "SELECT metric_id, n, mean, m2 FROM metric_stats WHERE project_name = ? AND cohort_key = ?",
+                (project_name, cohort_key),
+            ).fetchall()
+            excluded = []
+            if exclude_run_id is not None:
+                excluded = connection.execute(
+                    "SELECT run_metrics.metric_id, run_metrics.value FROM runs JOIN run_metrics USING (run_id) "
+                    "WHERE runs.run_id = ? AND runs.project_name = ? AND runs.cohort_key = ? "
+                    "AND run_metrics.value IS NOT NULL",
+                    (exclude_run_id, project_name, cohort_key),
+                ).fetchall()
+        stats = {row["metric_id"]: RunningStats(row["n"], row["mean"], row["m2"]) for row in rows}
+        for row in excluded:
+            if row["metric_id"] in stats:
+                stats[row["metric_id"]].remove(row["value"])
+        return {metric_id: item for metric_id, item in stats.items() if item.n > 0}
+
+    def _window_stats(
+        self,
+        project_name: str,
+        cohort_key: str,
+        window: BaselineWindow,
+        exclude_run_id: str | None,
+        now: datetime | None,
+    ) -> dict[str, RunningStats | EwmaStats]:
+        now = now or datetime.now(timezone.utc)
+        with closing(self._connect()) as connection:
+            if self._load_window(connection, project_name, cohort_key, window) is None:
+                with _transaction(connection):
+                    # First request for this baseline: build it once, maintained from here on.
+                    if self._load_window(connection, project_name, cohort_key, window) is None:
+                        state = self._build_window(connection, project_name, cohort_key, window, now)
+                        self._store_window(connection, project_name, cohort_key, window, state)
+            with _transaction(connection, immediate=False):
+                state = self._load_window(connection, project_name, cohort_key, window) or _WindowState()
+                # Aged-out runs are dropped from this copy; the stored window moves on the next write.
+                self._advance_window(connection, window, state, project_name, cohort_key, now)
+                excluded = self._recorded_run(connection, exclude_run_id) if exclude_run_id is not None else None
+                if (
+                    excluded is not None
+                    and excluded.project_name == project_name
+                    and excluded.cohort_key == cohort_key
+                ):
+                    if window.mode == "ewma":
+                        # Reads never rescan: the run is subtracted using the state stored before it.
+                        removed = self._ewma_exclude(connection, window, state, excluded)
+                    else:
+                        removed = self._window_remove(connection, window, state, excluded)
+                    if not removed:
+                        state = self._build_window(
+                            connection, project_name, cohort_key, window, now, exclude_run_id=exclude_run_id
+                        )
+        return {metric_id: stats for metric_id, stats in state.stats.items() if stats.n > 0}
+
+    def runs(self) -> list[dict[str, Any]]:
+        """Return all runs in registry order, in the JSON registry's entry shape."""
+
+        with closing(self._connect()) as connection, _transaction(connection, immediate=False):
+            run_rows = connection.execute(f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs ORDER BY seq").fetchall()
+            metric_rows = connection.execute(
+                "SELECT run_id, metric_id, value, threshold, passed FROM run_metrics ORDER BY rowid"
+            ).fetchall()
+        metrics_by_run: dict[str, dict[str, Any]] = {}
+        for row in metric_rows:
+            metrics_by_run.setdefault(row["run_id"], {})[row["metric_id"]] = {
+                "value": row["value"],
+                "threshold": row["threshold"],
+                "passed": None if row["passed"] is None else bool(row["passed"]),
+            }
+        entries: list[dict[str, Any]] = []
+        for row in run_rows:
+            entry = {column: row[column] for column in _RUN_COLUMNS if row[column] is not None}
+            entry["metrics"] = metrics_by_run.get(row["run_id"], {})
+            entries.append(entry)
+        return entries
+
+    def export_json(self, path: str | Path | None = None) -> Path:
+        """Write the registry in the JSON registry format (defaults to the configured JSON path)."""
+
+        target = Path(path) if path is not None else self.source_path
+        if target.suffix in SQLITE_SUFFIXES:
+            raise ValueError(f"refusing to export the JSON registry over the SQLite store {target}")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Write beside the target and swap it in, so readers never see a partial file.
+        fd, temp_name = tempfile.mkstemp(prefix=f".{target.name}.", dir=target.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"runs": self.runs()}, handle, indent=2)
+            os.replace(temp_name, target)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        return target
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import json
-import math
 from pathlib import Path
 from typing import Any
 
+from trusted_ai_toolkit.benchmark_registry import BaselineWindow, BenchmarkRegistry
 from trusted_ai_toolkit.schemas import MetricResult, ToolkitConfig
 
 
@@ -25,46 +24,39 @@ def resolved_generation_model_name(config: ToolkitConfig) -> str:
     return "unknown_model"
 
 
-def _registry_path(path: str | Path) -> Path:
-    return Path(path)
+def load_registry(path: str | Path) -> dict[str, Any]:
+    """
+    Return the registry as ``{"runs": [...]}``, the shape of the former JSON file.
 
+    Compatibility shim over ``BenchmarkRegistry``; it materialises every run,
+    so scorecards use the indexed cohort queries instead.
+    """
 
-def load_registry(path: str | Path) -> dict[str, Any]:
-    registry_path = _registry_path(path)
-    if not registry_path.exists():
-        return {"runs": []}
-    payload = json.loads(registry_path.read_text(encoding="utf-8"))
-    if isinstance(payload, dict) and isinstance(payload.get("runs"), list):
-        return payload
-    return {"runs": []}
+    return {"runs": BenchmarkRegistry(path).runs()}
 
 
 def write_registry(path: str | Path, payload: dict[str, Any]) -> Path:
-    registry_path = _registry_path(path)
-    registry_path.parent.mkdir(parents=True, exist_ok=True)
-    registry_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    return registry_path
+    """Replace the registry contents with ``payload["runs"]``; returns the store path."""
 
+    runs = payload.get("runs") if isinstance(payload, dict) else None
+    return BenchmarkRegistry(path).replace_all(runs if isinstance(runs, list) else [])
 
-def update_registry(path: str | Path, project_name: str, run_id: str, metric_results: list[MetricResult]) -> Path:
-    registry = load_registry(path)
-    runs = [item for item in registry.get("runs", []) if isinstance(item, dict) and item.get("run_id") != run_id]
-    runs.append(
-        {
-            "project_name": project_name,
-            "run_id": run_id,
-            "metrics": {
-                metric.metric_id: {
-                    "value": metric.value,
-                    "threshold": metric.threshold,
-                    "passed": metric.passed,
-                }
-                for metric in metric_results
-            },
+
+def _metric_entries(metric_results: list[MetricResult]) -> dict[str, dict[str, Any]]:
+    return {
+        metric.metric_id: {
+            "value": metric.value,
+            "threshold": metric.threshold,
+            "passed": metric.passed,
         }
+        for metric in metric_results
+    }
+
+
+def update_registry(path: str | Path, project_name: str, run_id: str, metric_results: list[MetricResult]) -> Path:
+    return BenchmarkRegistry(path).record_run(
+        {"project_name": project_name, "run_id": run_id, "metrics": _metric_entries(metric_results)}
     )
-    registry["runs"] = runs
-    return write_registry(path, registry)
 
 
 def build_cohort_key(config: ToolkitConfig) -> str:
@@ -78,15 +70,27 @@ def build_cohort_key(config: ToolkitConfig) -> str:
     return f"{deployment_risk_tier}|{task}|{effective_model}"
 
 
+def baseline_window(config: ToolkitConfig) -> BaselineWindow:
+    """Return the cohort baseline window selected by ``config.eval.baseline``."""
+
+    baseline = config.eval.baseline
+    return BaselineWindow(
+        mode=baseline.mode,
+        runs=baseline.window_runs,
+        days=baseline.window_days,
+        alpha=baseline.ewma_alpha,
+    )
+
+
 def update_registry_for_config(
     path: str | Path,
     config: ToolkitConfig,
     run_id: str,
     metric_results: list[MetricResult],
 ) -> Path:
-    registry = load_registry(path)
-    runs = [item for item in registry.get("runs", []) if isinstance(item, dict) and item.get("run_id") != run_id]
-    runs.append(
+    """Upsert this run's metric values into its cohort; returns the registry store path."""
+
+    return BenchmarkRegistry(path).record_run(
         {
             "project_name": config.project_name,
             "cohort_key": build_cohort_key(config),
@@ -94,18 +98,9 @@ def update_registry_for_config(
             "task": config.model.task if config.model else None,
             "model_name": resolved_generation_model_name(config),
             "run_id": run_id,
-            "metrics": {
-                metric.metric_id: {
-                    "value": metric.value,
-                    "threshold": metric.threshold,
-                    "passed": metric.passed,
-                }
-                for metric in metric_results
-            },
+            "metrics": _metric_entries(metric_results),
         }
     )
-    registry["runs"] = runs
-    return write_registry(path, registry)
 
 
 def benchmark_distributions(
@@ -113,47 +108,38 @@ def benchmark_distributions(
     config: ToolkitConfig,
     current_run_id: str,
 ) -> dict[str, dict[str, float]]:
-    """Summarize historical metric distributions from prior registry entries."""
+    """
+    Summarize historical metric distributions from the cohort's running statistics.
 
-    registry = load_registry(registry_path)
-    values_by_metric: dict[str, list[float]] = {}
-    cohort_key = build_cohort_key(config)
-    for item in registry.get("runs", []):
-        if not isinstance(item, dict):
-            continue
-        if (
-            item.get("run_id") == current_run_id
-            or item.get("project_name") != config.project_name
-            or item.get("cohort_key") != cohort_key
-        ):
-            continue
-        metrics = item.get("metrics", {})
-        if not isinstance(metrics, dict):
-            continue
-        for metric_id, details in metrics.items():
-            if not isinstance(metric_id, str) or not isinstance(details, dict):
-                continue
-            value = details.get("value")
-            if isinstance(value, (int, float)):
-                values_by_metric.setdefault(metric_id, []).append(float(value))
+    The baseline covers the history selected by ``config.eval.baseline``
+    (all runs, a sliding window, or an exponentially decayed average).
+    """
 
+    cohort_stats = BenchmarkRegistry(registry_path).cohort_stats(
+        config.project_name,
+        build_cohort_key(config),
+        exclude_run_id=current_run_id,
+        window=baseline_window(config),
+    )
     distributions: dict[str, dict[str, float]] = {}
-    for metric_id, values in values_by_metric.items():
-        if len(values) < 2:
+    for metric_id, stats in cohort_stats.items():
+        if stats.n < 2:
             continue
-        mean = sum(values) / len(values)
-        variance = sum((value - mean) ** 2 for value in values) / (len(values) - 1)
-        std_dev = math.sqrt(variance)
         distributions[metric_id] = {
-            "n": float(len(values)),
-            "mean": round(mean, 6),
-            "std_dev": round(std_dev, 6),
+            "n": float(stats.n),
+            "mean": round(stats.mean, 6),
+            "std_dev": round(stats.std_dev, 6),
         }
     return distributions
 
 
 def metric_z_from_history(metric: MetricResult, distributions: dict[str, dict[str, float]]) -> float | None:
-    """Compute z-score from historical distributions when enough data exists."""
+    """
+    Compute z-score from historical distributions when enough data exists.
+
+    ``distributions`` come from ``benchmark_distributions``: one running
+    accumulator per metric, so this is a constant-time lookup.
+    """
 
     stats = distributions.get(metric.metric_id)
     if not stats:
@@ -0,0 +1,345 @@
+"""SQLite catalog of finished runs under an output directory."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from trusted_ai_toolkit.artifacts import load_json_artifact
+from trusted_ai_toolkit.schemas import RunCatalogEntry
+
+CATALOG_FILENAME = ".run_catalog.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    project_name TEXT,
+    cohort_key TEXT,
+    risk_tier TEXT,
+    answer_verdict TEXT,
+    overall_status TEXT,
+    go_no_go TEXT,
+    run_dir TEXT NOT NULL,
+    config_path TEXT,
+    started_at TEXT,
+    completed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_completed_at ON runs (completed_at);
+CREATE INDEX IF NOT EXISTS runs_cohort_key ON runs (cohort_key, completed_at);
+CREATE INDEX IF NOT EXISTS runs_answer_verdict ON runs (answer_verdict, completed_at);
+CREATE TABLE IF NOT EXISTS run_artifacts (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE INDEX IF NOT EXISTS run_artifacts_name ON run_artifacts (name);
+"""
+
+_RUN_COLUMNS = (
+    "run_id",
+    "project_name",
+    "cohort_key",
+    "risk_tier",
+    "answer_verdict",
+    "overall_status",
+    "go_no_go",
+    "run_dir",
+    "config_path",
+    "started_at",
+    "completed_at",
+)
+_REQUIRED_COLUMNS = frozenset({"run_id", "run_dir", "completed_at"})
+
+
+def _timestamp(value: datetime) -> str:
+    """Normalise to a UTC ISO string so lexical order matches time order."""
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+class RunCatalog:
+    """
+    Index of finished runs kept alongside the run directories.
+
+    Runs are recorded as they finish, so "latest run" and "latest run with
+    artifact X" are indexed lookups and ``tat runs list`` filters never walk
+    the output directory.  Output directories that predate the catalog can be
+    backfilled once with ``index_output_dir``.
+
+    Args:
+        path: SQLite database file; created with its schema on first use.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    @classmethod
+    def for_output_dir(cls, output_dir: str | Path) -> RunCatalog:
+        """Return the catalog stored in ``output_dir`` (a dot-file, never a run directory)."""
+
+        return cls(Path(output_dir) / CATALOG_FILENAME)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _connect(self, create_schema: bool = False) -> sqlite3.Connection:
+        # Only ``record_run`` creates the catalog; lookups open an existing
+        # file without running the DDL.
+        if create_schema:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30.0)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA foreign_keys = ON")
+        if create_schema:
+            connection.executescript(_SCHEMA)
+        return connection
+
+    def record_run(self, entry: RunCatalogEntry) -> None:
+        """
+        Insert or update the catalog row and artifact list for ``entry.run_id``.
+
+        Re-recording a run (``tat docs build`` on the latest run, ...) keeps
+        previously recorded values for any field the new entry leaves unset,
+        so a command without a scorecard does not erase the run's verdict.
+        """
+
+        row = entry.model_dump(mode="python", exclude={"artifacts"})
+        row["run_dir"] = str(entry.run_dir)
+        row["started_at"] = _timestamp(entry.started_at) if entry.started_at is not None else None
+        row["completed_at"] = _timestamp(entry.completed_at)
+        updates = ", ".join(
+            f"{column} = excluded.{column}"
+            if column in _REQUIRED_COLUMNS
+            else f"{column} = COALESCE(excluded.{column}, runs.{column})"
+            for column in _RUN_COLUMNS
+            if column != "run_id"
+        )
+        with closing(self._connect(create_schema=True)) as connection, connection:
+            connection.execute(
+                f"INSERT INTO runs ({', '.join(_RUN_COLUMNS)}) "
+                f"VALUES ({', '.join(f':{column}' for column in _RUN_COLUMNS)}) "
+                f"ON CONFLICT (run_id) DO UPDATE SET {updates}",
+                row,
+            )
+            connection.execute("DELETE FROM run_artifacts WHERE run_id = ?", (entry.run_id,))
+            connection.executemany(
+                "INSERT INTO run_artifacts (run_id, name) VALUES (?, ?)",
+                [(entry.run_id, name) for name in sorted(set(entry.artifacts))],
+            )
+
+    def update_outcomes(self, outcomes: list[dict[str, Any]]) -> None:
+        """Overwrite verdict, status and go/no-go for re-scored runs, leaving other columns as recorded."""
+
+        rows = [
+            (item["verdict"], item["overall_status"], item["go_no_go"], item["run_id"])
+            for item in outcomes
+            if item.get("error") is None
+        ]
+        if not rows or not self.exists():
+            return
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "UPDATE runs SET answer_verdict = ?, overall_status = ?, go_no_go = ? WHERE run_id = ?",
+                rows,
+            )
+
+    def get(self, run_id: str) -> RunCatalogEntry | None:
+        """Return the catalog entry for ``run_id``, if recorded."""
+
+        rows = self._query("WHERE run_id = ?", [run_id], limit=1)
+        return rows[0] if rows else None
+
+    def latest_run(self) -> RunCatalogEntry | None:
+        """Return the most recently completed run."""
+
+        rows = self._query("", [], limit=1)
+        return rows[0] if rows else None
+
+    def latest_artifact(self, filename: str) -> Path | None:
+        """
+        Return ``filename`` in the most recently completed run that still has it.
+
+        Runs are visited newest first and the first whose file exists on disk
+        wins, so a deleted run directory falls through to the next run.
+        """
+
+        if not self.exists():
+            return None
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT runs.run_dir FROM runs JOIN run_artifacts USING (run_id) "
+                "WHERE run_artifacts.name = ? ORDER BY runs.completed_at DESC, runs.run_id",
+                (filename,),
+            )
+            for row in rows:
+                path = Path(row["run_dir"]) / filename
+                if path.exists():
+                    return path
+        return None
+
+    def list_runs(
+        self,
+        verdict: str | None = None,
+        status: str | None = None,
+        cohort_key: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[RunCatalogEntry]:
+        """
+        Return runs newest first, filtered on indexed columns.
+
+        ``since`` is inclusive and ``until`` exclusive, both on completion time;
+        naive datetimes are taken as UTC.
+        """
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        if verdict is not None:
+            clauses.append("answer_verdict = ?")
+            params.append(verdict)
+        if status is not None:
+            clauses.append("overall_status = ?")
+            params.append(status)
+        if cohort_key is not None:
+            clauses.append("cohort_key = ?")
+            params.append(cohort_key)
+        if since is not None:
+            clauses.append("completed_at >= ?")
+            params.append(_timestamp(since))
+        if until is not None:
+            clauses.append("completed_at < ?")
+            params.append(_timestamp(until))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._query(where, params, limit=limit)
+
+    def _query(self, where: str, params: list[Any], limit: int | None) -> list[RunCatalogEntry]:
+        if not self.exists():
+            return []
+        sql = (
+            f"SELECT {', '.join(_RUN_COLUMNS)}, "
+            "(SELECT group_concat(name, char(31)) FROM run_artifacts WHERE run_artifacts.run_id = runs.run_id) "
+            f"AS artifact_names FROM runs {where} ORDER BY completed_at DESC, run_id"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = [*params, limit]
+        with closing(self._connect()) as connection:
+            rows = connection.execute(sql, params).fetchall()
+        entries: list[RunCatalogEntry] = []
+        for row in rows:
+            payload = {column: row[column] for column in _RUN_COLUMNS}
+            names = row["artifact_names"]
+            entries.append(RunCatalogEntry(**payload, artifacts=sorted(names.split("\x1f")) if names else []))
+        return entries
+
+
+def run_entry_from_dir(
+    run_dir: Path,
+    scorecard: dict[str, Any] | None = None,
+    cohort_key: str | None = None,
+    config_path: str | None = None,
+    started_at: datetime | None = None,
+    completed_at: datetime | None = None,
+) -> RunCatalogEntry:
+    """
+    Build a catalog entry for a run directory.
+
+    ``scorecard`` is the scorecard payload when the run produced one; runs
+    from standalone commands (``tat eval run``, ...) are catalogued without
+    a verdict so their artifacts remain discoverable.  ``completed_at``
+    defaults to the modification time of the run directory.
+    """
+
+    scorecard = scorecard or {}
+    artifacts = sorted(path.name for path in run_dir.iterdir() if path.is_file())
+    if completed_at is None:
+        completed_at = datetime.fromtimestamp(run_dir.stat().st_mtime, tz=timezone.utc)
+    return RunCatalogEntry(
+        run_id=run_dir.name,
+        project_name=scorecard.get("project_name"),
+        cohort_key=cohort_key,
+        risk_tier=scorecard.get("deployment_risk_tier") or scorecard.get("risk_tier"),
+        answer_verdict=scorecard.get("answer_verdict"),
+        overall_status=scorecard.get("overall_status"),
+        go_no_go=scorecard.get("go_no_go"),
+        run_dir=str(run_dir),
+        config_path=config_path,
+        started_at=started_at,
+        completed_at=completed_at,
+        artifacts=artifacts,
+    )
+
+
+def index_output_dir(output_dir: str | Path) -> int:
+    """
+    Backfill the catalog from run directories that have a ``scorecard.json``.
+
+    This is the one operation that walks ``output_dir``; run it once for
+    output directories created before the catalog existed.  Returns the
+    number of runs recorded.
+    """
+
+    root = Path(output_dir)
+    catalog = RunCatalog.for_output_dir(root)
+    count = 0
+    for run_dir in sorted(root.glob("*")):
+        scorecard_path = run_dir / "scorecard.json"
+        if run_dir.name.startswith(".") or not scorecard_path.is_file():
+            continue
+        try:
+            payload = load_json_artifact(scorecard_path)
+        except (OSError, ValueError):
+            continue
+        if not isinstance(payload, dict):
+            continue
+        benchmark = run_dir / "benchmark_summary.json"
+        cohort_key = None
+        if benchmark.is_file():
+            try:
+                cohort_key = load_json_artifact(benchmark).get("cohort_key")
+            except (OSError, ValueError, AttributeError):
+                cohort_key = None
+        completed_at = datetime.fromtimestamp(scorecard_path.stat().st_mtime, tz=timezone.utc)
+        catalog.record_run(run_entry_from_dir(run_dir, payload, cohort_key=cohort_key, completed_at=completed_at))
+        count += 1
+    return count
+
+
+def find_latest_artifact(output_dir: str | Path, filename: str) -> Path | None:
+    """
+    Return ``filename`` from the latest run that has it.
+
+    Answered from the run catalog when the output directory has one; older
+    output directories without a catalog fall back to scanning run
+    directories by modification time.
+    """
+
+    root = Path(output_dir)
+    catalog = RunCatalog.for_output_dir(root)
+    if catalog.exists():
+        return catalog.latest_artifact(filename)
+    candidates = list(root.glob(f"*/{filename}"))
+    if not candidates:
+        return None
+    return max(candidates, key=lambda p: p.stat().st_mtime)
+
+
+def latest_run_dir(output_dir: str | Path) -> Path | None:
+    """Return the latest finished run directory, from the catalog when available."""
+
+    root = Path(output_dir)
+    catalog = RunCatalog.for_output_dir(root)
+    if catalog.exists():
+        latest = catalog.latest_run()
+        if latest is not None and Path(latest.run_dir).is_dir():
+            return Path(latest.run_dir)
+    candidates = [p for p in root.glob("*") if p.is_dir() and not p.name.startswith(".")]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda p: p.stat().st_mtime)
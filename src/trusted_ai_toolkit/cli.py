@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 import json
 from pathlib import Path
 import random
@@ -13,18 +14,30 @@ import webbrowser
 import typer
 import yaml
 from rich.console import Console
+from rich.table import Table
 
 from tat.runtime import RunContext
-from trusted_ai_toolkit.artifacts import ArtifactStore
+from trusted_ai_toolkit.artifacts import ArtifactStore, load_json_artifact
+from trusted_ai_toolkit.benchmarking import build_cohort_key
+from trusted_ai_toolkit.catalog import RunCatalog, index_output_dir, latest_run_dir, run_entry_from_dir
 from trusted_ai_toolkit.config import load_config
-from trusted_ai_toolkit.documentation import build_documentation_artifacts
+from trusted_ai_toolkit.documentation import build_documentation_artifacts, refresh_artifact_manifest
 from trusted_ai_toolkit.eval.runner import compute_embedding_features, run_eval
 from trusted_ai_toolkit.incident import generate_incident_record, should_open_incident
-from trusted_ai_toolkit.model_client import ModelInvocationError, embed_texts, invoke_model, resolve_embedding_model_name
+from trusted_ai_toolkit.model_client import (
+    LLMBudget,
+    ModelInvocationError,
+    compose_model_prompt,
+    embed_texts,
+    invoke_model,
+    resolve_embedding_model_name,
+)
 from trusted_ai_toolkit.monitoring import TelemetryLogger, load_telemetry_events, summarize_telemetry
 from trusted_ai_toolkit.redteam.runner import run_redteam
-from trusted_ai_toolkit.reporting import generate_scorecard
-from trusted_ai_toolkit.schemas import MonitoringSummary, ToolkitConfig
+from trusted_ai_toolkit.reporting import generate_scorecard, refresh_scorecard_evidence
+from trusted_ai_toolkit.rescoring import rescore_runs
+from trusted_ai_toolkit.run_state import RunState
+from trusted_ai_toolkit.schemas import MonitoringSummary, Scorecard, ToolkitConfig
 from trusted_ai_toolkit.xai.lineage import generate_lineage_artifacts
 from trusted_ai_toolkit.xai.reasoning_report import generate_reasoning_report
 
@@ -36,6 +49,7 @@ run_app = typer.Typer(help="End-to-end orchestration commands")
 docs_app = typer.Typer(help="Documentation and artifact commands")
 monitor_app = typer.Typer(help="Monitoring commands")
 incident_app = typer.Typer(help="Incident commands")
+runs_app = typer.Typer(help="Run catalog commands")
 app.add_typer(eval_app, name="eval")
 app.add_typer(xai_app, name="xai")
 app.add_typer(redteam_app, name="redteam")
@@ -43,6 +57,7 @@ app.add_typer(run_app, name="run")
 app.add_typer(docs_app, name="docs")
 app.add_typer(monitor_app, name="monitor")
 app.add_typer(incident_app, name="incident")
+app.add_typer(runs_app, name="runs")
 
 console = Console()
 
@@ -55,8 +70,12 @@ def _build_run_context(config: ToolkitConfig, run_id: str) -> RunContext:
     return RunContext.from_system(config.system, run_id=run_id)
 
 
-def _build_store_and_telemetry(config: ToolkitConfig, run_context: RunContext) -> tuple[ArtifactStore, TelemetryLogger]:
-    store = ArtifactStore(config.output_dir, run_context.run_id)
+def _build_store_and_telemetry(
+    config: ToolkitConfig,
+    run_context: RunContext,
+    apply_profile: bool = False,
+) -> tuple[ArtifactStore, TelemetryLogger]:
+    store = ArtifactStore.for_config(config, run_context.run_id, apply_profile=apply_profile)
     telemetry_path = Path(config.output_dir) / run_context.run_id / config.monitoring.telemetry_path
     telemetry = TelemetryLogger(
         telemetry_path=telemetry_path,
@@ -68,17 +87,34 @@ def _build_store_and_telemetry(config: ToolkitConfig, run_context: RunContext) -
 
 
 def _latest_run_dir(output_dir: str | Path) -> Path | None:
-    root = Path(output_dir)
-    candidates = [p for p in root.glob("*") if p.is_dir()]
-    if not candidates:
-        return None
-    return max(candidates, key=lambda p: p.stat().st_mtime)
+    return latest_run_dir(output_dir)
+
+
+def _catalog_run(
+    config: ToolkitConfig,
+    store: ArtifactStore,
+    config_path: str | None = None,
+    scorecard: Scorecard | None = None,
+    started_at: datetime | None = None,
+) -> None:
+    """Record the run in the output directory's run catalog once a command has finished writing it."""
+
+    RunCatalog.for_output_dir(store.output_dir).record_run(
+        run_entry_from_dir(
+            store.run_dir,
+            scorecard.model_dump(mode="json") if scorecard is not None else None,
+            cohort_key=build_cohort_key(config),
+            config_path=str(Path(config_path).resolve()) if config_path else None,
+            started_at=started_at,
+            completed_at=datetime.now(timezone.utc),
+        )
+    )
 
 
 def _load_summary(path: Path) -> dict:
     if not path.exists():
         return {}
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = load_json_artifact(path)
     return payload if isinstance(payload, dict) else {}
 
 
@@ -86,25 +122,6 @@ def _artifact_system_context(run_context: RunContext) -> dict[str, str] | None:
     return run_context.system_context()
 
 
-def _compose_model_prompt(prompt: str, retrieved_contexts: list[dict]) -> str:
-    if not retrieved_contexts:
-        return prompt
-
-    sections = ["Use the retrieved context below when answering the user prompt.", ""]
-    for idx, item in enumerate(retrieved_contexts, start=1):
-        title = str(item.get("title") or item.get("source") or f"Context {idx}")
-        body = (
-            str(item.get("snippet") or item.get("text") or item.get("content") or "")
-            .strip()
-        )
-        sections.append(f"[Source {idx}] {title}")
-        if body:
-            sections.append(body)
-        sections.append("")
-    sections.append(f"User prompt: {prompt}")
-    return "\n".join(sections).strip()
-
-
 def _model_artifact_payload(
     invocation_mode: str,
     provider: str,
@@ -128,7 +145,7 @@ def _model_artifact_payload(
     return payload
 
 
-def _write_redteam_summary(store: ArtifactStore, findings: list[dict]) -> Path:
+def _redteam_summary(findings: list[dict]) -> dict[str, dict[str, int]]:
     severity_summary = {"low": 0, "medium": 0, "high": 0, "critical": 0}
     by_tag: dict[str, int] = {}
     for finding in findings:
@@ -137,7 +154,11 @@ def _write_redteam_summary(store: ArtifactStore, findings: list[dict]) -> Path:
             severity_summary[sev] += 1
         for tag in finding.get("tags", []):
             by_tag[tag] = by_tag.get(tag, 0) + 1
-    return store.write_json("redteam_summary.json", {"severity": severity_summary, "tags": by_tag})
+    return {"severity": severity_summary, "tags": by_tag}
+
+
+def _write_redteam_summary(store: ArtifactStore, findings: list[dict]) -> Path:
+    return store.write_json("redteam_summary.json", _redteam_summary(findings))
 
 
 def _write_embedding_trace(store: ArtifactStore, embedding_features: dict[str, object]) -> None:
@@ -379,23 +400,30 @@ def _monitoring_for_run(store: ArtifactStore) -> MonitoringSummary:
     return summary
 
 
-def _docs_for_run(config: ToolkitConfig, store: ArtifactStore) -> None:
-    build_documentation_artifacts(config, store)
-
+def _docs_for_run(config: ToolkitConfig, store: ArtifactStore, state: RunState | None = None) -> list[Path]:
+    return build_documentation_artifacts(config, store, state=state)
 
-def _incident_for_run(config: ToolkitConfig, store: ArtifactStore, monitoring: MonitoringSummary) -> bool:
-    scorecard_payload = _load_summary(store.path_for("scorecard.json"))
-    if not scorecard_payload:
-        return False
-    from trusted_ai_toolkit.schemas import Scorecard
 
-    scorecard = Scorecard.model_validate(scorecard_payload)
+def _incident_for_run(
+    config: ToolkitConfig,
+    store: ArtifactStore,
+    monitoring: MonitoringSummary,
+    state: RunState | None = None,
+) -> bool:
+    if state is not None and state.scorecard is not None:
+        scorecard = state.scorecard
+    else:
+        scorecard_payload = _load_summary(store.path_for("scorecard.json"))
+        if not scorecard_payload:
+            return False
+        scorecard = Scorecard.model_validate(scorecard_payload)
     should_open, trigger, severity = should_open_incident(scorecard, monitoring, config.redteam.severity_threshold)
     if not should_open:
         return False
     incident = generate_incident_record(store, scorecard, monitoring, trigger, severity)
     store.write_json("incident_report.json", incident.model_dump(mode="json"))
-    store.save_rendered_md("incident_template.md.j2", "incident_report.md", incident.model_dump(mode="json"))
+    if store.produces("incident_report.md"):
+        store.save_rendered_md("incident_template.md.j2", "incident_report.md", incident.model_dump(mode="json"))
     return True
 
 
@@ -410,8 +438,10 @@ def _run_prompt_workflow(
 ) -> Path:
     """Run the end-to-end prompt workflow and return the artifact directory."""
 
+    started_at = datetime.now(timezone.utc)
     run_context = _build_run_context(cfg, _resolve_run_id(cfg))
-    store, telemetry = _build_store_and_telemetry(cfg, run_context)
+    # The artifact profile decides which stages and renderings this run skips.
+    store, telemetry = _build_store_and_telemetry(cfg, run_context, apply_profile=True)
 
     context_payload = _load_context_payload(context_file)
     retrieved_contexts = context_payload.get("retrieved_contexts", [])
@@ -422,6 +452,12 @@ def _run_prompt_workflow(
     )
 
     telemetry.log_event("RUN_STARTED", "orchestration", {"config": config_path})
+    # One budget covers every advisory LLM stage in this run (judges and
+    # narrative) so a slow provider cannot stretch the run indefinitely.
+    llm_budget = LLMBudget.from_config(cfg)
+    # Later stages read earlier results from this state rather than re-loading
+    # the artifacts just written; the files remain the evidence pack.
+    state = RunState()
     prompt_bundle = {
         "project_name": cfg.project_name,
         "run_id": run_context.run_id,
@@ -440,13 +476,15 @@ def _run_prompt_workflow(
     if model_details:
         prompt_bundle["model_invocation"] = model_details
     store.write_json("prompt_run.json", prompt_bundle)
+    state.prompt_bundle = prompt_bundle
     telemetry.log_event("ARTIFACT_WRITTEN", "orchestration", {"artifact": "prompt_run.json"})
     if model_details:
         store.write_json("model_response.json", model_details)
         telemetry.log_event("ARTIFACT_WRITTEN", "orchestration", {"artifact": "model_response.json"})
     embedding_features = compute_embedding_features(cfg, prompt_bundle)
-    _write_embedding_trace(store, embedding_features)
-    telemetry.log_event("ARTIFACT_WRITTEN", "orchestration", {"artifact": "embedding_trace.json"})
+    if store.produces("embedding_trace.json"):
+        _write_embedding_trace(store, embedding_features)
+        telemetry.log_event("ARTIFACT_WRITTEN", "orchestration", {"artifact": "embedding_trace.json"})
 
     eval_results = run_eval(
         cfg,
@@ -455,6 +493,7 @@ def _run_prompt_workflow(
         config_path=Path(config_path),
         prompt_bundle=prompt_bundle,
         embedding_features=embedding_features,
+        budget=llm_budget,
     )
     store.write_json(
         "eval_results.json",
@@ -464,6 +503,7 @@ def _run_prompt_workflow(
             "results": [item.model_dump(mode="json") for item in eval_results],
         },
     )
+    state.eval_results = eval_results
     telemetry.log_event("ARTIFACT_WRITTEN", "eval", {"artifact": "eval_results.json"})
 
     findings = run_redteam(
@@ -484,37 +524,51 @@ def _run_prompt_workflow(
             "findings": finding_payload,
         },
     )
-    _write_redteam_summary(store, finding_payload)
+    state.findings = findings
+    state.redteam_summary = _redteam_summary(finding_payload)
+    store.write_json("redteam_summary.json", state.redteam_summary)
     telemetry.log_event("ARTIFACT_WRITTEN", "redteam", {"artifact": "redteam_findings.json"})
 
-    reasoning_md, reasoning_json = generate_reasoning_report(cfg, store)
-    telemetry.log_event("ARTIFACT_WRITTEN", "xai", {"artifact": str(reasoning_md)})
-    telemetry.log_event("ARTIFACT_WRITTEN", "xai", {"artifact": str(reasoning_json)})
-    lineage_md, lineage_json = generate_lineage_artifacts(store)
-    telemetry.log_event("ARTIFACT_WRITTEN", "xai", {"artifact": str(lineage_md)})
-    telemetry.log_event("ARTIFACT_WRITTEN", "xai", {"artifact": str(lineage_json)})
+    if store.produces("reasoning_report.json") or store.produces("reasoning_report.md"):
+        reasoning_md, reasoning_json = generate_reasoning_report(
+            cfg,
+            store,
+            budget=llm_budget,
+            embedding_features=embedding_features,
+            state=state,
+        )
+        telemetry.log_event("ARTIFACT_WRITTEN", "xai", {"artifact": str(reasoning_md)})
+        telemetry.log_event("ARTIFACT_WRITTEN", "xai", {"artifact": str(reasoning_json)})
+    if store.produces("lineage_report.md") or store.produces("authoritative_data_index.json"):
+        lineage_md, lineage_json = generate_lineage_artifacts(store, state=state)
+        telemetry.log_event("ARTIFACT_WRITTEN", "xai", {"artifact": str(lineage_md)})
+        telemetry.log_event("ARTIFACT_WRITTEN", "xai", {"artifact": str(lineage_json)})
 
     monitoring = _monitoring_for_run(store)
     telemetry.log_event("ARTIFACT_WRITTEN", "monitoring", {"artifact": "monitoring_summary.json"})
 
-    _docs_for_run(cfg, store)
-    telemetry.log_event("ARTIFACT_WRITTEN", "docs", {"artifact": "artifact_manifest.json"})
+    if _docs_for_run(cfg, store, state):
+        telemetry.log_event("ARTIFACT_WRITTEN", "docs", {"artifact": "artifact_manifest.json"})
 
-    scorecard = generate_scorecard(cfg, store)
-    telemetry.log_event("ARTIFACT_WRITTEN", "reporting", {"artifact": "scorecard.md"})
-    telemetry.log_event("ARTIFACT_WRITTEN", "reporting", {"artifact": "scorecard.html"})
+    scorecard = generate_scorecard(cfg, store, state=state)
+    for artifact in ("scorecard.md", "scorecard.html"):
+        if store.produces(artifact):
+            telemetry.log_event("ARTIFACT_WRITTEN", "reporting", {"artifact": artifact})
 
-    incident_opened = _incident_for_run(cfg, store, monitoring)
+    incident_opened = _incident_for_run(cfg, store, monitoring, state)
     if incident_opened:
-        telemetry.log_event("ARTIFACT_WRITTEN", "incident", {"artifact": "incident_report.md"})
-        # Refresh docs and scorecard only when incident artifacts changed completeness.
-        _docs_for_run(cfg, store)
-        scorecard = generate_scorecard(cfg, store)
+        incident_artifact = "incident_report.md" if store.produces("incident_report.md") else "incident_report.json"
+        telemetry.log_event("ARTIFACT_WRITTEN", "incident", {"artifact": incident_artifact})
+        # Incident artifacts only change evidence completeness: refresh the
+        # manifest and the completeness-driven scorecard fields in place.
+        refresh_artifact_manifest(cfg, store, state)
+        scorecard = refresh_scorecard_evidence(cfg, store, state)
     telemetry.log_event(
         "RUN_FINISHED",
         "orchestration",
         {"overall_status": scorecard.overall_status, "go_no_go": scorecard.go_no_go},
     )
+    _catalog_run(cfg, store, config_path, scorecard=scorecard, started_at=started_at)
     return store.run_dir
 
 
@@ -603,6 +657,7 @@ def eval_run(config: str = typer.Option(..., "--config", help="Path to toolkit c
     )
     telemetry.log_event("ARTIFACT_WRITTEN", "eval", {"artifact": "eval_results.json"})
     telemetry.log_event("RUN_FINISHED", "eval", {})
+    _catalog_run(cfg, store, config)
     console.print(f"Eval complete. Artifacts: {store.run_dir}")
 
 
@@ -622,6 +677,7 @@ def xai_reasoning_report(config: str = typer.Option(..., "--config", help="Path
     telemetry.log_event("ARTIFACT_WRITTEN", "xai", {"artifact": str(lineage_path)})
     telemetry.log_event("ARTIFACT_WRITTEN", "xai", {"artifact": str(index_path)})
     telemetry.log_event("RUN_FINISHED", "xai", {})
+    _catalog_run(cfg, store, config)
 
     console.print(f"Reasoning artifacts written under: {store.run_dir}")
 
@@ -648,6 +704,7 @@ def redteam_run(config: str = typer.Option(..., "--config", help="Path to toolki
     _write_redteam_summary(store, finding_payload)
     telemetry.log_event("ARTIFACT_WRITTEN", "redteam", {"artifact": "redteam_findings.json"})
     telemetry.log_event("RUN_FINISHED", "redteam", {})
+    _catalog_run(cfg, store, config)
     console.print(f"Red-team complete. Findings written under: {store.run_dir}")
 
 
@@ -664,6 +721,7 @@ def report(config: str = typer.Option(..., "--config", help="Path to toolkit con
     telemetry.log_event("ARTIFACT_WRITTEN", "reporting", {"artifact": "scorecard.md"})
     telemetry.log_event("ARTIFACT_WRITTEN", "reporting", {"artifact": "scorecard.html"})
     telemetry.log_event("RUN_FINISHED", "reporting", {"overall_status": scorecard.overall_status})
+    _catalog_run(cfg, store, config, scorecard=scorecard)
 
     console.print(f"Scorecard written under: {store.run_dir}")
 
@@ -684,6 +742,7 @@ def docs_build(config: str = typer.Option(..., "--config", help="Path to toolkit
     telemetry.log_event("ARTIFACT_WRITTEN", "docs", {"artifact": "system_card.md"})
     telemetry.log_event("ARTIFACT_WRITTEN", "docs", {"artifact": "artifact_manifest.json"})
     telemetry.log_event("RUN_FINISHED", "docs", {})
+    _catalog_run(cfg, store, config)
     console.print(f"Documentation artifacts built for run: {latest.name}")
 
 
@@ -702,6 +761,7 @@ def monitor_summarize(config: str = typer.Option(..., "--config", help="Path to
     summary = _monitoring_for_run(store)
     telemetry.log_event("ARTIFACT_WRITTEN", "monitoring", {"artifact": "monitoring_summary.json"})
     telemetry.log_event("RUN_FINISHED", "monitoring", {"total_events": summary.total_events})
+    _catalog_run(cfg, store, config)
     console.print(f"Monitoring summary generated for run: {latest.name}")
 
 
@@ -727,6 +787,7 @@ def incident_generate(config: str = typer.Option(..., "--config", help="Path to
     opened = _incident_for_run(cfg, store, monitoring)
     telemetry.log_event("ARTIFACT_WRITTEN", "incident", {"artifact": "incident_report.md", "opened": opened})
     telemetry.log_event("RUN_FINISHED", "incident", {"opened": opened})
+    _catalog_run(cfg, store, config)
     console.print(f"Incident generation complete for run: {latest.name} | opened={opened}")
 
 
@@ -799,7 +860,7 @@ def run_simulate(
     )
     retrieved_contexts = _load_retrieved_contexts(context_file)
 
-    model_prompt = _compose_model_prompt(prompt, retrieved_contexts)
+    model_prompt = compose_model_prompt(prompt, retrieved_contexts)
     try:
         invocation = invoke_model(model_prompt, cfg)
     except ModelInvocationError as exc:
@@ -905,7 +966,7 @@ def run_benchmark_matrix(
         )
         prompt = _prompt_from_context_payload(context_payload, f"Summarize the {tier} risk governance posture")
         prompt, scenario_family = _benchmark_prompt_variant(prompt, tier, scenario_index, tier_counts[tier])
-        model_prompt = _compose_model_prompt(prompt, context_payload.get("retrieved_contexts", []))
+        model_prompt = compose_model_prompt(prompt, context_payload.get("retrieved_contexts", []))
         try:
             invocation = invoke_model(model_prompt, cfg)
         except ModelInvocationError as exc:
@@ -1007,6 +1068,101 @@ def demo(
     console.print(f"Demo complete. Scorecard: {scorecard_html}")
 
 
+@runs_app.command("list")
+def runs_list(
+    config: str = typer.Option(..., "--config", help="Path to toolkit config YAML"),
+    verdict: Optional[str] = typer.Option(None, "--verdict", help="Only runs with this answer verdict."),
+    status: Optional[str] = typer.Option(None, "--status", help="Only runs with this overall status."),
+    cohort: Optional[str] = typer.Option(None, "--cohort", help="Only runs in this benchmark cohort key."),
+    since: Optional[datetime] = typer.Option(None, "--since", help="Completed at or after this time (UTC)."),
+    until: Optional[datetime] = typer.Option(None, "--until", help="Completed before this time (UTC)."),
+    limit: int = typer.Option(50, "--limit", min=1, help="Maximum number of runs to list."),
+    as_json: bool = typer.Option(False, "--json", help="Print catalog entries as JSON."),
+) -> None:
+    """List catalogued runs, newest first, without scanning the output directory."""
+
+    cfg = load_config(config)
+    entries = RunCatalog.for_output_dir(cfg.output_dir).list_runs(
+        verdict=verdict,
+        status=status,
+        cohort_key=cohort,
+        since=since,
+        until=until,
+        limit=limit,
+    )
+    if as_json:
+        typer.echo(json.dumps([entry.model_dump(mode="json") for entry in entries], indent=2))
+        return
+    if not entries:
+        console.print("No catalogued runs match. Use `tat runs index` to catalogue existing run directories.")
+        return
+    table = Table("run_id", "completed_at", "verdict", "status", "go/no-go", "cohort")
+    for entry in entries:
+        table.add_row(
+            entry.run_id,
+            entry.completed_at.isoformat(timespec="seconds"),
+            entry.answer_verdict or "-",
+            entry.overall_status or "-",
+            entry.go_no_go or "-",
+            entry.cohort_key or "-",
+        )
+    console.print(table)
+
+
+@runs_app.command("index")
+def runs_index(config: str = typer.Option(..., "--config", help="Path to toolkit config YAML")) -> None:
+    """Catalogue existing run directories that have a scorecard (one-time backfill)."""
+
+    cfg = load_config(config)
+    count = index_output_dir(cfg.output_dir)
+    console.print(f"Catalogued {count} run(s) under: {cfg.output_dir}")
+
+
+@app.command("rescore")
+def rescore(
+    config: str = typer.Option(..., "--config", help="Path to toolkit config YAML"),
+    verdict: Optional[str] = typer.Option(None, "--verdict", help="Only re-score runs with this answer verdict."),
+    cohort: Optional[str] = typer.Option(None, "--cohort", help="Only re-score runs in this benchmark cohort key."),
+    since: Optional[datetime] = typer.Option(None, "--since", help="Completed at or after this time (UTC)."),
+    until: Optional[datetime] = typer.Option(None, "--until", help="Completed before this time (UTC)."),
+    limit: Optional[int] = typer.Option(None, "--limit", min=1, help="Maximum number of runs to re-score."),
+    workers: Optional[int] = typer.Option(None, "--workers", min=1, help="Worker processes. Defaults to CPU count."),
+    render: bool = typer.Option(False, "--render", help="Also re-render scorecard.md and scorecard.html."),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Compute verdict transitions without writing scorecards."),
+    summary_path: Optional[str] = typer.Option(
+        None,
+        "--summary-path",
+        help="Where to write the transition summary. Defaults to <output_dir>/rescore_summary.json.",
+    ),
+) -> None:
+    """Recompute scorecards for catalogued runs from their stored eval and red-team artifacts."""
+
+    cfg = load_config(config)
+    catalog = RunCatalog.for_output_dir(cfg.output_dir)
+    entries = catalog.list_runs(verdict=verdict, cohort_key=cohort, since=since, until=until, limit=limit)
+    summary = rescore_runs(
+        entries,
+        default_config_path=str(Path(config).resolve()),
+        workers=workers,
+        render=render,
+        write=not dry_run,
+    )
+    if not dry_run:
+        catalog.update_outcomes(summary["changed"])
+    target = Path(summary_path) if summary_path else Path(cfg.output_dir) / "rescore_summary.json"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+    console.print(
+        f"Re-scored {summary['runs_rescored']}/{summary['runs_considered']} run(s); "
+        f"{len(summary['changed'])} changed, {len(summary['failed'])} failed, "
+        f"{len(summary['skipped'])} never scored."
+    )
+    for transition, count in summary["verdict_transitions"].items():
+        console.print(f"  {transition}: {count}")
+    console.print(f"Summary written to: {target}")
+
+
 def main() -> None:
     """Console entrypoint for installation script."""
 
@@ -17,6 +17,7 @@ from pathlib import Path
 import tempfile
 from typing import Any
 
+from trusted_ai_toolkit.artifacts import load_json_artifact
 from trusted_ai_toolkit.cli import _apply_adapter_overrides, _run_prompt_workflow
 from trusted_ai_toolkit.config import load_config
 from trusted_ai_toolkit.schemas import ToolkitConfig
@@ -271,7 +272,7 @@ def _write_context_payload(prompt_bundle: dict[str, Any]) -> str:
 def _load_json(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = load_json_artifact(path)
     return payload if isinstance(payload, dict) else {}
 
 
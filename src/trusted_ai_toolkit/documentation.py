@@ -2,18 +2,18 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
-from trusted_ai_toolkit.artifacts import ArtifactStore
+from trusted_ai_toolkit.artifacts import ArtifactStore, load_json_artifact, required_outputs_for
+from trusted_ai_toolkit.run_state import RunState
 from trusted_ai_toolkit.schemas import ToolkitConfig
 
 
 def _load_json_if_exists(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = load_json_artifact(path)
     return payload if isinstance(payload, dict) else {}
 
 
@@ -56,61 +56,84 @@ def _build_dynamic_data_context(config: ToolkitConfig, prompt_bundle: dict[str,
     return base
 
 
-def build_documentation_artifacts(config: ToolkitConfig, store: ArtifactStore) -> list[Path]:
+def build_documentation_artifacts(
+    config: ToolkitConfig,
+    store: ArtifactStore,
+    state: RunState | None = None,
+) -> list[Path]:
     """Generate governance card artifacts and artifact manifest outputs."""
 
-    prompt_bundle = _load_json_if_exists(store.path_for("prompt_run.json"))
-
-    paths: list[Path] = []
-    paths.append(
-        store.save_rendered_md(
-            "system_card.md.j2",
-            "system_card.md",
-            {
-                "project_name": config.project_name,
-                "risk_tier": config.risk_tier,
-                "model": _build_dynamic_model_context(config, prompt_bundle),
-                "prompt": prompt_bundle.get("prompt", "N/A"),
-            },
-        )
-    )
-    paths.append(
-        store.save_rendered_md(
-            "data_card.md.j2",
-            "data_card.md",
-            {
-                "data": _build_dynamic_data_context(config, prompt_bundle),
-                "project_name": config.project_name,
-            },
-        )
-    )
-    paths.append(
-        store.save_rendered_md(
-            "model_card.md.j2",
-            "model_card.md",
-            {
-                "model": _build_dynamic_model_context(config, prompt_bundle),
-                "project_name": config.project_name,
-                "adapter": config.adapters.model_dump(mode="json"),
-            },
-        )
-    )
+    if state is not None and state.prompt_bundle is not None:
+        prompt_bundle = state.prompt_bundle
+    else:
+        prompt_bundle = _load_json_if_exists(store.path_for("prompt_run.json"))
+
+    model_context = _build_dynamic_model_context(config, prompt_bundle)
+    cards = {
+        "system_card.md": {
+            "project_name": config.project_name,
+            "risk_tier": config.risk_tier,
+            "model": model_context,
+            "prompt": prompt_bundle.get("prompt", "N/A"),
+        },
+        "data_card.md": {
+            "data": _build_dynamic_data_context(config, prompt_bundle),
+            "project_name": config.project_name,
+        },
+        "model_card.md": {
+            "model": model_context,
+            "project_name": config.project_name,
+            "adapter": config.adapters.model_dump(mode="json"),
+        },
+    }
+    paths = [
+        store.save_rendered_md(f"{name}.j2", name, context)
+        for name, context in cards.items()
+        if store.produces(name)
+    ]
+    paths.extend(_write_artifact_manifest(config, store, state))
+    return paths
+
+
+def refresh_artifact_manifest(config: ToolkitConfig, store: ArtifactStore, state: RunState) -> list[Path]:
+    """
+    Refresh the artifact manifest after files were added to an already documented run.
 
-    required = config.artifact_policy.required_outputs_by_risk_tier.get(config.risk_tier, [])
-    manifest_path = store.write_manifest(required)
-    paths.append(manifest_path)
-
-    manifest_payload = _load_json_if_exists(manifest_path)
-    paths.append(
-        store.save_rendered_md(
-            "artifact_manifest.md.j2",
-            "artifact_manifest.md",
-            {
-                "run_id": store.run_id,
-                "completeness": manifest_payload.get("completeness", 0),
-                "required_outputs": manifest_payload.get("required_outputs", []),
-                "items": manifest_payload.get("items", []),
-            },
-        )
+    The system, data and model cards depend only on the config and prompt
+    bundle, so they are left as written.  The manifest is rebuilt from the
+    one held in ``state``, hashing only new or rewritten files.
+    """
+
+    if state.manifest is None:
+        return build_documentation_artifacts(config, store, state=state)
+    return _write_artifact_manifest(config, store, state)
+
+
+def _write_artifact_manifest(config: ToolkitConfig, store: ArtifactStore, state: RunState | None) -> list[Path]:
+    if not store.produces("artifact_manifest.json"):
+        return []
+    required = required_outputs_for(config, store)
+    # Count the manifest as present for completeness even though the file is being written now.
+    manifest = store.build_manifest(
+        required,
+        present_outputs=["artifact_manifest.json"],
+        previous=state.manifest if state is not None else None,
     )
-    return paths
+    manifest_payload = manifest.model_dump(mode="json")
+    manifest_path = store.write_json("artifact_manifest.json", manifest_payload)
+    if state is not None:
+        state.manifest = manifest
+    if not store.produces("artifact_manifest.md"):
+        return [manifest_path]
+
+    markdown_path = store.save_rendered_md(
+        "artifact_manifest.md.j2",
+        "artifact_manifest.md",
+        {
+            "run_id": store.run_id,
+            "completeness": manifest_payload.get("completeness", 0),
+            "required_outputs": manifest_payload.get("required_outputs", []),
+            "items": manifest_payload.get("items", []),
+        },
+    )
+    return [manifest_path, markdown_path]
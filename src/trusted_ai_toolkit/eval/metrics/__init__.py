@@ -6,7 +6,7 @@ import math
 import re
 from collections import Counter
 from random import Random
-from typing import Callable
+from typing import Any, Callable, TypedDict
 
 from trusted_ai_toolkit.schemas import MetricResult
 
@@ -59,12 +59,14 @@ def _tokenize(text: str) -> list[str]:
     return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in _STOPWORDS]
 
 
-def _context_texts(context: dict) -> list[str]:
+def _indexed_context_texts(context: dict[str, Any]) -> list[tuple[int, str]]:
+    """Merged text of each usable retrieved context with its list position."""
+
     items = context.get("retrieved_contexts", [])
-    texts: list[str] = []
+    texts: list[tuple[int, str]] = []
     if not isinstance(items, list):
         return texts
-    for item in items:
+    for index, item in enumerate(items):
         if not isinstance(item, dict):
             continue
         parts = [
@@ -75,10 +77,14 @@ def _context_texts(context: dict) -> list[str]:
         ]
         merged = " ".join(part.strip() for part in parts if part and part.strip())
         if merged:
-            texts.append(merged)
+            texts.append((index, merged))
     return texts
 
 
+def _context_texts(context: dict) -> list[str]:
+    return [text for _, text in _indexed_context_texts(context)]
+
+
 def _safe_div(numerator: float, denominator: float) -> float:
     if denominator == 0:
         return 0.0
@@ -101,27 +107,34 @@ def _claim_units(text: str) -> list[str]:
     return claims
 
 
-def _claim_best_support(claim: str, contexts: list[str]) -> tuple[float, str]:
-    """Return the best lexical evidence match for a claim.
+# A claim counts as supported by a context when their TF-IDF cosine reaches
+# this threshold or they share at least this many content tokens.
+_CLAIM_SUPPORT_THRESHOLD = 0.22
+_CLAIM_SUPPORT_MIN_OVERLAP = 3
+
 
-    We use the highest TF-IDF cosine match across retrieved contexts as a
-    simple, explainable support signal for the claim-level trust card.
+def _claim_support_matrix(claims: list[str], contexts: list[str]) -> list[dict[int, float]]:
+    """Return the TF-IDF support score of every claim against every context.
+
+    Row ``i`` maps context index to the TF-IDF cosine between claim ``i`` and
+    that context, with IDF taken over the corpus ``[claim, *contexts]`` so
+    each claim is scored as if in its own retrieval corpus; zero entries are
+    omitted.  See ``_ClaimEvidenceIndex`` for how it is computed.
     """
 
-    if not contexts:
-        return 0.0, ""
-    docs = [claim, *contexts]
-    vectors = _tfidf_vectors(docs)
-    claim_vector = vectors[0] if vectors else {}
+    return _ClaimEvidenceIndex(claims, contexts).support_matrix()
+
+
+def _best_from_row(row: dict[int, float]) -> tuple[float, int]:
+    """Best (score, context index) in a support row; first index wins ties."""
+
     best_idx = -1
     best_score = 0.0
-    for idx, context_vector in enumerate(vectors[1:]):
-        score = _sparse_cosine(claim_vector, context_vector)
-        if score > best_score:
-            best_score = score
+    for idx in sorted(row):
+        if row[idx] > best_score:
+            best_score = row[idx]
             best_idx = idx
-    best_context = contexts[best_idx] if best_idx >= 0 else ""
-    return best_score, best_context
+    return best_score, best_idx
 
 
 def _negation_polarity(text: str) -> int:
@@ -174,71 +187,206 @@ def _best_evidence_span(claim: str, matched_context: str) -> str:
     return sentences[best_idx]
 
 
-def _claim_analysis(output_text: str, contexts: list[str]) -> dict[str, object]:
-    """Classify each extracted claim as supported, unsupported, or contradicted.
+class _ClaimAnalysis(TypedDict):
+    """Per-claim rows and support counts produced by ``_claim_analysis``."""
 
-    Support is based on a permissive lexical threshold because we want the
-    trust card to catch obviously unsupported claims without requiring a second
-    verifier model. Contradiction detection is currently a polarity mismatch
-    heuristic and should be treated as a first-pass signal, not a final NLI
-    judgment.
+    claims: list[dict[str, object]]
+    supported_count: int
+    unsupported_count: int
+    contradicted_count: int
+    claim_count: int
+
+
+class _ClaimEvidenceIndex:
+    """Claims x contexts support structure that can be re-scored under ablation.
+
+    Claims and contexts are tokenised once; contexts go into an inverted
+    index, so a claim only touches the postings of its own tokens and the
+    whole matrix costs O(claim tokens x postings) instead of one full TF-IDF
+    rebuild per claim.  Under claim ``i`` a context's squared norm is its
+    claim-free norm plus a correction for the tokens it shares with the
+    claim, and the TF normalisation cancels in the cosine.
+
+    ``removed`` drops context columns.  Removing a context changes the corpus
+    size and document frequencies, hence every IDF weight, so the remaining
+    columns are re-weighted from the stored counts (no re-tokenisation) and
+    the result equals scoring the reduced context list from scratch.  The
+    contradiction check depends only on a (claim, context) pair and is
+    memoised across ablations.
     """
 
-    claims = _claim_units(output_text)
-    if not claims:
-        return {
-            "claims": [],
-            "supported_count": 0,
-            "unsupported_count": 0,
-            "contradicted_count": 0,
-            "claim_count": 0,
+    def __init__(self, claims: list[str], contexts: list[str]) -> None:
+        self.claims = claims
+        self.contexts = contexts
+        self.claim_counts = [Counter(_tokenize(claim)) for claim in claims]
+        self.context_counts = [Counter(_tokenize(text)) for text in contexts]
+        self.context_lengths = [sum(counts.values()) for counts in self.context_counts]
+        self.document_frequency: Counter[str] = Counter()
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+        for index, counts in enumerate(self.context_counts):
+            self.document_frequency.update(counts.keys())
+            for token, count in counts.items():
+                self.postings.setdefault(token, []).append((index, count))
+        self._contradiction: dict[tuple[int, int], bool] = {}
+
+    def support_matrix(self, removed: frozenset[int] = frozenset()) -> list[dict[int, float]]:
+        """Support rows with the ``removed`` context indices left out."""
+
+        active = [index for index in range(len(self.contexts)) if index not in removed]
+        if not active:
+            return [{} for _ in self.claims]
+
+        document_frequency = self.document_frequency
+        if removed:
+            document_frequency = document_frequency.copy()
+            for index in removed:
+                document_frequency.subtract(self.context_counts[index].keys())
+        doc_count = len(active) + 1
+
+        def _idf(df: int) -> float:
+            return math.log((1 + doc_count) / (1 + df)) + 1.0
+
+        base_square = {
+            index: sum(
+                (count * _idf(document_frequency[token])) ** 2
+                for token, count in self.context_counts[index].items()
+            )
+            for index in active
         }
 
-    rows: list[dict[str, object]] = []
-    supported = 0
-    unsupported = 0
-    contradicted = 0
-    for claim in claims:
-        support_score, matched_context = _claim_best_support(claim, contexts)
-        claim_tokens = set(_tokenize(claim))
-        context_tokens = set(_tokenize(matched_context))
-        overlap = len(claim_tokens.intersection(context_tokens))
-        support_label = "unsupported"
-        contradicted_flag = False
-        # A claim is treated as supported when it has either a decent lexical
-        # match or a small set of overlapping evidence terms. This keeps the
-        # method simple and inspectable, while still allowing paraphrases.
-        if support_score >= 0.22 or overlap >= 3:
-            support_label = "supported"
-            supported += 1
+        rows: list[dict[int, float]] = []
+        for claim_counts in self.claim_counts:
+            claim_square = 0.0
+            dot: dict[int, float] = {}
+            correction: dict[int, float] = {}
+            for token, claim_count in claim_counts.items():
+                df = document_frequency.get(token, 0)
+                idf = _idf(df + 1)
+                claim_square += (claim_count * idf) ** 2
+                if df <= 0:
+                    continue
+                idf_squared = idf * idf
+                idf_delta = idf_squared - _idf(df) ** 2
+                for index, count in self.postings[token]:
+                    if index in removed:
+                        continue
+                    dot[index] = dot.get(index, 0.0) + claim_count * count * idf_squared
+                    correction[index] = correction.get(index, 0.0) + count * count * idf_delta
+            row: dict[int, float] = {}
+            for index, value in dot.items():
+                norm = math.sqrt(claim_square) * math.sqrt(base_square[index] + correction[index])
+                if norm > 0:
+                    row[index] = value / norm
+            rows.append(row)
+        return rows
+
+    def _contradicts(self, claim_index: int, context_index: int) -> bool:
+        key = (claim_index, context_index)
+        if key not in self._contradiction:
+            claim = self.claims[claim_index]
             # Localise the polarity check to the best-matching sentence in
             # the chunk; comparing against the whole chunk over-fires on
             # negation tokens that belong to unrelated sentences (very
             # common in policy / legal / governance evidence).
-            evidence_span = _best_evidence_span(claim, matched_context) if matched_context else ""
-            if evidence_span and _negation_polarity(claim) != _negation_polarity(evidence_span):
-                contradicted += 1
-                contradicted_flag = True
-                support_label = "contradicted"
-        else:
-            unsupported += 1
-        rows.append(
-            {
-                "claim": claim,
-                "support_score": round(support_score, 3),
-                "matched_context": matched_context[:240],
-                "status": support_label,
-                "contradicted": contradicted_flag,
-            }
-        )
+            evidence_span = _best_evidence_span(claim, self.contexts[context_index])
+            self._contradiction[key] = bool(evidence_span) and (
+                _negation_polarity(claim) != _negation_polarity(evidence_span)
+            )
+        return self._contradiction[key]
+
+    def analysis(self, removed: frozenset[int] = frozenset()) -> _ClaimAnalysis:
+        """``_claim_analysis`` result with the ``removed`` contexts left out."""
+
+        rows: list[dict[str, object]] = []
+        supported = 0
+        unsupported = 0
+        contradicted = 0
+        for claim_index, row in enumerate(self.support_matrix(removed)):
+            claim = self.claims[claim_index]
+            support_score, best_idx = _best_from_row(row)
+            matched_context = self.contexts[best_idx] if best_idx >= 0 else ""
+            overlap = (
+                len(self.claim_counts[claim_index].keys() & self.context_counts[best_idx].keys())
+                if best_idx >= 0
+                else 0
+            )
+            support_label = "unsupported"
+            contradicted_flag = False
+            # A claim is treated as supported when it has either a decent lexical
+            # match or a small set of overlapping evidence terms. This keeps the
+            # method simple and inspectable, while still allowing paraphrases.
+            if support_score >= _CLAIM_SUPPORT_THRESHOLD or overlap >= _CLAIM_SUPPORT_MIN_OVERLAP:
+                support_label = "supported"
+                supported += 1
+                if matched_context and self._contradicts(claim_index, best_idx):
+                    contradicted += 1
+                    contradicted_flag = True
+                    support_label = "contradicted"
+            else:
+                unsupported += 1
+            rows.append(
+                {
+                    "claim": claim,
+                    "support_score": round(support_score, 3),
+                    "matched_context": matched_context[:240],
+                    "status": support_label,
+                    "contradicted": contradicted_flag,
+                }
+            )
 
-    return {
-        "claims": rows,
-        "supported_count": supported,
-        "unsupported_count": unsupported,
-        "contradicted_count": contradicted,
-        "claim_count": len(claims),
-    }
+        return {
+            "claims": rows,
+            "supported_count": supported,
+            "unsupported_count": unsupported,
+            "contradicted_count": contradicted,
+            "claim_count": len(self.claims),
+        }
+
+    def grounding_rates(self, removed: frozenset[int] = frozenset()) -> dict[str, float]:
+        """Claim-level grounding metric values with ``removed`` contexts left out.
+
+        Values match ``claim_support_rate``, ``unsupported_claim_rate``,
+        ``contradiction_rate`` and ``evidence_sufficiency_score`` computed on
+        the reduced context list.
+        """
+
+        analysis = self.analysis(removed)
+        claim_count = analysis["claim_count"]
+        lengths = [length for index, length in enumerate(self.context_lengths) if index not in removed]
+        avg_context_tokens = _safe_div(sum(lengths), len(lengths)) if lengths else 0.0
+        support_rate = _safe_div(analysis["supported_count"], claim_count) if claim_count else 0.0
+        return {
+            "claim_support_rate": round(support_rate, 3),
+            "unsupported_claim_rate": round(
+                _safe_div(analysis["unsupported_count"], claim_count) if claim_count else 0.0, 3
+            ),
+            "contradiction_rate": round(
+                _safe_div(analysis["contradicted_count"], claim_count) if claim_count else 0.0, 3
+            ),
+            "evidence_sufficiency_score": _evidence_sufficiency(support_rate, avg_context_tokens, len(lengths)),
+        }
+
+
+def _evidence_sufficiency(support_rate: float, avg_context_tokens: float, context_count: int) -> float:
+    context_depth = min(avg_context_tokens / 40.0, 1.0)
+    context_count_component = min(context_count / 3.0, 1.0)
+    # Evidence sufficiency blends: how much of the answer is actually supported,
+    # whether the provided contexts are substantive enough, and whether there
+    # are multiple sources to ground against.
+    return round(0.5 * support_rate + 0.3 * context_depth + 0.2 * context_count_component, 3)
+
+
+def _claim_analysis(output_text: str, contexts: list[str]) -> _ClaimAnalysis:
+    """Classify each extracted claim as supported, unsupported, or contradicted.
+
+    Support is based on a permissive lexical threshold because we want the
+    trust card to catch obviously unsupported claims without requiring a second
+    verifier model. Contradiction detection is currently a polarity mismatch
+    heuristic and should be treated as a first-pass signal, not a final NLI
+    judgment.
+    """
+
+    return _ClaimEvidenceIndex(_claim_units(output_text), contexts).analysis()
 
 
 def _bias_signals(output_text: str) -> dict[str, object]:
@@ -566,12 +714,7 @@ def metric_evidence_sufficiency_score(context: dict) -> MetricResult:
     claim_count = int(analysis["claim_count"])
     avg_context_tokens = _safe_div(sum(len(_tokenize(text)) for text in contexts), len(contexts)) if contexts else 0.0
     support_rate = _safe_div(int(analysis["supported_count"]), claim_count) if claim_count else 0.0
-    context_depth = min(avg_context_tokens / 40.0, 1.0)
-    context_count_component = min(len(contexts) / 3.0, 1.0)
-    # Evidence sufficiency blends: how much of the answer is actually supported,
-    # whether the provided contexts are substantive enough, and whether there
-    # are multiple sources to ground against.
-    value = round(0.5 * support_rate + 0.3 * context_depth + 0.2 * context_count_component, 3)
+    value = _evidence_sufficiency(support_rate, avg_context_tokens, len(contexts))
     return MetricResult(
         metric_id="evidence_sufficiency_score",
         value=value,
@@ -23,6 +23,14 @@ Design properties
   judge over the same inputs do not pay duplicate API calls.  The cache
   is per-process; for cross-run reproducibility the determinism flag is
   the load-bearing guarantee.
+* **Adaptive claim sampling.**  With ``eval.llm_judge.sampling ==
+  "adaptive"`` claims are graded in a seeded random order and grading
+  stops once the 95% Wilson interval on the rate is narrower than
+  ``eval.llm_judge.ci_width``.  Long answers then cost a bounded number
+  of calls while the reported interval states the sampling uncertainty.
+* **Run budget.**  ``run_eval`` passes the run-scoped ``LLMBudget`` in
+  ``context["llm_budget"]``.  Once it is spent the judges stop grading and
+  report ``reason="budget_exhausted"`` instead of waiting on the provider.
 * **Tiny single-token responses.**  Each claim-level call asks for a
   single ``YES`` or ``NO`` token, parsed by inspecting the first
   alphabetic character of the response.  This keeps cost negligible
@@ -31,11 +39,18 @@ Design properties
 
 from __future__ import annotations
 
+import math
 import re
+from random import Random
 from typing import Any
 
 from trusted_ai_toolkit.eval.metrics import _claim_analysis, _context_texts
-from trusted_ai_toolkit.model_client import invoke_model_safely
+from trusted_ai_toolkit.model_client import (
+    BUDGET_EXHAUSTED_REASON,
+    BudgetRefusal,
+    LLMBudget,
+    invoke_model_safely,
+)
 from trusted_ai_toolkit.schemas import MetricResult, ToolkitConfig
 
 # Word-boundary scan for the first standalone yes / no token in the
@@ -46,6 +61,10 @@ from trusted_ai_toolkit.schemas import MetricResult, ToolkitConfig
 # answering the question.
 _YES_NO_PATTERN = re.compile(r"\b(yes|no)\b", re.IGNORECASE)
 
+# Normal quantile for the 95% Wilson score interval reported by both
+# sampling modes.
+_WILSON_Z: float = 1.96
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Per-process verdict cache
 # ─────────────────────────────────────────────────────────────────────────────
@@ -74,21 +93,45 @@ def _parse_yes_no(text: str) -> str:
     return match.group(1).lower()
 
 
-def _llm_unavailable_result(metric_id: str, reason: str) -> MetricResult:
+def _llm_unavailable_result(
+    metric_id: str,
+    reason: str,
+    budget: LLMBudget | None = None,
+) -> MetricResult:
+    details: dict[str, Any] = {
+        "method": "llm_judge",
+        "data_basis": "llm_unavailable",
+        "reason": reason,
+        "strength": "advisory",
+    }
+    if budget is not None:
+        details["budget"] = budget.snapshot()
     return MetricResult(
         metric_id=metric_id,
         value=None,
         threshold=None,
         passed=None,
-        details={
-            "method": "llm_judge",
-            "data_basis": "llm_unavailable",
-            "reason": reason,
-            "strength": "advisory",
-        },
+        details=details,
     )
 
 
+def _wilson_interval(successes: int, trials: int, z: float = _WILSON_Z) -> tuple[float, float]:
+    """Return the Wilson score interval for a binomial rate.
+
+    Preferred over the normal approximation because it stays inside [0, 1]
+    and behaves sensibly at rates of exactly 0 or 1, which are the common
+    case for judge metrics on well-grounded answers.
+    """
+
+    if trials <= 0:
+        return 0.0, 1.0
+    rate = successes / trials
+    denominator = 1.0 + z * z / trials
+    centre = (rate + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(rate * (1.0 - rate) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
 def _grade_claim(
     metric_id: str,
     config: ToolkitConfig,
@@ -96,12 +139,19 @@ def _grade_claim(
     claim: str,
     evidence: str,
     instruction: str,
-) -> str:
-    """Cached single-claim YES/NO grading helper."""
+    budget: LLMBudget | None = None,
+) -> str | None:
+    """Cached single-claim YES/NO grading helper.
+
+    Returns None when the run budget refused the call; that outcome is not
+    cached so a later run with a fresh budget grades the claim normally.
+    """
 
     key = (metric_id, model_label, claim.strip(), evidence.strip())
     if key in _LLM_JUDGE_CACHE:
         return _LLM_JUDGE_CACHE[key]
+    if budget is not None and budget.exhausted():
+        return None
 
     prompt = (
         f"{instruction}\n\n"
@@ -109,7 +159,9 @@ def _grade_claim(
         f"EVIDENCE:\n{evidence.strip()}\n\n"
         f"Respond with exactly one word: YES or NO."
     )
-    result = invoke_model_safely(prompt, config, deterministic=True)
+    result = invoke_model_safely(prompt, config, deterministic=True, budget=budget)
+    if isinstance(result, BudgetRefusal):
+        return None
     if result is None:
         verdict = "unknown"
     else:
@@ -139,10 +191,15 @@ def _judge_each_claim(
 
     Iterates the deterministically extracted claims, asks the LLM whether
     each one satisfies the instruction against its best-matched evidence,
-    and returns ``count(target_label) / total_claims`` as the metric value.
+    and returns ``count(target_label) / judged_claims`` as the metric value.
+    In adaptive mode only a seeded random prefix of the claims is judged;
+    ``details["sampling"]`` records the method and the 95% interval.
     """
 
     config = context.get("toolkit_config")
+    budget = context.get("llm_budget")
+    if not isinstance(budget, LLMBudget):
+        budget = None
     if not isinstance(config, ToolkitConfig):
         return _llm_unavailable_result(
             metric_id, "toolkit_config not present in metric context"
@@ -152,6 +209,9 @@ def _judge_each_claim(
             metric_id, "adapters.provider is 'stub'; no live LLM is configured"
         )
 
+    if budget is not None and budget.exhausted():
+        return _llm_unavailable_result(metric_id, BUDGET_EXHAUSTED_REASON, budget)
+
     output_text = str(context.get("model_output", ""))
     contexts = _context_texts(context)
     analysis = _claim_analysis(output_text, contexts)
@@ -160,33 +220,69 @@ def _judge_each_claim(
         return _llm_unavailable_result(metric_id, "no extractable claims in model output")
 
     model_label = _resolve_model_label(config)
+    sampling = config.eval.llm_judge
+
+    # Exhaustive mode grades claims in extraction order.  Adaptive mode
+    # shuffles with a fixed seed so the subset that gets graded — and
+    # therefore the metric value — is reproducible across runs.
+    order = list(range(len(claim_rows)))
+    adaptive = sampling.sampling == "adaptive"
+    if adaptive:
+        Random(sampling.seed).shuffle(order)
 
     judgments: list[dict[str, Any]] = []
     target_count = 0
     unknown_count = 0
-    for row in claim_rows:
+    judged_count = 0
+    budget_exhausted = False
+    for position in order:
+        row = claim_rows[position]
         if not isinstance(row, dict):
             continue
         claim = str(row.get("claim", ""))
         evidence = str(row.get("matched_context", ""))
         if not claim or not evidence:
+            judged_count += 1
             unknown_count += 1
             judgments.append({"claim": claim, "verdict": "unknown", "reason": "missing claim or evidence"})
-            continue
-        verdict = _grade_claim(metric_id, config, model_label, claim, evidence, instruction)
-        if verdict == target_label:
-            target_count += 1
-        elif verdict == "unknown":
-            unknown_count += 1
-        judgments.append({"claim": claim[:200], "verdict": verdict})
+        else:
+            verdict = _grade_claim(metric_id, config, model_label, claim, evidence, instruction, budget)
+            if verdict is None:
+                budget_exhausted = True
+                break
+            judged_count += 1
+            if verdict == target_label:
+                target_count += 1
+            elif verdict == "unknown":
+                unknown_count += 1
+            judgments.append({"claim": claim[:200], "verdict": verdict})
+
+        if adaptive and judged_count >= sampling.min_claims:
+            low, high = _wilson_interval(target_count, judged_count)
+            if high - low <= sampling.ci_width:
+                break
 
     total_claims = len(claim_rows)
     # Deterministic baseline: if the LLM could not grade any claim, surface
     # the metric as unavailable rather than reporting a misleading 0.
-    if unknown_count == total_claims:
+    if judged_count == 0 or unknown_count == judged_count:
+        if budget_exhausted:
+            return _llm_unavailable_result(metric_id, BUDGET_EXHAUSTED_REASON, budget)
         return _llm_unavailable_result(metric_id, "LLM did not grade any claim")
 
-    value = round(target_count / total_claims, 3)
+    # Exhaustive mode grades claims in extraction order, so the prefix judged
+    # before the budget ran out is not a random sample of the answer and its
+    # rate would be biased.  Only the seeded shuffle of adaptive mode makes a
+    # partial grading an estimate of the whole.
+    if budget_exhausted and not adaptive:
+        result = _llm_unavailable_result(metric_id, BUDGET_EXHAUSTED_REASON, budget)
+        result.details.update({"claim_count": len(claim_rows), "judged_count": judged_count})
+        return result
+
+    # The rate is estimated over the claims actually judged; in exhaustive
+    # mode that is every claim, so the value matches the historical formula.
+    value = round(target_count / judged_count, 3)
+    low, high = _wilson_interval(target_count, judged_count)
     return MetricResult(
         metric_id=metric_id,
         value=value,
@@ -196,9 +292,18 @@ def _judge_each_claim(
             "method": "llm_judge",
             "model": model_label,
             "claim_count": total_claims,
+            "judged_count": judged_count,
             f"{target_label}_count": target_count,
             "unknown_count": unknown_count,
             "judgments": judgments,
+            "sampling": {
+                "method": "adaptive_wilson" if adaptive else "exhaustive",
+                "ci_95": [round(low, 3), round(high, 3)],
+                "target_ci_width": sampling.ci_width if adaptive else None,
+                "stopped_early": judged_count < total_claims,
+                "seed": sampling.seed if adaptive else None,
+                "budget_exhausted": budget_exhausted,
+            },
             "strength": "advisory",
             "data_basis": "llm_judged",
         },
@@ -6,14 +6,19 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-import json
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from trusted_ai_toolkit.eval.metrics import METRICS_REGISTRY
-from trusted_ai_toolkit.model_client import ModelInvocationError, embed_texts, resolve_embedding_model_name
+from trusted_ai_toolkit.artifacts import load_json_artifact
+from trusted_ai_toolkit.eval.metrics import METRICS_REGISTRY, _indexed_context_texts
+from trusted_ai_toolkit.model_client import (
+    LLMBudget,
+    ModelInvocationError,
+    embed_texts,
+    resolve_embedding_model_name,
+)
 from trusted_ai_toolkit.monitoring import TelemetryLogger
 from trusted_ai_toolkit.schemas import EvalResult, MetricResult, ToolkitConfig
 
@@ -73,31 +78,18 @@ def _load_prompt_bundle(output_dir: str, run_id: str) -> dict[str, Any]:
     path = Path(output_dir) / run_id / "prompt_run.json"
     if not path.exists():
         return {}
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = load_json_artifact(path)
     return payload if isinstance(payload, dict) else {}
 
 
 def compute_embedding_features(config: ToolkitConfig, prompt_bundle: dict[str, Any]) -> dict[str, Any]:
     prompt_text = str(prompt_bundle.get("prompt", ""))
     output_text = str(prompt_bundle.get("model_output", ""))
-    contexts = prompt_bundle.get("retrieved_contexts", [])
-    context_texts: list[str] = []
-    if isinstance(contexts, list):
-        for item in contexts:
-            if not isinstance(item, dict):
-                continue
-            merged = " ".join(
-                part.strip()
-                for part in (
-                    str(item.get("title", "")),
-                    str(item.get("snippet", "")),
-                    str(item.get("text", "")),
-                    str(item.get("content", "")),
-                )
-                if part and part.strip()
-            )
-            if merged:
-                context_texts.append(merged)
+    # Same extraction as the grounding metrics and the XAI embedding engine,
+    # which reuses these vectors by chunk index.
+    indexed = _indexed_context_texts({"retrieved_contexts": prompt_bundle.get("retrieved_contexts", [])})
+    context_indices = [index for index, _ in indexed]
+    context_texts = [text for _, text in indexed]
 
     if not prompt_text or not output_text or not context_texts:
         return {"embedding_available": False, "context_count": len(context_texts)}
@@ -127,6 +119,9 @@ def compute_embedding_features(config: ToolkitConfig, prompt_bundle: dict[str, A
         "prompt_vector": vectors[0],
         "output_vector": vectors[1],
         "context_vectors": vectors[2:],
+        # Position of each context vector in ``retrieved_contexts`` (empty
+        # chunks are not embedded), so consumers can map vectors back.
+        "context_indices": context_indices,
         "request_payload": result.request_payload,
         "response_payload": result.response_payload,
         "context_count": len(context_texts),
@@ -140,10 +135,17 @@ def run_eval(
     config_path: Path | None = None,
     prompt_bundle: dict[str, Any] | None = None,
     embedding_features: dict[str, Any] | None = None,
+    budget: LLMBudget | None = None,
 ) -> list[EvalResult]:
-    """Execute configured evaluation suites and return result payloads."""
+    """Execute configured evaluation suites and return result payloads.
+
+    ``budget`` is the run-scoped limit on advisory LLM calls.  When omitted
+    a fresh budget is built from ``config.adapters.run_budget`` so a
+    standalone ``tat eval run`` is bounded the same way as a full run.
+    """
 
     results: list[EvalResult] = []
+    llm_budget = budget if budget is not None else LLMBudget.from_config(config)
 
     for suite_name in config.eval.suites:
         suite_def = _load_suite_definition(suite_name, config_path=config_path)
@@ -183,6 +185,8 @@ def run_eval(
             # via context["toolkit_config"]. Stub providers gracefully fall back
             # to data_basis="llm_unavailable" inside the judges themselves.
             "toolkit_config": config,
+            # Shared across suites so the limit applies to the whole run.
+            "llm_budget": llm_budget,
         }
 
         for metric_id in metric_ids:
@@ -9,13 +9,12 @@ from typing import Any
 
 from trusted_ai_toolkit.cli import (
     _apply_adapter_overrides,
-    _compose_model_prompt,
     _load_retrieved_contexts,
     _model_artifact_payload,
     _run_prompt_workflow,
 )
 from trusted_ai_toolkit.config import load_config
-from trusted_ai_toolkit.model_client import ModelInvocationError, invoke_model
+from trusted_ai_toolkit.model_client import ModelInvocationError, compose_model_prompt, invoke_model
 
 
 def _pick(value: str | None, env_name: str, default: str | None = None) -> str | None:
@@ -100,7 +99,7 @@ def run_prompt_job(
 
     if resolved_mode == "simulate":
         retrieved_contexts = _load_retrieved_contexts(resolved_context_file)
-        model_prompt = _compose_model_prompt(resolved_prompt, retrieved_contexts)
+        model_prompt = compose_model_prompt(resolved_prompt, retrieved_contexts)
         try:
             invocation = invoke_model(model_prompt, cfg)
         except ModelInvocationError as exc:
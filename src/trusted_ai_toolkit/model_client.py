@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import json
+import math
 import os
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import Any
 from urllib import error, request
 
@@ -252,6 +255,32 @@ def _extract_embeddings(payload: dict[str, Any]) -> list[list[float]]:
     raise ModelInvocationError("embedding response did not contain usable vectors")
 
 
+def compose_model_prompt(prompt: str, retrieved_contexts: list[dict[str, Any]]) -> str:
+    """Build the model prompt that presents retrieved contexts before the user prompt.
+
+    Shared by the live-simulation commands and the model-in-the-loop
+    counterfactual engine, which must regenerate with exactly the prompt
+    shape the original answer was produced from.
+    """
+
+    if not retrieved_contexts:
+        return prompt
+
+    sections = ["Use the retrieved context below when answering the user prompt.", ""]
+    for idx, item in enumerate(retrieved_contexts, start=1):
+        title = str(item.get("title") or item.get("source") or f"Context {idx}")
+        body = (
+            str(item.get("snippet") or item.get("text") or item.get("content") or "")
+            .strip()
+        )
+        sections.append(f"[Source {idx}] {title}")
+        if body:
+            sections.append(body)
+        sections.append("")
+    sections.append(f"User prompt: {prompt}")
+    return "\n".join(sections).strip()
+
+
 def invoke_model(
     prompt: str,
     config: ToolkitConfig,
@@ -394,7 +423,12 @@ def embed_texts(texts: list[str], config: ToolkitConfig, model_name: str | None
 #      become unauditable.  ``_deterministic_extra_payload`` builds the
 #      provider-specific dict that asks for temperature=0 and a fixed seed.
 #
-#   2. Stub-safe invocation.  ``invoke_model_safely`` wraps invoke_model and
+#   2. Run-scoped budget.  ``LLMBudget`` caps wall-clock time, call count
+#      and token usage for all advisory LLM work in one governance run.  Once
+#      a limit is hit, ``invoke_model_safely`` returns a ``BudgetRefusal``
+#      without touching the network and callers report ``budget_exhausted``.
+#
+#   3. Stub-safe invocation.  ``invoke_model_safely`` wraps invoke_model and
 #      returns None when the provider is "stub", the adapter raises, or the
 #      network call fails.  Callers can then fall back to a deterministic
 #      result (e.g., advisory metric reports value=None and data_basis=
@@ -413,11 +447,122 @@ def _deterministic_extra_payload(provider: str) -> dict[str, Any]:
     return {"temperature": 0, "seed": _DETERMINISTIC_SEED, "max_tokens": 256}
 
 
+BUDGET_EXHAUSTED_REASON: str = "budget_exhausted"
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetRefusal:
+    """Returned by ``invoke_model_safely`` when the run budget refused the call.
+
+    Kept distinct from None (a failed call) so callers never infer a refusal
+    from ``LLMBudget.exhausted()``, which is also True after a call that
+    spent the last unit and then failed.
+    """
+
+    reason: str
+
+
+def _usage_tokens(result: ModelInvocationResult) -> int:
+    """Best-effort token count for one invocation.
+
+    Prefers provider-reported usage (OpenAI ``usage.total_tokens``, Ollama
+    ``prompt_eval_count + eval_count``) and falls back to a four-characters
+    per token estimate over the request and response text.
+    """
+
+    payload = result.response_payload
+    usage = payload.get("usage") if isinstance(payload, dict) else None
+    if isinstance(usage, dict):
+        total = usage.get("total_tokens")
+        if isinstance(total, (int, float)):
+            return int(total)
+    if isinstance(payload, dict):
+        ollama_counts = [payload.get("prompt_eval_count"), payload.get("eval_count")]
+        if any(isinstance(count, (int, float)) for count in ollama_counts):
+            return int(sum(count for count in ollama_counts if isinstance(count, (int, float))))
+    text_length = len(json.dumps(result.request_payload, default=str)) + len(result.output_text)
+    return math.ceil(text_length / 4)
+
+
+@dataclass(slots=True)
+class LLMBudget:
+    """Run-scoped wall-clock, call and token budget for advisory LLM calls.
+
+    One instance is created per governance run and threaded through
+    ``run_eval`` and ``generate_reasoning_report``.  It is safe to share
+    across threads.
+    """
+
+    deadline: float | None = None
+    max_calls: int | None = None
+    max_tokens: int | None = None
+    calls: int = 0
+    tokens: int = 0
+    exhausted_reason: str | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def from_config(cls, config: ToolkitConfig) -> LLMBudget:
+        limits = config.adapters.run_budget
+        deadline = time.monotonic() + limits.max_wall_seconds if limits.max_wall_seconds else None
+        return cls(deadline=deadline, max_calls=limits.max_calls, max_tokens=limits.max_tokens)
+
+    def remaining_seconds(self) -> float | None:
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def _check_locked(self) -> str | None:
+        if self.exhausted_reason is None:
+            if self.deadline is not None and time.monotonic() >= self.deadline:
+                self.exhausted_reason = "wall_clock_deadline"
+            elif self.max_calls is not None and self.calls >= self.max_calls:
+                self.exhausted_reason = "max_calls"
+            elif self.max_tokens is not None and self.tokens >= self.max_tokens:
+                self.exhausted_reason = "max_tokens"
+        return self.exhausted_reason
+
+    def exhausted(self) -> bool:
+        """Return True once any limit has been reached."""
+
+        with self._lock:
+            return self._check_locked() is not None
+
+    def acquire(self) -> bool:
+        """Reserve one call slot; False when the budget is already spent."""
+
+        with self._lock:
+            if self._check_locked() is not None:
+                return False
+            self.calls += 1
+            return True
+
+    def record(self, result: ModelInvocationResult) -> None:
+        with self._lock:
+            self.tokens += _usage_tokens(result)
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-safe usage summary for evidence-pack artifacts."""
+
+        with self._lock:
+            self._check_locked()
+            return {
+                "calls": self.calls,
+                "tokens": self.tokens,
+                "max_calls": self.max_calls,
+                "max_tokens": self.max_tokens,
+                "remaining_seconds": None if self.deadline is None else round(self.remaining_seconds() or 0.0, 3),
+                "exhausted": self.exhausted_reason is not None,
+                "exhausted_reason": self.exhausted_reason,
+            }
+
+
 def invoke_model_safely(
     prompt: str,
     config: ToolkitConfig,
     deterministic: bool = True,
-) -> ModelInvocationResult | None:
+    budget: LLMBudget | None = None,
+) -> ModelInvocationResult | BudgetRefusal | None:
     """Invoke the configured provider, returning None on any failure path.
 
     Used by LLM-judge metrics and the narrative generator.  The caller is
@@ -427,7 +572,10 @@ def invoke_model_safely(
 
     Returns
     -------
-    ModelInvocationResult on success, or None when:
+    ModelInvocationResult on success; a ``BudgetRefusal`` carrying the
+    limit that was hit when ``budget`` is exhausted and no call was made (the
+    request timeout is otherwise clamped to whatever wall-clock time the
+    budget has left); or None when:
         * the configured provider is "stub" (no live adapter)
         * the adapter raises ModelInvocationError (missing key, bad endpoint)
         * the network call fails for any reason
@@ -436,10 +584,21 @@ def invoke_model_safely(
     provider = config.adapters.provider
     if provider == "stub":
         return None
+    if budget is not None:
+        if not budget.acquire():
+            return BudgetRefusal(budget.exhausted_reason or BUDGET_EXHAUSTED_REASON)
+        remaining = budget.remaining_seconds()
+        if remaining is not None and remaining < config.adapters.timeout_seconds:
+            config = config.model_copy(
+                update={"adapters": config.adapters.model_copy(update={"timeout_seconds": max(1, math.ceil(remaining))})}
+            )
 
     extra = _deterministic_extra_payload(provider) if deterministic else None
     try:
-        return invoke_model(prompt, config, extra_payload=extra)
+        result = invoke_model(prompt, config, extra_payload=extra)
+        if budget is not None:
+            budget.record(result)
+        return result
     except ModelInvocationError:
         return None
     except Exception:
@@ -3,7 +3,6 @@
 from __future__ import annotations
 import base64
 import math
-import json
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Shared metric-classification constants
@@ -36,17 +35,21 @@ _LOWER_IS_BETTER_METRICS: frozenset[str] = frozenset({
 _COMPLEMENT_METRICS: frozenset[str] = frozenset({
     "unsupported_claim_rate",   # = 1 − claim_support_rate, exactly
 })
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from trusted_ai_toolkit.benchmarking import (
+    baseline_window,
     benchmark_distributions,
     build_cohort_key,
     metric_z_from_history,
     update_registry_for_config,
 )
 from tat.controls import pillar_scores, risk_tier as controls_risk_tier, run_controls, summarize_redteam, trust_score
-from trusted_ai_toolkit.artifacts import ArtifactStore
+from trusted_ai_toolkit.artifacts import ArtifactStore, load_json_artifact, required_outputs_for
+from trusted_ai_toolkit.catalog import find_latest_artifact
+from trusted_ai_toolkit.run_state import RunState
 from trusted_ai_toolkit.schemas import MetricResult, RedTeamFinding, Scorecard, ToolkitConfig
 from tat.runtime import build_system_context, compute_system_hash
 
@@ -74,14 +77,11 @@ def _embed_brand_logo() -> str | None:
 def _load_json_if_exists(path: Path) -> Any:
     if not path.exists():
         return None
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_json_artifact(path)
 
 
 def _find_latest_artifact(output_dir: Path, filename: str) -> Path | None:
-    candidates = list(output_dir.glob(f"*/{filename}"))
-    if not candidates:
-        return None
-    return max(candidates, key=lambda p: p.stat().st_mtime)
+    return find_latest_artifact(output_dir, filename)
 
 
 def _severity_counts(findings: list[RedTeamFinding]) -> dict[str, int]:
@@ -1342,7 +1342,7 @@ def _card_score_summary(
     severity_counts: dict[str, int],
     evidence_completeness: float,
     overall_status: str,
-    stage_gate_status: dict[str, str],
+    stage_gate_status: Mapping[str, str],
 ) -> dict[str, Any]:
     """Compute the UI-facing trust score for the current answer."""
 
@@ -1377,31 +1377,101 @@ def _card_score_summary(
     }
 
 
-def generate_scorecard(config: ToolkitConfig, store: ArtifactStore) -> Scorecard:
-    """Generate and persist scorecard markdown/html artifacts."""
+def _documentation_gate(evidence_completeness: float) -> Literal["pass", "needs_review"]:
+    return "pass" if evidence_completeness >= 90 else "needs_review"
+
+
+def _release_decision(stage_gate_status: Mapping[str, str]) -> tuple[str, str]:
+    """Return (overall_status, go_no_go) for the given stage gates."""
+
+    # Governance status remains separate from the answer-level verdict on
+    # purpose. A specific answer can be well-grounded while the surrounding
+    # system still fails release policy gates such as fairness or red-team.
+    if "fail" in stage_gate_status.values():
+        return "fail", "no-go"
+    if "needs_review" in stage_gate_status.values():
+        return "needs_review", "no-go"
+    return "pass", "go"
 
+
+def _apply_release_context(context: dict[str, Any], scorecard: Scorecard) -> None:
+    """Set the template fields that depend on evidence completeness and the release decision."""
+
+    failing_metrics_count = sum(1 for m in scorecard.metric_results if m.passed is False)
+    context["overall_status"] = scorecard.overall_status
+    context["go_no_go"] = scorecard.go_no_go
+    context["stage_gate_status"] = scorecard.stage_gate_status
+    context["evidence_completeness"] = scorecard.evidence_completeness
+    context["artifact_signal"] = _artifact_signal(scorecard)
+    context["card_score"] = _card_score_summary(
+        context["answer_trust_score_pct"],
+        context["governance_score_pct"],
+        failing_metrics_count,
+        context["severity_counts"],
+        scorecard.evidence_completeness,
+        scorecard.overall_status,
+        scorecard.stage_gate_status,
+    )
+    context["release_readiness_score_pct"] = context["card_score"]["release_readiness_score_pct"]
+
+
+def write_scorecard_outputs(store: ArtifactStore, scorecard: Scorecard, context: dict[str, Any]) -> None:
+    """Write ``scorecard.json`` and the rendered scorecards the store's profile produces."""
+
+    if store.produces("scorecard.md"):
+        store.save_rendered_md("scorecard.md.j2", "scorecard.md", context)
+    if store.produces("scorecard.html"):
+        store.save_rendered_html("scorecard.html.j2", "scorecard.html", context)
+    store.write_json("scorecard.json", scorecard.model_dump(mode="json"))
+
+
+def compose_scorecard(
+    config: ToolkitConfig,
+    store: ArtifactStore,
+    state: RunState | None = None,
+    borrow_latest: bool = True,
+) -> tuple[Scorecard, dict[str, Any]]:
+    """
+    Compute the scorecard and its template context without writing anything.
+
+    Eval results and red-team findings come from ``state`` when the prompt
+    workflow already holds them in memory; otherwise they are loaded from the
+    run directory, or from the latest run that has them unless
+    ``borrow_latest`` is off (re-scoring judges each run on its own evidence).
+    """
+
+    state = state if state is not None else RunState()
     eval_path = store.path_for("eval_results.json")
     redteam_path = store.path_for("redteam_findings.json")
     reasoning_path = store.path_for("reasoning_report.md")
 
-    if not eval_path.exists():
+    if borrow_latest and state.eval_results is None and not eval_path.exists():
         latest = _find_latest_artifact(store.output_dir, "eval_results.json")
         if latest is not None:
             eval_path = latest
-    if not redteam_path.exists():
+    if borrow_latest and state.findings is None and not redteam_path.exists():
         latest = _find_latest_artifact(store.output_dir, "redteam_findings.json")
         if latest is not None:
             redteam_path = latest
-    if not reasoning_path.exists():
+    # A profile that skips the reasoning report must not borrow another run's.
+    if borrow_latest and not reasoning_path.exists() and store.produces("reasoning_report.md"):
         latest = _find_latest_artifact(store.output_dir, "reasoning_report.md")
         if latest is not None:
             reasoning_path = latest
 
-    eval_payload = _load_json_if_exists(eval_path)
-    redteam_payload = _load_json_if_exists(redteam_path)
-
-    metric_results = _normalize_eval_metrics(eval_payload)
-    findings = _normalize_findings(redteam_payload)
+    in_memory_metrics = state.metric_results()
+    if in_memory_metrics is not None:
+        metric_results = in_memory_metrics
+    else:
+        metric_results = _normalize_eval_metrics(_load_json_if_exists(eval_path))
+    if state.findings is not None:
+        findings = state.findings
+        redteam_present = True
+    else:
+        redteam_payload = _load_json_if_exists(redteam_path)
+        findings = _normalize_findings(redteam_payload)
+        # An empty findings list still counts as a red-team run; only a missing artifact does not.
+        redteam_present = bool(redteam_payload)
     # Historical distributions are cohort-scoped so OpenAI runs do not get
     # standardized against unrelated local-model history.
     historical_distributions = benchmark_distributions(
@@ -1412,7 +1482,7 @@ def generate_scorecard(config: ToolkitConfig, store: ArtifactStore) -> Scorecard
     severity_counts = _severity_counts(findings)
     redteam_summary = summarize_redteam(findings) or severity_counts
     control_results = run_controls(config.system)
-    computed_pillar_scores = pillar_scores(control_results, redteam_summary if redteam_payload else None)
+    computed_pillar_scores = pillar_scores(control_results, redteam_summary if redteam_present else None)
     computed_governance_score = trust_score(computed_pillar_scores)
     computed_empirical_score = _empirical_score(metric_results)
     computed_trust_score = _trust_z_score(metric_results, historical_distributions)
@@ -1431,7 +1501,7 @@ def generate_scorecard(config: ToolkitConfig, store: ArtifactStore) -> Scorecard
 
     failing_metrics = [m.metric_id for m in metric_results if m.passed is False]
     high_findings = severity_counts["high"] + severity_counts["critical"]
-    required_outputs = config.artifact_policy.required_outputs_by_risk_tier.get(config.risk_tier, [])
+    required_outputs = required_outputs_for(config, store)
     evidence_completeness = _artifact_completeness(store, required_outputs)
 
     required_actions: list[str] = []
@@ -1445,7 +1515,7 @@ def generate_scorecard(config: ToolkitConfig, store: ArtifactStore) -> Scorecard
     stage_gate_status: dict[str, str] = {
         "evaluation": "fail" if failing_metrics else "pass",
         "redteam": "needs_review" if high_findings else "pass",
-        "documentation": "pass" if evidence_completeness >= 90 else "needs_review",
+        "documentation": _documentation_gate(evidence_completeness),
         "monitoring": "pass",
     }
 
@@ -1457,18 +1527,7 @@ def generate_scorecard(config: ToolkitConfig, store: ArtifactStore) -> Scorecard
     if risk_rules.get("require_human_signoff", False):
         stage_gate_status["human_signoff"] = "needs_review"
 
-    # Governance status remains separate from the answer-level verdict on
-    # purpose. A specific answer can be well-grounded while the surrounding
-    # system still fails release policy gates such as fairness or red-team.
-    if "fail" in stage_gate_status.values():
-        overall_status = "fail"
-        go_no_go = "no-go"
-    elif "needs_review" in stage_gate_status.values():
-        overall_status = "needs_review"
-        go_no_go = "no-go"
-    else:
-        overall_status = "pass"
-        go_no_go = "go"
+    overall_status, go_no_go = _release_decision(stage_gate_status)
 
     scorecard = Scorecard(
         project_name=config.project_name,
@@ -1479,6 +1538,7 @@ def generate_scorecard(config: ToolkitConfig, store: ArtifactStore) -> Scorecard
         go_no_go=go_no_go,
         stage_gate_status=stage_gate_status,
         evidence_completeness=evidence_completeness,
+        artifact_profile=store.profile,
         metric_results=metric_results,
         answer_verdict=answer_verdict,
         answer_reasons=answer_reasons,
@@ -1543,7 +1603,6 @@ def generate_scorecard(config: ToolkitConfig, store: ArtifactStore) -> Scorecard
     context["metric_strength"] = scorecard.metric_strength
     context["answer_reasons"] = answer_reasons
     context["pillar_breakdowns"] = _pillar_breakdowns(scorecard)
-    context["artifact_signal"] = _artifact_signal(scorecard)
     context["trust_score_z"] = scorecard.trust_score
     context["governance_score_pct"] = (
         round(scorecard.governance_score * 100.0, 0) if scorecard.governance_score is not None else None
@@ -1551,19 +1610,8 @@ def generate_scorecard(config: ToolkitConfig, store: ArtifactStore) -> Scorecard
     context["empirical_score_pct"] = (
         round(scorecard.empirical_score * 100.0, 0) if scorecard.empirical_score is not None else None
     )
-    context["card_score"] = _card_score_summary(
-        context["answer_trust_score_pct"],
-        context["governance_score_pct"],
-        len(failing_metrics),
-        severity_counts,
-        evidence_completeness,
-        overall_status,
-        stage_gate_status,
-    )
+    context["severity_counts"] = severity_counts
     context["severity_threshold"] = config.redteam.severity_threshold
-    context["go_no_go"] = go_no_go
-    context["stage_gate_status"] = stage_gate_status
-    context["evidence_completeness"] = evidence_completeness
     context["required_outputs"] = required_outputs
     context["redteam_gate_rules"] = {
         "require_redteam": bool(risk_rules.get("require_redteam", False)),
@@ -1571,26 +1619,85 @@ def generate_scorecard(config: ToolkitConfig, store: ArtifactStore) -> Scorecard
     }
     context["raw_trust_score_pct"] = context["governance_score_pct"]
     context["weighting_rationale"] = scorecard.weighting_rationale
-    context["release_readiness_score_pct"] = context["card_score"]["release_readiness_score_pct"]
     context["brand_logo_src"] = _embed_brand_logo()
     context["generated_files"] = {
         "scorecard_md": str(store.path_for("scorecard.md")),
         "scorecard_html": str(store.path_for("scorecard.html")),
     }
+    _apply_release_context(context, scorecard)
+    return scorecard, context
 
-    store.save_rendered_md("scorecard.md.j2", "scorecard.md", context)
-    store.save_rendered_html("scorecard.html.j2", "scorecard.html", context)
-    store.write_json("scorecard.json", scorecard.model_dump(mode="json"))
+
+def generate_scorecard(config: ToolkitConfig, store: ArtifactStore, state: RunState | None = None) -> Scorecard:
+    """
+    Generate and persist scorecard markdown/html artifacts.
+
+    Inputs are resolved as in ``compose_scorecard``.  The scorecard and its
+    template context are stored back on ``state`` for the incident stage.
+    """
+
+    state = state if state is not None else RunState()
+    scorecard, context = compose_scorecard(config, store, state)
+    metric_results = scorecard.metric_results
+    historical_distributions = context["benchmark_distributions"]
+
+    write_scorecard_outputs(store, scorecard, context)
     registry_path = update_registry_for_config(config.eval.benchmark_registry_path, config, store.run_id, metric_results)
     store.write_json(
         "benchmark_summary.json",
         {
             "run_id": store.run_id,
-            "registry_path": str(Path(registry_path).resolve()),
+            "registry_path": str(Path(config.eval.benchmark_registry_path).resolve()),
+            "registry_store_path": str(Path(registry_path).resolve()),
             "cohort_key": build_cohort_key(config),
+            "baseline": baseline_window(config).key,
             "metric_distributions": historical_distributions,
             "trust_score_method": "historical_zscore_with_threshold_fallback",
         },
     )
 
+    state.scorecard = scorecard
+    state.scorecard_context = context
+    return scorecard
+
+
+def refresh_scorecard_evidence(config: ToolkitConfig, store: ArtifactStore, state: RunState) -> Scorecard:
+    """
+    Update the scorecard in ``state`` after artifacts were added to the run.
+
+    Only evidence completeness depends on which files exist, so this reuses
+    the metrics, verdict, controls and distributions of the first pass and
+    recomputes just the documentation gate, the release decision derived
+    from it, and the completeness-driven card fields before re-rendering.
+    The benchmark registry and summary are left as the first pass wrote them
+    because the metric results have not changed.  Falls back to a full
+    ``generate_scorecard`` when no first pass is held in ``state``.
+    """
+
+    if state.scorecard is None or state.scorecard_context is None:
+        return generate_scorecard(config, store, state=state)
+
+    required_outputs = required_outputs_for(config, store)
+    evidence_completeness = _artifact_completeness(store, required_outputs)
+    previous = state.scorecard
+    if evidence_completeness == previous.evidence_completeness:
+        return previous
+
+    stage_gate_status = dict(previous.stage_gate_status)
+    stage_gate_status["documentation"] = _documentation_gate(evidence_completeness)
+    overall_status, go_no_go = _release_decision(stage_gate_status)
+    scorecard = previous.model_copy(
+        update={
+            "evidence_completeness": evidence_completeness,
+            "stage_gate_status": stage_gate_status,
+            "overall_status": overall_status,
+            "go_no_go": go_no_go,
+        }
+    )
+    context = dict(state.scorecard_context)
+    _apply_release_context(context, scorecard)
+    write_scorecard_outputs(store, scorecard, context)
+
+    state.scorecard = scorecard
+    state.scorecard_context = context
     return scorecard
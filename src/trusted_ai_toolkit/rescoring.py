@@ -0,0 +1,167 @@
+"""Bulk re-scoring of catalogued runs after verdict or score-formula changes."""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from trusted_ai_toolkit.artifacts import ArtifactStore, load_json_artifact
+from trusted_ai_toolkit.config import load_config
+from trusted_ai_toolkit.reporting import compose_scorecard, write_scorecard_outputs
+from trusted_ai_toolkit.schemas import RunCatalogEntry, ToolkitConfig
+
+# Artifacts a run must have to be re-scored from its own evidence.  Runs
+# without a scorecard.json were never scored (``tat eval run`` output, ...)
+# and are skipped rather than given a first scorecard.  Other inputs
+# (red-team findings, reasoning report) are optional but never borrowed from
+# another run; see ``compose_scorecard(borrow_latest=False)``.
+_REQUIRED_INPUTS = ("eval_results.json",)
+
+
+@dataclass(slots=True)
+class RescoreTask:
+    """One run to re-score; picklable so it can cross the process pool."""
+
+    run_id: str
+    run_dir: str
+    config_path: str
+    previous_verdict: str | None
+    previous_status: str | None
+    render: bool
+    write: bool
+
+
+@lru_cache(maxsize=32)
+def _config_for(config_path: str) -> ToolkitConfig:
+    # Workers see many runs from the same few configs; parse each once.
+    return load_config(config_path)
+
+
+def _run_config(config: ToolkitConfig, run_dir: Path) -> ToolkitConfig:
+    # Judge completeness against the profile the run was produced under, as
+    # recorded on its scorecard, not the config's current one.  Scorecards
+    # that predate the field are judged as full runs.
+    previous = load_json_artifact(run_dir / "scorecard.json")
+    profile = previous.get("artifact_profile", "full") if isinstance(previous, dict) else "full"
+    if profile == config.artifact_policy.profile:
+        return config
+    policy = config.artifact_policy.model_copy(update={"profile": profile})
+    return config.model_copy(update={"artifact_policy": policy})
+
+
+def rescore_run(task: RescoreTask) -> dict[str, Any]:
+    """
+    Recompute one run's scorecard from its stored eval and red-team artifacts.
+
+    Writes ``scorecard.json`` when ``task.write`` is set, and re-renders the
+    markdown/HTML scorecards only when ``task.render`` is also set.  The
+    benchmark registry is never updated: a re-score changes how runs are
+    judged, not the metric history they are judged against.
+    """
+
+    outcome: dict[str, Any] = {
+        "run_id": task.run_id,
+        "previous_verdict": task.previous_verdict,
+        "previous_status": task.previous_status,
+        "verdict": None,
+        "overall_status": None,
+        "go_no_go": None,
+        "answer_trust_score": None,
+        "error": None,
+        "skipped": None,
+    }
+    run_dir = Path(task.run_dir)
+    if not (run_dir / "scorecard.json").is_file():
+        outcome["skipped"] = "never scored"
+        return outcome
+    missing = [name for name in _REQUIRED_INPUTS if not (run_dir / name).is_file()]
+    if missing:
+        outcome["error"] = f"missing {', '.join(missing)}"
+        return outcome
+    try:
+        config = _run_config(_config_for(task.config_path), run_dir)
+        store = ArtifactStore.for_config(config, run_dir.name, output_dir=run_dir.parent, apply_profile=True)
+        scorecard, context = compose_scorecard(config, store, borrow_latest=False)
+        if task.write:
+            if task.render:
+                write_scorecard_outputs(store, scorecard, context)
+            else:
+                store.write_json("scorecard.json", scorecard.model_dump(mode="json"))
+    except Exception as exc:  # noqa: BLE001 - one bad run must not abort the batch
+        outcome["error"] = f"{type(exc).__name__}: {exc}"
+        return outcome
+    outcome.update(
+        verdict=scorecard.answer_verdict,
+        overall_status=scorecard.overall_status,
+        go_no_go=scorecard.go_no_go,
+        answer_trust_score=scorecard.answer_trust_score,
+    )
+    return outcome
+
+
+def rescore_runs(
+    entries: list[RunCatalogEntry],
+    default_config_path: str,
+    workers: int | None = None,
+    render: bool = False,
+    write: bool = True,
+) -> dict[str, Any]:
+    """
+    Re-score catalogued runs in a process pool and summarise verdict transitions.
+
+    Each run is scored with the config it was catalogued with when that file
+    still exists, otherwise with ``default_config_path``.  ``workers=1`` runs
+    in-process.  Returns a summary with per-transition counts
+    (``"trusted -> use_caution"``), the runs whose verdict or status
+    changed, the runs that could not be re-scored, and the runs skipped
+    because they never had a scorecard.
+    """
+
+    tasks = [
+        RescoreTask(
+            run_id=entry.run_id,
+            run_dir=entry.run_dir,
+            config_path=(
+                entry.config_path
+                if entry.config_path and Path(entry.config_path).is_file()
+                else default_config_path
+            ),
+            previous_verdict=entry.answer_verdict,
+            previous_status=entry.overall_status,
+            render=render,
+            write=write,
+        )
+        for entry in entries
+    ]
+    worker_count = max(1, workers or os.cpu_count() or 1)
+    if worker_count == 1 or len(tasks) <= 1:
+        outcomes = [rescore_run(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (worker_count * 4))
+        with ProcessPoolExecutor(max_workers=min(worker_count, len(tasks))) as pool:
+            outcomes = list(pool.map(rescore_run, tasks, chunksize=chunksize))
+
+    scored = [item for item in outcomes if item["error"] is None and item["skipped"] is None]
+    transitions = Counter(f"{item['previous_verdict']} -> {item['verdict']}" for item in scored)
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "runs_considered": len(tasks),
+        "runs_rescored": len(scored),
+        "rendered": render and write,
+        "written": write,
+        "verdict_transitions": dict(sorted(transitions.items())),
+        "verdict_counts": dict(sorted(Counter(str(item["verdict"]) for item in scored).items())),
+        "changed": [
+            item
+            for item in scored
+            if item["verdict"] != item["previous_verdict"] or item["overall_status"] != item["previous_status"]
+        ],
+        "failed": [{"run_id": item["run_id"], "error": item["error"]} for item in outcomes if item["error"]],
+        "skipped": [{"run_id": item["run_id"], "reason": item["skipped"]} for item in outcomes if item["skipped"]],
+    }
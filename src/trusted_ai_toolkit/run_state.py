@@ -0,0 +1,51 @@
+"""In-memory state carried between the stages of one governance run."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from trusted_ai_toolkit.schemas import (
+    ArtifactManifest,
+    EvalResult,
+    LineageReport,
+    MetricResult,
+    RedTeamFinding,
+    Scorecard,
+)
+
+
+@dataclass(slots=True)
+class RunState:
+    """
+    Objects produced by earlier workflow stages, handed to later ones.
+
+    ``_run_prompt_workflow`` fills the fields as each stage completes and
+    passes the state on, so the reasoning report, lineage, documentation,
+    scorecard and incident stages consume the objects directly instead of
+    re-reading and re-validating JSON that was written moments earlier.  The
+    JSON files are still written; they are the evidence pack.  A field left
+    as ``None`` means "not produced in this process" and the consumer falls
+    back to loading the artifact from the run directory, which is what the
+    standalone commands (``tat report``, ``tat docs build``, ...) rely on.
+
+    ``scorecard_context`` is the template context of the last scorecard
+    render, kept so a refresh after new artifacts can re-render without
+    recomputing metrics and verdicts.
+    """
+
+    prompt_bundle: dict[str, Any] | None = None
+    eval_results: list[EvalResult] | None = None
+    findings: list[RedTeamFinding] | None = None
+    redteam_summary: dict[str, Any] | None = None
+    lineage: LineageReport | None = None
+    manifest: ArtifactManifest | None = None
+    scorecard: Scorecard | None = None
+    scorecard_context: dict[str, Any] | None = None
+
+    def metric_results(self) -> list[MetricResult] | None:
+        """Return the flattened metric results of every eval suite, if known."""
+
+        if self.eval_results is None:
+            return None
+        return [metric for suite in self.eval_results for metric in suite.metric_results]
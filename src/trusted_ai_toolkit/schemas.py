@@ -33,6 +33,31 @@ class ModelConfig(BaseModel):
     known_failures: list[str] = Field(default_factory=lambda: ["Out-of-domain inputs may degrade quality"])
 
 
+class LLMJudgeConfig(BaseModel):
+    """Claim sampling settings for the advisory LLM-as-judge metrics."""
+
+    sampling: Literal["exhaustive", "adaptive"] = "exhaustive"
+    ci_width: float = Field(default=0.2, gt=0.0, le=1.0)
+    min_claims: int = Field(default=10, ge=1)
+    seed: int = 42
+
+
+class BaselineConfig(BaseModel):
+    """Which history the cohort baselines behind historical z-scores are built from.
+
+    ``all`` uses every prior run in the cohort.  ``last_runs`` keeps the most
+    recent ``window_runs`` runs, ``last_days`` the runs recorded in the last
+    ``window_days`` days, and ``ewma`` weights each new run by ``ewma_alpha``
+    so older runs decay geometrically.  Every mode is maintained
+    incrementally in the benchmark registry as runs are recorded.
+    """
+
+    mode: Literal["all", "last_runs", "last_days", "ewma"] = "all"
+    window_runs: int = Field(default=50, ge=2)
+    window_days: float = Field(default=30.0, gt=0.0)
+    ewma_alpha: float = Field(default=0.1, gt=0.0, le=1.0)
+
+
 class EvalConfig(BaseModel):
     """Evaluation configuration for suite and metric execution."""
 
@@ -59,12 +84,53 @@ class EvalConfig(BaseModel):
         }
     )
     benchmark_registry_path: str = "benchmarks/metric_registry.json"
+    baseline: BaselineConfig = Field(default_factory=BaselineConfig)
+    llm_judge: LLMJudgeConfig = Field(default_factory=LLMJudgeConfig)
+
+
+class XAIExecutionConfig(BaseModel):
+    """How the independent XAI engines are scheduled and time-boxed.
+
+    Engines run in-process by default; for typical inputs they finish in less
+    time than worker start-up takes.  ``process_pool`` runs them on one
+    worker pool shared by every report in the process and enforces the
+    wall-clock limits, which sequential mode does not.
+    """
+
+    mode: Literal["process_pool", "sequential"] = "sequential"
+    max_workers: int | None = Field(default=None, ge=1)
+    time_limit_seconds: float = Field(default=60.0, gt=0.0)
+    engine_time_limits: dict[str, float] = Field(default_factory=dict)
+
+
+class XAICacheConfig(BaseModel):
+    """On-disk cache of XAI engine payloads keyed by input digest."""
+
+    enabled: bool = True
+    directory: str | None = None
+    max_entries: int = Field(default=256, ge=1)
+
+
+class XAIRegenerationConfig(BaseModel):
+    """Opt-in model-in-the-loop counterfactuals (re-generate without top chunks).
+
+    ``max_calls`` is a hard cap on provider calls made by this engine,
+    applied on top of the run-wide ``adapters.run_budget``.
+    """
+
+    enabled: bool = False
+    top_k: int = Field(default=3, ge=1)
+    max_workers: int = Field(default=4, ge=1)
+    max_calls: int = Field(default=5, ge=0)
 
 
 class XAIConfig(BaseModel):
     """Explainability artifact generation settings."""
 
     reasoning_report_template: str = "reasoning_report.md.j2"
+    execution: XAIExecutionConfig = Field(default_factory=XAIExecutionConfig)
+    cache: XAICacheConfig = Field(default_factory=XAICacheConfig)
+    regeneration: XAIRegenerationConfig = Field(default_factory=XAIRegenerationConfig)
     include_sections: list[str] = Field(
         default_factory=lambda: [
             "Overview / Intended Use",
@@ -138,6 +204,19 @@ class GovernanceConfig(BaseModel):
     )
 
 
+class LLMBudgetConfig(BaseModel):
+    """Per-run limits on LLM-backed advisory stages (judges, narrative).
+
+    ``None`` disables a limit.  The budget never applies to the primary
+    model invocation in ``tat run simulate``, only to the optional LLM work
+    layered on top of the deterministic pipeline.
+    """
+
+    max_wall_seconds: float | None = Field(default=None, gt=0)
+    max_calls: int | None = Field(default=None, ge=0)
+    max_tokens: int | None = Field(default=None, ge=0)
+
+
 class AdapterConfig(BaseModel):
     """Adapter settings for offline stubs and future provider integrations."""
 
@@ -150,10 +229,31 @@ class AdapterConfig(BaseModel):
     api_key_env: str = "OPENAI_API_KEY"
     request_format: Literal["auto", "responses", "chat_completions", "ollama_generate"] = "auto"
     timeout_seconds: int = 30
+    run_budget: LLMBudgetConfig = Field(default_factory=LLMBudgetConfig)
 
 
 class ArtifactPolicyConfig(BaseModel):
-    """Required outputs for evidence pack completeness checks."""
+    """Required outputs for evidence pack completeness checks and artifact rendering settings.
+
+    ``template_cache_dir`` is where compiled Jinja template bytecode is
+    persisted; it defaults to ``<output_dir>/.template_cache``.
+    ``json_style`` and ``json_compression`` set how JSON artifacts are
+    serialized; compressed files keep their ``.json`` names and are read
+    transparently.  ``zstd`` requires the ``zstd`` extra.
+
+    ``profile`` selects which stages and renderings a prompt-workflow run
+    produces: ``full`` (everything), ``standard`` (no card, manifest or
+    scorecard markdown) or ``minimal`` (JSON evidence and scorecard.json only,
+    without XAI, lineage or manifest).  Required outputs the profile skips do
+    not count against evidence completeness.
+    """
+
+    profile: Literal["minimal", "standard", "full"] = "full"
+
+    template_bytecode_cache: bool = True
+    template_cache_dir: str | None = None
+    json_style: Literal["pretty", "compact"] = "pretty"
+    json_compression: Literal["none", "gzip", "zstd"] = "none"
 
     required_outputs_by_risk_tier: dict[str, list[str]] = Field(
         default_factory=lambda: {
@@ -275,6 +375,8 @@ class Scorecard(BaseModel):
     go_no_go: Literal["go", "no-go"]
     stage_gate_status: dict[str, Literal["pass", "needs_review", "fail"]] = Field(default_factory=dict)
     evidence_completeness: float = 0.0
+    # Artifact profile the run was produced under; completeness is judged against it.
+    artifact_profile: Literal["minimal", "standard", "full"] = "full"
     metric_results: list[MetricResult] = Field(default_factory=list)
     answer_verdict: Literal["trusted", "use_caution", "not_trusted"] | None = None
     answer_reasons: list[str] = Field(default_factory=list)
@@ -384,6 +486,23 @@ class ArtifactManifest(BaseModel):
     completeness: float = 0.0
 
 
+class RunCatalogEntry(BaseModel):
+    """Run catalog row for a finished run and the artifact names it produced."""
+
+    run_id: str
+    project_name: str | None = None
+    cohort_key: str | None = None
+    risk_tier: str | None = None
+    answer_verdict: str | None = None
+    overall_status: str | None = None
+    go_no_go: str | None = None
+    run_dir: str
+    config_path: str | None = None
+    started_at: datetime | None = None
+    completed_at: datetime
+    artifacts: list[str] = Field(default_factory=list)
+
+
 class IncidentRecord(BaseModel):
     """Incident record contract for threshold breaches."""
 
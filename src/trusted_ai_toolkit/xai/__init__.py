@@ -16,16 +16,40 @@ Public API
 ``compute_context_attribution``
     Rank retrieved context chunks by TF-IDF influence on the model output.
 
+``compute_token_heatmap``
+    Word-level heatmap splitting each chunk's TF-IDF influence across the
+    output tokens it backs.
+
+``compute_claim_attribution``
+    Sparse claim × chunk support matrix on the grounding metrics' TF-IDF
+    scores, with the claims each chunk alone supports.
+
+``compute_embedding_attribution``
+    Semantic context, sentence and claim attribution over embedding vectors
+    (one batched provider call at most; reuses ``compute_embedding_features``).
+
 ``compute_lime_attribution``
     LIME-inspired leave-one-out prompt sentence attribution with bootstrap CIs.
 
+``compute_kernel_lime_attribution``
+    Kernel-LIME: weighted ridge surrogate over thousands of sampled sentence
+    masks, with coefficient standard errors (requires the NumPy extra).
+
 ``compute_shapley_attribution``
-    SHAP-inspired Shapley value attribution (exact for N ≤ 8, Monte Carlo
-    otherwise).
+    SHAP-inspired Shapley value attribution (exact for N ≤ 8, or N ≤ 20 with
+    the optional NumPy engine; Monte Carlo otherwise).
+
+``compute_context_ablation``
+    Grounding metrics recomputed with each chunk (and the top-2 set) removed,
+    re-scoring one claim × context index instead of re-running the metrics.
 
 ``compute_counterfactual_summary``
     Narrative counterfactual statements derived from eval metrics and lineage.
 
+``compute_regeneration_counterfactuals``
+    Opt-in measured counterfactuals: regenerate the answer without each top
+    chunk (concurrent, budgeted, cached) and report grounding-metric deltas.
+
 ``generate_lineage_artifacts``
     Write lineage report markdown and authoritative source index artifacts.
 
@@ -38,10 +62,16 @@ Public API
 """
 
 from trusted_ai_toolkit.xai.explainability import (
+    compute_claim_attribution,
+    compute_context_ablation,
     compute_context_attribution,
     compute_counterfactual_summary,
+    compute_embedding_attribution,
+    compute_kernel_lime_attribution,
     compute_lime_attribution,
+    compute_regeneration_counterfactuals,
     compute_shapley_attribution,
+    compute_token_heatmap,
     run_xai_analysis,
 )
 from trusted_ai_toolkit.xai.lineage import (
@@ -55,9 +85,15 @@ __all__ = [
     "generate_reasoning_report",
     "run_xai_analysis",
     "compute_context_attribution",
+    "compute_token_heatmap",
+    "compute_claim_attribution",
+    "compute_embedding_attribution",
     "compute_lime_attribution",
+    "compute_kernel_lime_attribution",
     "compute_shapley_attribution",
+    "compute_context_ablation",
     "compute_counterfactual_summary",
+    "compute_regeneration_counterfactuals",
     "generate_lineage_artifacts",
     "build_lineage_report",
     "build_authoritative_source_index",
@@ -0,0 +1,155 @@
+"""
+Content-addressed on-disk cache for XAI engine payloads.
+
+The attribution engines are pure functions of (prompt, model output,
+retrieved contexts, engine parameters), yet ``generate_reasoning_report``
+re-runs them on every call — reruns after incidents, ``tat xai
+reasoning-report`` over an existing run, and chat traffic that repeats the
+same system prompt and contexts.  This cache stores each engine payload set
+under the SHA-256 digest of those inputs so a repeat is a single file read.
+
+Entries are plain JSON files named ``<digest>.json``.  Writes go through a
+temp file and ``os.replace`` so a concurrent reader never sees a partial
+entry.  The cache is bounded: after each write the least recently used
+entries (by mtime, refreshed on every hit) beyond ``max_entries`` are
+deleted.  Any unreadable entry is treated as a miss.
+
+``MemoryLRUCache`` is the in-process counterpart used for values that are
+cheaper to keep in memory than to re-read (regenerated answers, embedding
+vectors); it is bounded the same way so a long-lived process stays flat.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+
+class XAIResultCache:
+    """
+    Bounded directory of cached ``run_xai_analysis`` engine payloads.
+
+    Args:
+        directory:   Cache directory; created on first write.
+        max_entries: Maximum number of entries kept after a write.
+    """
+
+    def __init__(self, directory: str | Path, max_entries: int = 256) -> None:
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+
+    @staticmethod
+    def digest(
+        prompt: str,
+        model_output: str,
+        contexts: list[dict[str, Any]],
+        parameters: dict[str, Any],
+    ) -> str:
+        """Return the cache key for one set of engine inputs."""
+
+        canonical = json.dumps(
+            {"prompt": prompt, "model_output": model_output, "contexts": contexts, "parameters": parameters},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached payloads for ``key``, or ``None`` on a miss."""
+
+        path = self._path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return payload
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        """Store ``payload`` under ``key`` and evict entries beyond the bound."""
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, default=str)
+            os.replace(tmp_name, self._path(key))
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, Path]] = []
+        for path in self.directory.glob("*.json"):
+            if path.name.startswith("."):
+                continue
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda item: item[0])
+        for _, path in entries[: len(entries) - self.max_entries]:
+            path.unlink(missing_ok=True)
+
+
+class MemoryLRUCache:
+    """
+    Bounded in-process mapping that evicts the least recently used key.
+
+    Supports the subset of the ``dict`` interface the engines use
+    (``get``, ``in``, item access and assignment, ``len``), so a plain dict
+    can stand in for it in tests.
+
+    Args:
+        max_entries: Maximum number of keys kept after an assignment.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the value for ``key`` (marking it recently used) or ``default``."""
+
+        if key not in self._entries:
+            return default
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: Any) -> Any:
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+
+        self._entries.clear()
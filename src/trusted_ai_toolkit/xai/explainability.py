@@ -1,9 +1,10 @@
 """
 Explainability engines for RAG-based language model governance artifacts.
 
-This module provides three complementary post-hoc XAI methods designed for
-black-box LLM outputs.  They operate on already-generated text stored in
-``prompt_run.json`` — no second model invocation is required.
+This module provides post-hoc XAI methods designed for black-box LLM
+outputs.  The core engines (1-4) operate on already-generated text stored in
+``prompt_run.json`` and never call a model.  Engines 5-7 call the configured
+provider and run only when switched on with a live adapter configured.
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 METHODS IMPLEMENTED
@@ -13,7 +14,8 @@ METHODS IMPLEMENTED
    Ranks each retrieved context chunk by its lexical influence on the model
    output.  Uses TF-IDF cosine similarity to score each chunk individually,
    then computes a leave-one-out (LOO) delta to measure how much removing
-   that chunk would reduce overall source coverage in the response.
+   that chunk would reduce overall source coverage in the response.  Shapley
+   values over the chunks split that coverage fairly when sources overlap.
 
    Governance use: "Which retrieved sources actually drove this answer?"
 
@@ -24,6 +26,10 @@ METHODS IMPLEMENTED
    remaining prompt is recorded as the segment's attribution score.
    Higher scores indicate higher influence on the output.
 
+   The kernel-LIME engine goes further: it scores thousands of random
+   sentence masks in one batch and fits a proximity-weighted ridge surrogate
+   whose coefficients (with standard errors) are the attributions.
+
    Governance use: "Which parts of the user query shaped the answer?"
    Reference: Ribeiro et al. (2016) — https://arxiv.org/abs/1602.04938
 
@@ -36,7 +42,10 @@ METHODS IMPLEMENTED
    assignment satisfying all three axioms simultaneously.
 
    For short prompts (≤ 8 sentences) exact values are computed over all
-   2^N coalitions.  Longer prompts use Monte Carlo sampling (K = 300).
+   2^N coalitions.  With NumPy installed (``xai`` extra) exact values extend
+   to 20 sentences via a vectorised bitmask engine.  Longer prompts use
+   antithetic Monte Carlo sampling that stops once every segment's standard
+   error is below 0.005 (K ≤ 2000), and report those standard errors.
 
    Governance use: "What is each segment's fair share of credit for the
    model output, averaged over all possible coalition orderings?"
@@ -49,54 +58,146 @@ METHODS IMPLEMENTED
    statement answers "what would happen if X were absent?", giving governance
    reviewers concrete impact estimates without requiring new model calls.
 
+5. Regeneration Counterfactuals (opt-in, calls the model)
+   Re-asks the model without each of the top-ranked chunks through
+   ``invoke_model_safely`` and re-scores the grounding metrics, measuring
+   what method 4 only estimates.  Enabled by ``xai.regeneration``; calls are
+   capped, drawn from the run's LLM budget and cached by prompt.
+
+6. Embedding-space Attribution (opt-in, calls the embedding provider)
+   Repeats context and sentence attribution on ``embed_texts`` vectors so
+   paraphrased support is credited.  Requires a live provider and NumPy.
+
+7. LLM Narrative (opt-in, calls the model)
+   One deterministic ``invoke_model_safely`` call that explains the verdict
+   in plain language.  It never changes a score or the verdict.
+
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 DESIGN CONSTRAINTS
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-- Zero external dependencies — pure Python stdlib only (math, re, random).
-  Consistent with the toolkit's AIF360-compatible dependency-free philosophy.
+- The base install is pure Python stdlib (math, re, random), consistent with
+  the toolkit's AIF360-compatible dependency-free philosophy.  NumPy, from
+  the optional ``xai`` extra, enables the kernel-LIME, embedding and
+  vectorised exact Shapley engines; without it those engines return an
+  explanatory empty payload (Shapley falls back to the stdlib engines).
+- Model calls are opt-in: with the ``stub`` adapter, or with the engines
+  switched off, methods 5-7 return unavailable payloads and make no calls.
 - Deterministic: seeded RNG ensures evidence packs are reproducible.
 - Graceful on empty/missing inputs: returns zeroed-out payloads, never raises.
 - All scores are rounded to 4 decimal places for governance readability.
 - TF-IDF tokenisation and stopwords are kept consistent with
   ``trusted_ai_toolkit.eval.metrics`` so scores are cross-comparable.
+- Perturbation engines share ``xai.kernel.TfidfCountKernel``: segments are
+  tokenised once and every coalition / leave-one-out variant is scored by
+  count algebra, producing the same rounded values as ``_tfidf_cosine_sim``.
 """
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import json
 import math
+import multiprocessing
 import re
+import threading
+import time
 from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.pool import Pool
 from random import Random
 from typing import Any
 
+from trusted_ai_toolkit import __version__
+from trusted_ai_toolkit.eval.metrics import (
+    _CLAIM_SUPPORT_MIN_OVERLAP,
+    _CLAIM_SUPPORT_THRESHOLD,
+    _claim_support_matrix,
+    _claim_units,
+    _ClaimEvidenceIndex,
+    _indexed_context_texts,
+    metric_claim_support_rate,
+    metric_contradiction_rate,
+    metric_evidence_sufficiency_score,
+    metric_unsupported_claim_rate,
+)
+from trusted_ai_toolkit.schemas import XAIExecutionConfig
+from trusted_ai_toolkit.xai.cache import MemoryLRUCache, XAIResultCache
+from trusted_ai_toolkit.xai.kernel import (
+    NUMPY_AVAILABLE,
+    TfidfCountKernel,
+    batch_similarity,
+    coalition_similarity_table,
+)
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Module-level constants
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Version of the cached engine payloads, part of the XAI cache key.  The
+# toolkit version does not move with every engine change, so bump this in
+# any change that alters what an engine returns for the same input:
+#   1  payload cache introduced
+#   2  token_heatmap engine
+#   3  embedding-space context and sentence attribution
+#   4  claim_attribution support matrix
+#   5  shapley_value per chunk in context_attribution
+#   6  claim_attribution chunk text shared with the ablation metrics
+_XAI_PAYLOAD_SCHEMA_VERSION: int = 6
+
 # Minimum number of meaningful (non-stopword) tokens a sentence must contain
 # to be included in the attribution analysis.  Shorter fragments — headers,
 # single-word bullets, punctuation-only lines — add noise without contributing
 # signal to the TF-IDF scoring.
 _MIN_SENTENCE_TOKENS: int = 4
 
-# Threshold for switching from exact Shapley computation (exponential in N)
-# to Monte Carlo approximation.  At N = 8 we evaluate 2^8 = 256 subsets,
-# which takes a few milliseconds.  Above this threshold the exact approach
-# becomes impractical within a synchronous governance pipeline.
+# Largest prompt solved exactly by the pure-Python Shapley engine.  At N = 8
+# we evaluate 2^8 = 256 subsets, which takes a few milliseconds.  Keeping the
+# small-prompt path free of NumPy means these payloads never depend on the
+# optional extra being installed.
 _SHAPLEY_EXACT_MAX_SEGMENTS: int = 8
 
-# Number of Monte Carlo permutations for Shapley estimation when the prompt
-# has more than _SHAPLEY_EXACT_MAX_SEGMENTS sentences.  Higher values reduce
-# variance but increase wall-clock time.  300 samples gives a standard error
-# of roughly σ/√300 ≈ 0.06σ — adequate for governance score cards.
-_SHAPLEY_MC_SAMPLES: int = 300
+# Largest prompt solved exactly by the vectorised NumPy engine.  2^20 ≈ 1M
+# coalitions fit in a few 8 MB arrays and finish well under a second; beyond
+# this (or without NumPy) Shapley falls back to Monte Carlo sampling.
+_SHAPLEY_VECTORIZED_MAX_SEGMENTS: int = 20
+
+# Monte Carlo Shapley budget for prompts beyond the exact engines.  Sampling
+# stops as soon as every segment's standard error is below the target, but
+# never before the minimum (so the SE estimate itself is stable) and never
+# after the maximum.  Permutations are drawn in antithetic pairs, so both
+# bounds count individual permutations and should be even.
+_SHAPLEY_MC_MIN_PERMUTATIONS: int = 32
+_SHAPLEY_MC_MAX_PERMUTATIONS: int = 2000
+_SHAPLEY_MC_TARGET_SE: float = 0.005
 
 # Number of LOO bootstrap resampling iterations used to estimate confidence
 # intervals on LIME-style attribution scores.  200 samples match the bootstrap
 # budget used elsewhere in trusted_ai_toolkit.eval.metrics.
 _LOO_BOOTSTRAP_SAMPLES: int = 200
 
+# Kernel-LIME neighbourhood: number of random sentence masks scored per
+# prompt, the exponential kernel width over cosine distance to the full
+# prompt (0.25 matches LIME's text default of 25 on a 0–100 distance scale),
+# and the ridge penalty applied to the segment coefficients (LIME's default
+# Ridge(alpha=1)).
+_KERNEL_LIME_SAMPLES: int = 4000
+_KERNEL_LIME_WIDTH: float = 0.25
+_KERNEL_LIME_RIDGE_ALPHA: float = 1.0
+
+# Number of highest-weight words listed per chunk in the token heatmap's
+# markdown summary (the full heatmap is always kept in the JSON payload).
+_HEATMAP_TOP_TOKENS: int = 8
+
+# Number of strongest chunks listed per claim in the claim-to-source matrix
+# (every non-zero cell is kept in the JSON payload regardless).
+_CLAIM_TOP_CONTRIBUTORS: int = 3
+
 # Deterministic seed for all RNG operations so every run with the same prompt
 # produces identical XAI artefacts.  Change this to introduce intentional
 # variance for sensitivity testing.
@@ -294,10 +395,49 @@ def _tfidf_cosine_sim(text_a: str, text_b: str) -> float:
     return round(_sparse_cosine(vecs[0], vecs[1]), 4)
 
 
+def _build_kernel(model_output: str, segments: list[str]) -> TfidfCountKernel:
+    """
+    Tokenise the output and each segment once for count-algebra scoring.
+
+    Segments with no text contribute no tokens, matching the empty-string
+    short-circuit in ``_tfidf_cosine_sim``.
+    """
+    return TfidfCountKernel(
+        _tokenize(model_output) if model_output.strip() else [],
+        [_tokenize(segment) for segment in segments],
+    )
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 1. Context Attribution
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _context_chunks(contexts: list[dict[str, Any]]) -> tuple[list[str], list[str]]:
+    """
+    Extract one representative text string and a title from each context.
+
+    The key priority order mirrors _context_texts() in eval/metrics.
+    Non-dict items yield an empty text so indices stay aligned with
+    ``contexts``.
+    """
+    chunk_texts: list[str] = []
+    chunk_titles: list[str] = []
+    for idx, item in enumerate(contexts):
+        if not isinstance(item, dict):
+            chunk_texts.append("")
+            chunk_titles.append(f"Context {idx + 1}")
+            continue
+        merged = " ".join(
+            str(item.get(key, "")).strip()
+            for key in ("title", "snippet", "text", "content", "chunk_text")
+            if str(item.get(key, "")).strip()
+        )
+        chunk_texts.append(merged)
+        chunk_titles.append(str(item.get("title", f"Context {idx + 1}")) or f"Context {idx + 1}")
+    return chunk_texts, chunk_titles
+
+
+
 def compute_context_attribution(
     model_output: str,
     contexts: list[dict[str, Any]],
@@ -320,6 +460,16 @@ def compute_context_attribution(
         the chunk may have introduced vocabulary that distracted from the core
         answer.
 
+    ``shapley_value``
+        The chunk's Shapley value in the game v(S) = similarity of the output
+        to the chunks in S concatenated.  Influence over-credits chunks that
+        repeat each other and LOO under-credits them (removing one duplicate
+        costs nothing); Shapley averages the marginal contribution over every
+        order of adding chunks, so overlapping chunks share credit and the
+        values sum to the all-contexts similarity.  Computed exactly for up
+        to 8 chunks (20 with NumPy), else by Monte Carlo with a standard error
+        in ``shapley_std_error``.
+
     The returned list is sorted by ``influence_score`` descending so the most
     influential chunk appears first, making it easy to populate the evidence
     pack's "Top Sources" section.
@@ -341,6 +491,8 @@ def compute_context_attribution(
         - ``title``         (str)   — chunk title or "Context {n}"
         - ``influence_score`` (float) — TF-IDF cosine vs. model output [0, 1]
         - ``loo_impact``    (float) — LOO delta vs. aggregate coverage [−1, 1]
+        - ``shapley_value`` (float) — fair share of aggregate coverage
+        - ``shapley_std_error`` (float) — Monte Carlo SE (0.0 when exact)
         - ``rank``          (int)   — rank by influence_score (1 = highest)
 
         Returns an empty list if ``model_output`` is empty or no non-empty
@@ -349,45 +501,45 @@ def compute_context_attribution(
     if not model_output.strip() or not contexts:
         return []
 
-    # Extract a single representative text string from each context dict.
-    # The key priority order mirrors _context_texts() in eval/metrics.
-    chunk_texts: list[str] = []
-    chunk_titles: list[str] = []
-    for idx, item in enumerate(contexts):
-        if not isinstance(item, dict):
-            chunk_texts.append("")
-            chunk_titles.append(f"Context {idx + 1}")
-            continue
-        merged = " ".join(
-            str(item.get(key, "")).strip()
-            for key in ("title", "snippet", "text", "content", "chunk_text")
-            if str(item.get(key, "")).strip()
-        )
-        chunk_texts.append(merged)
-        chunk_titles.append(str(item.get("title", f"Context {idx + 1}")) or f"Context {idx + 1}")
+    chunk_texts, chunk_titles = _context_chunks(contexts)
+    chunk_indices = [idx for idx, chunk_text in enumerate(chunk_texts) if chunk_text]
+    if not chunk_indices:
+        return []
+
+    # Tokenise every non-empty chunk once; influence, LOO and Shapley
+    # coalitions are then count additions / subtractions on the shared
+    # kernel (segment ``i`` is chunk ``chunk_indices[i]``).
+    kernel = _build_kernel(model_output, [chunk_texts[idx] for idx in chunk_indices])
+    coalition = kernel.coalition()
+    for segment in range(len(chunk_indices)):
+        coalition.add(segment)
 
     # Baseline: similarity of model_output to all chunks concatenated.
-    full_context_text = " ".join(t for t in chunk_texts if t)
-    baseline_sim = _tfidf_cosine_sim(model_output, full_context_text) if full_context_text else 0.0
+    baseline_sim = coalition.rounded_similarity()
 
-    results: list[dict[str, Any]] = []
-    for idx, (chunk_text, title) in enumerate(zip(chunk_texts, chunk_titles)):
-        if not chunk_text:
-            continue
+    # Shapley credit over chunks: unlike influence and LOO it splits the
+    # baseline fairly when chunks overlap (Σφ = baseline_sim).  Exact for
+    # typical top-k retrieval; Monte Carlo with SE control for large k.
+    _, _, shapley_values, shapley_errors, _ = _shapley_values(kernel)
 
+    results: list[dict[str, Any]] = []
+    for segment, idx in enumerate(chunk_indices):
         # Individual influence: how much does this chunk's vocabulary appear in output?
-        influence = _tfidf_cosine_sim(model_output, chunk_text)
+        influence = kernel.rounded_similarity_of([segment])
 
         # LOO impact: how much does aggregate similarity drop when this chunk is absent?
-        remaining = " ".join(t for i, t in enumerate(chunk_texts) if i != idx and t)
-        loo_sim = _tfidf_cosine_sim(model_output, remaining) if remaining else 0.0
+        coalition.remove(segment)
+        loo_sim = coalition.rounded_similarity()
+        coalition.add(segment)
         loo_impact = round(baseline_sim - loo_sim, 4)
 
         results.append({
             "chunk_index": idx,
-            "title": title,
+            "title": chunk_titles[idx],
             "influence_score": round(influence, 4),
             "loo_impact": loo_impact,
+            "shapley_value": round(shapley_values[segment], 4),
+            "shapley_std_error": round(shapley_errors[segment], 4),
         })
 
     # Sort by influence_score descending and assign rank.
@@ -398,13 +550,323 @@ def compute_context_attribution(
     return results
 
 
+def compute_token_heatmap(
+    model_output: str,
+    contexts: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Attribute each word of the model output to the context chunks backing it.
+
+    The TF-IDF cosine between the output and a chunk is a sum of per-token
+    terms, so it splits exactly into the share carried by each output token
+    (``TfidfCountKernel.token_support``).  The heatmap cell for (token,
+    chunk) is that share: 0 when the chunk does not contain the word, and a
+    column sums to the chunk's unrounded ``influence_score``.
+
+    Everything is read from the count kernel built once over the output and
+    the chunks, so the cost is O(tokens × contexts) with no re-tokenisation.
+    Tokens are the distinct output words (after stopword removal) in order
+    of first appearance; cells are stored sparsely as
+    ``[token_index, context_index, weight]`` triplets to keep
+    ``reasoning_report.json`` compact.
+
+    Args:
+        model_output:
+            The complete text response generated by the model.
+        contexts:
+            Retrieved context dicts (same shape as for
+            ``compute_context_attribution``).
+
+    Returns:
+        A dict with keys:
+
+        - ``method``             (str)   — always "token_tfidf_support"
+        - ``tokens``             (list)  — distinct output tokens
+        - ``token_counts``       (list)  — occurrences of each token in the output
+        - ``contexts``           (list)  — ``{context_index, chunk_index, title,
+          top_tokens}`` for each non-empty chunk (columns of the heatmap);
+          ``top_tokens`` lists its highest-weight words (up to 8)
+        - ``cells``              (list)  — sparse ``[token, context, weight]``
+        - ``top_context``        (list)  — per token, the column with the
+          largest weight, or ``None`` if no chunk contains it
+        - ``unsupported_tokens`` (list)  — output words no chunk contains
+        - ``supported_fraction`` (float) — share of output token occurrences
+          backed by at least one chunk
+
+        Returns an empty heatmap if the output or all contexts are empty.
+    """
+    empty: dict[str, Any] = {
+        "method": "token_tfidf_support",
+        "tokens": [],
+        "token_counts": [],
+        "contexts": [],
+        "cells": [],
+        "top_context": [],
+        "unsupported_tokens": [],
+        "supported_fraction": 0.0,
+    }
+    if not model_output.strip() or not contexts:
+        return empty
+
+    chunk_texts, chunk_titles = _context_chunks(contexts)
+    kernel = _build_kernel(model_output, chunk_texts)
+    if kernel.reference_total == 0:
+        return empty
+
+    # Reference token ids are assigned first, in first-occurrence order, so
+    # ids 0..T-1 are exactly the heatmap rows.
+    token_count = sum(1 for count in kernel.reference_counts if count)
+    id_to_token = {token_id: token for token, token_id in kernel.vocabulary.items() if token_id < token_count}
+
+    columns: list[dict[str, Any]] = []
+    cells: list[list[Any]] = []
+    best: list[tuple[float, int | None]] = [(0.0, None)] * token_count
+    for chunk_index, (chunk_text, title) in enumerate(zip(chunk_texts, chunk_titles, strict=True)):
+        if not chunk_text:
+            continue
+        column = len(columns)
+        support = kernel.token_support(chunk_index)
+        strongest = sorted(support, key=lambda token_id: (-support[token_id], token_id))[:_HEATMAP_TOP_TOKENS]
+        columns.append({
+            "context_index": column,
+            "chunk_index": chunk_index,
+            "title": title,
+            "top_tokens": [id_to_token[token_id] for token_id in strongest],
+        })
+        for token_id, weight in sorted(support.items()):
+            cells.append([token_id, column, round(weight, 4)])
+            if weight > best[token_id][0]:
+                best[token_id] = (weight, column)
+
+    counts = kernel.reference_counts[:token_count]
+    supported = sum(counts[token_id] for token_id, (_, column) in enumerate(best) if column is not None)
+    return {
+        "method": "token_tfidf_support",
+        "tokens": [id_to_token[token_id] for token_id in range(token_count)],
+        "token_counts": counts,
+        "contexts": columns,
+        "cells": cells,
+        "top_context": [column for _, column in best],
+        "unsupported_tokens": [
+            id_to_token[token_id] for token_id, (_, column) in enumerate(best) if column is None
+        ],
+        "supported_fraction": round(supported / kernel.reference_total, 4),
+    }
+
+
+def compute_claim_attribution(
+    model_output: str,
+    contexts: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Map every claim in the output to the context chunks that support it.
+
+    Claims are split exactly as the grounding metrics split them
+    (``_claim_units``) and scored against every chunk with the same TF-IDF
+    cosine (``_claim_support_matrix``), so a cell here is the number that
+    ``claim_support_rate`` compares against its threshold.  The matrix is
+    built once from an inverted index over the chunks; each claim only
+    touches the postings of its own tokens.
+
+    A chunk *supports* a claim under the metric's rule: cosine of at least
+    0.22 or three shared content tokens.  From the support sets we derive
+    the removal impact of each chunk — the claims for which it is the only
+    supporting source — which ``compute_counterfactual_summary`` turns into
+    "removing X leaves N claims unsupported" statements.
+
+    Args:
+        model_output:
+            The complete text response generated by the model.
+        contexts:
+            Retrieved context dicts (same shape as for
+            ``compute_context_attribution``).
+
+    Returns:
+        A dict with keys:
+
+        - ``method``          (str)  — always "claim_tfidf_support"
+        - ``claims``          (list) — per claim: ``claim_index``, ``claim``,
+          ``best_score``, ``supporting_chunks`` and ``top_contributors``
+          (up to 3 ``{chunk_index, title, score}``)
+        - ``contexts``        (list) — ``{chunk_index, title}`` per non-empty chunk
+        - ``cells``           (list) — sparse ``[claim, chunk, score]``
+        - ``density``         (float) — share of non-zero cells
+        - ``removal_impact``  (list) — per chunk, ``claims_losing_support``
+          and the ``claims`` it alone supports, most critical first
+        - ``unsupported_claims`` (list) — claims no chunk supports
+
+        Returns an empty matrix if the output has no claims or there are no
+        contexts.
+    """
+    empty: dict[str, Any] = {
+        "method": "claim_tfidf_support",
+        "claims": [],
+        "contexts": [],
+        "cells": [],
+        "density": 0.0,
+        "removal_impact": [],
+        "unsupported_claims": [],
+    }
+    claims = _claim_units(model_output) if model_output.strip() else []
+    if not claims or not contexts:
+        return empty
+
+    _, chunk_titles = _context_chunks(contexts)
+    # Chunk text is extracted exactly as the metrics extract it (empty and
+    # non-dict contexts left out of the corpus), so IDF and therefore every
+    # score match ``claim_support_rate``.
+    indexed = _indexed_context_texts({"retrieved_contexts": contexts})
+    if not indexed:
+        return empty
+    chunk_indices = [index for index, _ in indexed]
+    chunk_texts = dict(indexed)
+    matrix = [
+        {chunk_indices[column]: score for column, score in row.items()}
+        for row in _claim_support_matrix(claims, [text for _, text in indexed])
+    ]
+    chunk_tokens: dict[int, set[str]] = {}
+
+    claim_rows: list[dict[str, Any]] = []
+    cells: list[list[Any]] = []
+    sole_support: dict[int, list[int]] = {}
+    unsupported: list[int] = []
+    for claim_index, (claim, row) in enumerate(zip(claims, matrix, strict=True)):
+        claim_tokens = set(_tokenize(claim))
+        supporting: list[int] = []
+        for chunk_index in sorted(row):
+            score = row[chunk_index]
+            cells.append([claim_index, chunk_index, round(score, 4)])
+            if chunk_index not in chunk_tokens:
+                chunk_tokens[chunk_index] = set(_tokenize(chunk_texts[chunk_index]))
+            overlap = len(claim_tokens & chunk_tokens[chunk_index])
+            if score >= _CLAIM_SUPPORT_THRESHOLD or overlap >= _CLAIM_SUPPORT_MIN_OVERLAP:
+                supporting.append(chunk_index)
+        strongest = sorted(row, key=lambda chunk_index: (-row[chunk_index], chunk_index))
+        claim_rows.append({
+            "claim_index": claim_index,
+            "claim": claim[:240],
+            "best_score": round(row[strongest[0]], 4) if strongest else 0.0,
+            "supporting_chunks": supporting,
+            "top_contributors": [
+                {"chunk_index": chunk_index, "title": chunk_titles[chunk_index], "score": round(row[chunk_index], 4)}
+                for chunk_index in strongest[:_CLAIM_TOP_CONTRIBUTORS]
+            ],
+        })
+        if not supporting:
+            unsupported.append(claim_index)
+        elif len(supporting) == 1:
+            sole_support.setdefault(supporting[0], []).append(claim_index)
+
+    removal_impact: list[dict[str, Any]] = [
+        {
+            "chunk_index": chunk_index,
+            "title": chunk_titles[chunk_index],
+            "claims_losing_support": len(sole_support.get(chunk_index, [])),
+            "claims": sole_support.get(chunk_index, []),
+        }
+        for chunk_index in chunk_indices
+    ]
+    removal_impact.sort(key=lambda entry: (-entry["claims_losing_support"], entry["chunk_index"]))
+    return {
+        "method": "claim_tfidf_support",
+        "claims": claim_rows,
+        "contexts": [
+            {"chunk_index": chunk_index, "title": chunk_titles[chunk_index]} for chunk_index in chunk_indices
+        ],
+        "cells": cells,
+        "density": round(len(cells) / (len(claims) * len(chunk_indices)), 4),
+        "removal_impact": removal_impact,
+        "unsupported_claims": unsupported,
+    }
+
+
+def compute_context_ablation(
+    model_output: str,
+    contexts: list[dict[str, Any]],
+    context_attribution: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Recompute the grounding metrics with each chunk (and the top-2 set) removed.
+
+    ``compute_counterfactual_summary`` can only extrapolate from the final
+    ``claim_support_rate``.  This engine measures the counterfactual: it
+    builds the claim × context index behind ``_claim_analysis`` once and
+    re-scores it with context columns removed, so every ablated value is
+    exactly what ``claim_support_rate``, ``contradiction_rate`` and
+    ``evidence_sufficiency_score`` would report had the chunk not been
+    retrieved.  No ablation re-tokenises text, and the contradiction check
+    for a (claim, chunk) pair runs at most once across all ablations.
+
+    Ablations are one per chunk, plus the two top-ranked chunks of
+    ``context_attribution`` removed together (sources that repeat each other
+    only show their joint weight when both go).
+
+    Args:
+        model_output:
+            The complete text response generated by the model.
+        contexts:
+            Retrieved context dicts.
+        context_attribution:
+            Output of ``compute_context_attribution``; its top two ranks form
+            the set ablation.
+
+    Returns:
+        A dict with keys:
+
+        - ``method``      (str)  — always "claim_matrix_ablation"
+        - ``claim_count`` (int)  — claims extracted from the output
+        - ``baseline``    (dict) — metric values with every chunk present
+        - ``ablations``   (list) — ``{label, removed, titles, metrics,
+          deltas}`` per ablation; ``label`` is "single" or "top_2" and
+          ``deltas`` are ablated minus baseline values
+
+        Returns an empty payload if there is no output or no usable context.
+    """
+    payload: dict[str, Any] = {
+        "method": "claim_matrix_ablation",
+        "claim_count": 0,
+        "baseline": {},
+        "ablations": [],
+    }
+    indexed = _indexed_context_texts({"retrieved_contexts": contexts})
+    if not model_output.strip() or not indexed:
+        return payload
+
+    _, chunk_titles = _context_chunks(contexts)
+    column_of = {chunk_index: column for column, (chunk_index, _) in enumerate(indexed)}
+    index = _ClaimEvidenceIndex(_claim_units(model_output), [text for _, text in indexed])
+    baseline = index.grounding_rates()
+    payload["claim_count"] = len(index.claims)
+    payload["baseline"] = baseline
+
+    removal_sets: list[tuple[str, list[int]]] = [("single", [chunk_index]) for chunk_index, _ in indexed]
+    top_two = [
+        entry["chunk_index"]
+        for entry in sorted(context_attribution, key=lambda entry: entry.get("rank", 0))
+        if entry.get("chunk_index") in column_of
+    ][:2]
+    if len(top_two) == 2:
+        removal_sets.append(("top_2", sorted(top_two)))
+
+    for label, removed in removal_sets:
+        metrics = index.grounding_rates(frozenset(column_of[chunk_index] for chunk_index in removed))
+        payload["ablations"].append({
+            "label": label,
+            "removed": removed,
+            "titles": [chunk_titles[chunk_index] for chunk_index in removed],
+            "metrics": metrics,
+            "deltas": {metric_id: round(value - baseline[metric_id], 3) for metric_id, value in metrics.items()},
+        })
+    return payload
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 2. LIME-style Leave-One-Out Prompt Attribution
 # ─────────────────────────────────────────────────────────────────────────────
 
 def _loo_attribution_scores(
-    sentences: list[str],
-    model_output: str,
+    segment_indices: list[int],
+    kernel: TfidfCountKernel,
 ) -> list[float]:
     """
     Compute raw LOO attribution scores for every sentence segment.
@@ -420,30 +882,35 @@ def _loo_attribution_scores(
     Negative scores indicate removing the sentence *improved* alignment
     (the sentence introduced irrelevant vocabulary that diluted the signal).
 
+    The prompt is described by ``segment_indices`` into the kernel's
+    sentences rather than by text, so bootstrap resamples (which repeat
+    indices) are scored by count algebra without rebuilding any strings.
+
     Args:
-        sentences:    List of sentence strings from the prompt.
-        model_output: The model's generated response.
+        segment_indices: Kernel sentence index for each prompt position; may
+                         contain repeats.
+        kernel:          Count kernel over the prompt sentences and output.
 
     Returns:
-        A list of raw (unrounded) LOO attribution floats, one per sentence.
-        All values are 0.0 if ``model_output`` or ``sentences`` is empty.
+        A list of raw (unrounded) LOO attribution floats, one per position.
+        All values are 0.0 if the output has no tokens or the list is empty.
     """
-    if not sentences or not model_output.strip():
-        return [0.0] * len(sentences)
+    if not segment_indices or kernel.reference_total == 0:
+        return [0.0] * len(segment_indices)
 
-    full_prompt = " ".join(sentences)
-    baseline = _tfidf_cosine_sim(model_output, full_prompt)
+    coalition = kernel.coalition()
+    for index in segment_indices:
+        coalition.add(index)
+    baseline = coalition.rounded_similarity()
 
     scores: list[float] = []
-    for i in range(len(sentences)):
-        # Reconstruct prompt without sentence i, preserving original order.
-        prompt_without = " ".join(s for j, s in enumerate(sentences) if j != i)
-        if not prompt_without.strip():
-            # Edge case: only one sentence in the prompt.
-            scores.append(baseline)
-        else:
-            sim_without = _tfidf_cosine_sim(model_output, prompt_without)
-            scores.append(baseline - sim_without)
+    for index in segment_indices:
+        # Prompt without this position: one copy of the sentence is removed.
+        # An empty remainder scores 0.0, so a single-sentence prompt still
+        # attributes the whole baseline to that sentence.
+        coalition.remove(index)
+        scores.append(baseline - coalition.rounded_similarity())
+        coalition.add(index)
 
     return scores
 
@@ -519,9 +986,9 @@ def compute_lime_attribution(
             "note": "No analysis: prompt produced no sentence segments above minimum token threshold.",
         }
 
-    full_prompt = " ".join(sentences)
-    baseline_sim = round(_tfidf_cosine_sim(model_output, full_prompt), 4)
-    raw_scores = _loo_attribution_scores(sentences, model_output)
+    kernel = _build_kernel(model_output, sentences)
+    baseline_sim = kernel.rounded_similarity_of(range(len(sentences)))
+    raw_scores = _loo_attribution_scores(list(range(len(sentences))), kernel)
 
     # Bootstrap confidence intervals.
     # Strategy: resample the sentence indices with replacement, recompute LOO
@@ -534,8 +1001,7 @@ def compute_lime_attribution(
     for _ in range(n_bootstrap):
         # Draw n sentence indices with replacement (bootstrap resample).
         indices = [rng.randrange(n) for _ in range(n)]
-        resampled = [sentences[i] for i in indices]
-        resampled_scores = _loo_attribution_scores(resampled, model_output)
+        resampled_scores = _loo_attribution_scores(indices, kernel)
         # Map bootstrap scores back to original sentence positions via the
         # sampled index mapping.  Each original sentence accumulates bootstrap
         # scores from all the times it was drawn in the resample.
@@ -555,7 +1021,7 @@ def compute_lime_attribution(
         return [round(lo, 4), round(hi, 4)]
 
     segment_dicts: list[dict[str, Any]] = []
-    for i, (sentence, score) in enumerate(zip(sentences, raw_scores)):
+    for i, (sentence, score) in enumerate(zip(sentences, raw_scores, strict=True)):
         segment_dicts.append({
             "index": i,
             "text": sentence[:160] + ("…" if len(sentence) > 160 else ""),
@@ -575,14 +1041,151 @@ def compute_lime_attribution(
     }
 
 
+def _kernel_lime_empty(note: str) -> dict[str, Any]:
+    return {
+        "method": "kernel_lime",
+        "reference": "https://arxiv.org/abs/1602.04938",
+        "baseline_sim": 0.0,
+        "segment_count": 0,
+        "n_samples": 0,
+        "segments": [],
+        "note": note,
+    }
+
+
+def compute_kernel_lime_attribution(
+    prompt: str,
+    model_output: str,
+    n_samples: int = _KERNEL_LIME_SAMPLES,
+    kernel_width: float = _KERNEL_LIME_WIDTH,
+    ridge_alpha: float = _KERNEL_LIME_RIDGE_ALPHA,
+    rng_seed: int = _RNG_SEED,
+) -> dict[str, Any]:
+    """
+    Fit a kernel-weighted local linear surrogate over random sentence masks.
+
+    Algorithm (LIME, Ribeiro et al. 2016, text explainer):
+      1. Split the prompt into N sentence segments; each is a binary feature.
+      2. Sample ``n_samples`` masks as a boolean (samples × N) matrix: draw
+         how many sentences to keep uniformly from 1..N, then which ones.
+         Row 0 is the unperturbed prompt.
+      3. Score every mask in one batch through ``batch_similarity`` on the
+         count kernel: y = TF-IDF cosine(output, kept sentences).
+      4. Weight each mask by proximity to the full prompt,
+         π(z) = exp(−d(z)² / width²) with d the cosine distance between z
+         and the all-ones mask.
+      5. Solve the weighted ridge regression in closed form,
+         β = (XᵀΠX + αI')⁻¹ XᵀΠy with an unpenalised intercept, and derive
+         standard errors from the weighted residual variance.
+
+    Where ``compute_lime_attribution`` only probes the leave-one-out
+    neighbourhood, the surrogate's coefficients account for interactions
+    across the whole local neighbourhood.  Sampling is seeded, so payloads
+    are deterministic.  Requires NumPy (``xai`` extra); without it a zeroed
+    payload with an explanatory note is returned.
+
+    Args:
+        prompt:       The complete user prompt sent to the model.
+        model_output: The model's response text.
+        n_samples:    Number of perturbation masks (default 4000).
+        kernel_width: Width of the exponential proximity kernel.
+        ridge_alpha:  Ridge penalty on the segment coefficients.
+        rng_seed:     RNG seed for reproducibility (default 42).
+
+    Returns:
+        A dict with keys:
+
+        - ``method``        (str)   — always "kernel_lime"
+        - ``reference``     (str)   — LIME paper URL
+        - ``baseline_sim``  (float) — TF-IDF cosine of output vs. full prompt
+        - ``segment_count`` (int)   — number of sentence segments analysed
+        - ``n_samples``     (int)   — perturbation masks scored
+        - ``kernel_width``  (float) — proximity kernel width
+        - ``intercept``     (float) — surrogate intercept
+        - ``local_r2``      (float) — weighted R² of the surrogate fit
+        - ``segments``      (list)  — per-sentence dicts, each with:
+              ``index``       (int)   — position in original prompt
+              ``text``        (str)   — sentence text (truncated to 160 chars)
+              ``coefficient`` (float) — surrogate weight; positive = influential
+              ``std_error``   (float) — standard error of the coefficient
+
+        Returns a zeroed-out payload if the prompt or output is empty.
+    """
+    if not prompt.strip() or not model_output.strip():
+        return _kernel_lime_empty("No analysis: prompt or model output was empty.")
+    sentences = _split_sentences(prompt)
+    if not sentences:
+        return _kernel_lime_empty(
+            "No analysis: prompt produced no sentence segments above minimum token threshold."
+        )
+    if not NUMPY_AVAILABLE:
+        return _kernel_lime_empty("No analysis: kernel LIME requires numpy (install the 'xai' extra).")
+
+    n = len(sentences)
+    kernel = _build_kernel(model_output, sentences)
+    baseline_sim = kernel.rounded_similarity_of(range(n))
+
+    # Neighbourhood sampling: size first, then membership, as LIME does, so
+    # small and large coalitions are equally represented.
+    rng = np.random.default_rng(rng_seed)
+    keep = rng.integers(1, n + 1, size=n_samples)
+    ranks = np.argsort(rng.random((n_samples, n)), axis=1)
+    masks = ranks < keep[:, None]
+    masks[0] = True
+
+    y = batch_similarity(kernel, masks)
+    active = masks.sum(axis=1)
+    distance = 1.0 - np.sqrt(active / n)
+    weights = np.exp(-(distance**2) / kernel_width**2)
+
+    design = np.hstack([np.ones((n_samples, 1)), masks.astype(np.float64)])
+    penalty = np.eye(n + 1) * ridge_alpha
+    penalty[0, 0] = 0.0
+    gram = design.T @ (weights[:, None] * design)
+    gram_inverse = np.linalg.pinv(gram + penalty)
+    beta = gram_inverse @ (design.T @ (weights * y))
+
+    residuals = y - design @ beta
+    weighted_sse = float(np.sum(weights * residuals**2))
+    dof = max(1, n_samples - (n + 1))
+    sigma_squared = weighted_sse / dof
+    covariance = sigma_squared * gram_inverse @ gram @ gram_inverse
+    std_errors = np.sqrt(np.clip(np.diag(covariance), 0.0, None))
+
+    weighted_mean = float(np.sum(weights * y) / np.sum(weights))
+    weighted_sst = float(np.sum(weights * (y - weighted_mean) ** 2))
+    local_r2 = 1.0 - weighted_sse / weighted_sst if weighted_sst > 0 else 0.0
+
+    segment_dicts: list[dict[str, Any]] = []
+    for i, sentence in enumerate(sentences):
+        segment_dicts.append({
+            "index": i,
+            "text": sentence[:160] + ("…" if len(sentence) > 160 else ""),
+            "coefficient": round(float(beta[i + 1]), 4),
+            "std_error": round(float(std_errors[i + 1]), 4),
+        })
+    segment_dicts.sort(key=lambda x: x["coefficient"], reverse=True)
+
+    return {
+        "method": "kernel_lime",
+        "reference": "https://arxiv.org/abs/1602.04938",
+        "baseline_sim": baseline_sim,
+        "segment_count": n,
+        "n_samples": n_samples,
+        "kernel_width": kernel_width,
+        "intercept": round(float(beta[0]), 4),
+        "local_r2": round(local_r2, 4),
+        "segments": segment_dicts,
+    }
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 3. SHAP-style Shapley Value Attribution
 # ─────────────────────────────────────────────────────────────────────────────
 
 def _characteristic_function(
     coalition_indices: set[int],
-    sentences: list[str],
-    model_output: str,
+    kernel: TfidfCountKernel,
 ) -> float:
     """
     Evaluate the characteristic function v(S) for a coalition of sentences.
@@ -590,14 +1193,14 @@ def _characteristic_function(
     v(S) is defined as the TF-IDF cosine similarity between the model output
     and the text formed by concatenating only the sentences in coalition S.
     This is the "game value" that Shapley values partition among the players
-    (sentences).
+    (sentences).  It is evaluated on the shared count kernel and rounded to
+    4 decimals exactly like ``_tfidf_cosine_sim`` on the joined text.
 
     v(∅) = 0.0  (no sentences → no similarity signal).
 
     Args:
         coalition_indices: Set of sentence indices included in this coalition.
-        sentences:         Full list of prompt sentences.
-        model_output:      The model's generated response.
+        kernel:            Count kernel over the prompt sentences and output.
 
     Returns:
         TF-IDF cosine similarity in [0.0, 1.0].  Returns 0.0 for empty
@@ -605,127 +1208,240 @@ def _characteristic_function(
     """
     if not coalition_indices:
         return 0.0
-    # Build coalition text in original sentence order to ensure v(S) is
-    # order-independent (bag-of-words TF-IDF handles this naturally, but
-    # original ordering keeps the text grammatically coherent for debugging).
-    coalition_text = " ".join(
-        sentences[j] for j in range(len(sentences)) if j in coalition_indices
-    )
-    return _tfidf_cosine_sim(model_output, coalition_text)
+    return kernel.rounded_similarity_of(coalition_indices)
+
+
+def _shapley_weights(n: int) -> list[float]:
+    """Shapley coalition weights w[s] = s! (n − s − 1)! / n! for s = 0 … n − 1."""
+    factorial_n = math.factorial(n)
+    return [math.factorial(s) * math.factorial(n - s - 1) / factorial_n for s in range(n)]
 
 
-def _shapley_exact(sentences: list[str], model_output: str) -> list[float]:
+def _shapley_exact(kernel: TfidfCountKernel) -> list[float]:
     """
     Compute exact Shapley values via exhaustive coalition enumeration.
 
-    Uses bitmask enumeration over all 2^N subsets to precompute v(S) for
-    every possible coalition, then applies the Shapley formula:
+    Visits all 2^N subsets in Gray-code order, so consecutive coalitions
+    differ by exactly one sentence and each v(S) costs a single ``add`` or
+    ``remove`` on the count kernel.  v(S) is stored in a flat list indexed by
+    bitmask and the Shapley formula is then applied:
 
         φ_i = Σ_{S ⊆ N\\{i}} [ |S|! (n − |S| − 1)! / n! ] × [v(S ∪ {i}) − v(S)]
 
-    This is O(2^N × N) in time and O(2^N) in space.  Only called when
-    N ≤ _SHAPLEY_EXACT_MAX_SEGMENTS (default 8), giving ≤ 256 subsets.
+    This is O(2^N × N) in time and O(2^N) in space.  It is the pure-Python
+    path used for N ≤ _SHAPLEY_EXACT_MAX_SEGMENTS (default 8, ≤ 256 subsets)
+    and as the reference for ``_shapley_exact_vectorized``.
 
     Args:
-        sentences:    Sentence segments from the prompt (N ≤ 8).
-        model_output: The model's generated response.
+        kernel: Count kernel over the prompt sentences and output.
 
     Returns:
         A list of exact Shapley values, one per sentence.  Values sum to
         v(full coalition) − v(∅) = baseline_sim − 0 = baseline_sim
         (efficiency property).
     """
-    n = len(sentences)
-    factorial_n = math.factorial(n)
+    n = kernel.segment_count
+    size = 1 << n
 
-    # Precompute the characteristic function for every coalition (bitmask).
     # coalition_scores[mask] = v(S) where bit j of mask encodes whether
-    # sentence j is in the coalition.
-    coalition_scores: dict[int, float] = {}
-    for mask in range(1 << n):
-        coalition = {j for j in range(n) if mask & (1 << j)}
-        coalition_scores[mask] = _characteristic_function(coalition, sentences, model_output)
+    # sentence j is in the coalition.  v(∅) = 0.
+    coalition_scores = [0.0] * size
+    coalition = kernel.coalition()
+    previous = 0
+    for step in range(1, size):
+        gray = step ^ (step >> 1)
+        flipped = gray ^ previous
+        index = flipped.bit_length() - 1
+        if gray & flipped:
+            coalition.add(index)
+        else:
+            coalition.remove(index)
+        coalition_scores[gray] = coalition.rounded_similarity()
+        previous = gray
+
+    popcount = [0] * size
+    for mask in range(1, size):
+        popcount[mask] = popcount[mask >> 1] + (mask & 1)
+    weights = _shapley_weights(n)
 
     shapley: list[float] = []
     for i in range(n):
         bit_i = 1 << i
         phi_i = 0.0
-
         # Iterate over all subsets S that do NOT contain i.
-        for mask in range(1 << n):
+        for mask in range(size):
             if mask & bit_i:
-                # Skip: this subset already contains sentence i.
                 continue
-
-            s_size = bin(mask).count("1")
-            # Shapley weight for coalition size s_size:
-            # w = |S|! × (n − |S| − 1)! / n!
-            weight = math.factorial(s_size) * math.factorial(n - s_size - 1) / factorial_n
             # Marginal contribution of sentence i to this coalition.
-            phi_i += weight * (coalition_scores[mask | bit_i] - coalition_scores[mask])
-
+            phi_i += weights[popcount[mask]] * (coalition_scores[mask | bit_i] - coalition_scores[mask])
         shapley.append(phi_i)
 
     return shapley
 
 
+def _shapley_exact_vectorized(kernel: TfidfCountKernel) -> list[float]:
+    """
+    Compute exact Shapley values with NumPy over the full bitmask table.
+
+    ``coalition_similarity_table`` produces v(S) for all 2^N coalitions in a
+    few array passes (see ``trusted_ai_toolkit.xai.kernel``).  The Shapley sum
+    is then a weighted reduction per sentence: reshaping the table as
+    (-1, 2, 2^i) splits it into the coalitions without sentence i (axis 1 =
+    0) and their partners with it (axis 1 = 1), so
+
+        φ_i = Σ w[|S|] · (table[..., 1, :] − table[..., 0, :])
+
+    with w indexed by a popcount array built the same way.  At N = 20 this
+    is ~1M coalitions and runs well under a second.
+
+    Args:
+        kernel: Count kernel over the prompt sentences (N ≤ 20) and output.
+
+    Returns:
+        A list of exact Shapley values, one per sentence, equal to
+        ``_shapley_exact`` up to floating-point summation order.
+    """
+    n = kernel.segment_count
+    table = coalition_similarity_table(kernel)
+
+    popcount = np.zeros(1 << n, dtype=np.int64)
+    for i in range(n):
+        popcount.reshape(-1, 2, 1 << i)[:, 1, :] += 1
+    # Weight of the coalition *without* i; |S| ≤ n − 1 there, so pad the
+    # unused size-n slot with zero.
+    weights = np.asarray(_shapley_weights(n) + [0.0])[popcount]
+
+    shapley: list[float] = []
+    for i in range(n):
+        halves = table.reshape(-1, 2, 1 << i)
+        marginal = halves[:, 1, :] - halves[:, 0, :]
+        shapley.append(float(np.sum(weights.reshape(-1, 2, 1 << i)[:, 0, :] * marginal)))
+    return shapley
+
+
 def _shapley_monte_carlo(
-    sentences: list[str],
-    model_output: str,
-    n_samples: int = _SHAPLEY_MC_SAMPLES,
+    kernel: TfidfCountKernel,
+    target_se: float = _SHAPLEY_MC_TARGET_SE,
+    min_permutations: int = _SHAPLEY_MC_MIN_PERMUTATIONS,
+    max_permutations: int = _SHAPLEY_MC_MAX_PERMUTATIONS,
     rng_seed: int = _RNG_SEED,
-) -> list[float]:
+) -> tuple[list[float], list[float], int]:
     """
-    Estimate Shapley values via Monte Carlo permutation sampling.
+    Estimate Shapley values via convergence-controlled permutation sampling.
 
     Algorithm (Strumbelj & Kononenko, 2014 approximation of Lundberg & Lee):
-      For each of n_samples iterations:
-        1. Sample a uniformly random permutation of all N sentence indices.
-        2. Step through the permutation; maintain a growing coalition S.
-        3. When sentence i is added, record its marginal contribution:
-               v(S ∪ {i}) − v(S)
-           where S is the set of sentences that appeared BEFORE i in this
-           permutation.
-        4. After n_samples iterations, φ_i is the running mean of all
-           marginal contributions recorded for sentence i.
-
-    The marginal contribution v(S ∪ {i}) − v(S) is computed using the
-    characteristic function at each step (TF-IDF cosine with the model output).
-    Coalition text is built in original sentence index order (not permutation
-    order) to ensure v(S) is consistent with the exact implementation.
+      Repeat until converged:
+        1. Sample a uniformly random permutation π and its reverse (an
+           antithetic pair).  A sentence that enters early in π enters late
+           in reverse(π), so the pair's marginal contributions are negatively
+           correlated and their mean has lower variance than two independent
+           draws.
+        2. Step through each permutation, growing a coalition S; when
+           sentence i is added, record v(S ∪ {i}) − v(S).
+        3. Average the two marginals per sentence into one observation and
+           fold it into a running (Welford) mean and variance.
+        4. Stop once every sentence's standard error of the mean is below
+           ``target_se`` (after ``min_permutations``), or at
+           ``max_permutations``.
+
+    v(S) is memoised by coalition bitmask.  Kernel updates along a walk are
+    deferred until a coalition misses the memo, so repeated prefixes (small
+    coalitions, the full set) cost only a dict lookup.  Bag-of-words scoring
+    makes v(S) independent of order, so the values are consistent with the
+    exact implementation.
 
     Args:
-        sentences: Sentence segments from the prompt.
-        model_output: The model's generated response.
-        n_samples: Number of random permutation samples (default 300).
-        rng_seed: RNG seed for reproducibility (default 42).
+        kernel:           Count kernel over the prompt sentences and output.
+        target_se:        Stop when every segment's SE falls below this.
+        min_permutations: Permutations sampled before checking convergence.
+        max_permutations: Hard cap on permutations sampled.
+        rng_seed:         RNG seed for reproducibility (default 42).
 
     Returns:
-        A list of estimated Shapley values, one per sentence.  Values
-        approximately satisfy the efficiency axiom: Σ φ_i ≈ baseline_sim.
+        ``(values, std_errors, permutations_used)`` — estimated Shapley
+        values and their standard errors, one per sentence, plus the number
+        of permutations actually sampled.  Values satisfy the efficiency
+        axiom exactly for every sampled permutation, so Σ φ_i = baseline_sim.
     """
-    n = len(sentences)
+    n = kernel.segment_count
     rng = Random(rng_seed)
-    # Accumulate marginal contributions over all sampled permutations.
-    running_sum = [0.0] * n
+    memo: dict[int, float] = {0: 0.0}
+
+    def _marginals(order: list[int]) -> list[float]:
+        marginals = [0.0] * n
+        coalition = kernel.coalition()
+        pending: list[int] = []
+        mask = 0
+        v_prev = 0.0  # v(∅) = 0
+        for idx in order:
+            mask |= 1 << idx
+            pending.append(idx)
+            v_curr = memo.get(mask)
+            if v_curr is None:
+                for member in pending:
+                    coalition.add(member)
+                pending.clear()
+                v_curr = coalition.rounded_similarity()
+                memo[mask] = v_curr
+            marginals[idx] = v_curr - v_prev
+            v_prev = v_curr
+        return marginals
 
-    for _ in range(n_samples):
+    # Welford accumulators over antithetic-pair observations.
+    pairs = 0
+    mean = [0.0] * n
+    m2 = [0.0] * n
+    std_errors = [0.0] * n
+    max_pairs = max(1, max_permutations // 2)
+    min_pairs = max(2, min_permutations // 2)
+
+    while pairs < max_pairs:
         perm = list(range(n))
         rng.shuffle(perm)
+        forward = _marginals(perm)
+        backward = _marginals(perm[::-1])
+
+        pairs += 1
+        for i in range(n):
+            observation = 0.5 * (forward[i] + backward[i])
+            delta = observation - mean[i]
+            mean[i] += delta / pairs
+            m2[i] += delta * (observation - mean[i])
+
+        if pairs >= min_pairs:
+            std_errors = [math.sqrt(m2[i] / (pairs - 1) / pairs) for i in range(n)]
+            if max(std_errors) < target_se:
+                break
 
-        coalition: set[int] = set()
-        v_prev = 0.0  # v(∅) = 0
+    if pairs < min_pairs:
+        std_errors = [math.sqrt(m2[i] / (pairs - 1) / pairs) if pairs > 1 else 0.0 for i in range(n)]
+    return mean, std_errors, 2 * pairs
 
-        for idx in perm:
-            coalition.add(idx)
-            # Evaluate v(S ∪ {idx}) with the coalition in original index order.
-            v_curr = _characteristic_function(coalition, sentences, model_output)
-            # Marginal contribution of sentence idx given the predecessors in perm.
-            running_sum[idx] += v_curr - v_prev
-            v_prev = v_curr
 
-    # Average over all sampled permutations to get the Shapley estimate.
-    return [running_sum[i] / n_samples for i in range(n)]
+def _shapley_values(
+    kernel: TfidfCountKernel,
+) -> tuple[str, str, list[float], list[float], int | None]:
+    """
+    Shapley values of every kernel segment with the cheapest adequate engine.
+
+    Exact pure-Python enumeration up to _SHAPLEY_EXACT_MAX_SEGMENTS players,
+    the vectorised NumPy table up to _SHAPLEY_VECTORIZED_MAX_SEGMENTS, and
+    antithetic Monte Carlo (stopping at _SHAPLEY_MC_TARGET_SE) beyond that.
+    Shared by prompt-sentence and retrieved-chunk attribution.
+
+    Returns:
+        ``(method, engine, values, std_errors, permutations_used)`` where
+        ``method`` is "shapley_exact" or "shapley_monte_carlo", ``engine`` is
+        "python" or "numpy", standard errors are 0.0 for exact values and
+        ``permutations_used`` is None unless sampling was used.
+    """
+    n = kernel.segment_count
+    if n <= _SHAPLEY_EXACT_MAX_SEGMENTS:
+        return "shapley_exact", "python", _shapley_exact(kernel), [0.0] * n, None
+    if NUMPY_AVAILABLE and n <= _SHAPLEY_VECTORIZED_MAX_SEGMENTS:
+        return "shapley_exact", "numpy", _shapley_exact_vectorized(kernel), [0.0] * n, None
+    values, std_errors, permutations_used = _shapley_monte_carlo(kernel, target_se=_SHAPLEY_MC_TARGET_SE)
+    return "shapley_monte_carlo", "python", values, std_errors, permutations_used
 
 
 def compute_shapley_attribution(
@@ -746,8 +1462,11 @@ def compute_shapley_attribution(
       - **Linearity**:   Attribution is additive over independent games.
 
     For prompts with ≤ _SHAPLEY_EXACT_MAX_SEGMENTS sentences, exact values are
-    computed via exhaustive coalition enumeration.  Longer prompts use Monte
-    Carlo permutation sampling (300 samples by default).
+    computed via exhaustive coalition enumeration in pure Python.  Prompts up
+    to _SHAPLEY_VECTORIZED_MAX_SEGMENTS sentences are still solved exactly
+    with the NumPy bitmask engine when the ``xai`` extra is installed.  Longer
+    prompts use antithetic Monte Carlo permutation sampling that stops once
+    every segment's standard error is below _SHAPLEY_MC_TARGET_SE.
 
     Args:
         prompt:
@@ -759,6 +1478,10 @@ def compute_shapley_attribution(
         A dict with keys:
 
         - ``method``         (str)  — "shapley_exact" or "shapley_monte_carlo"
+        - ``engine``         (str)  — "python" or "numpy"
+        - ``permutations_used`` (int | None) — Monte Carlo permutations sampled
+          (None for exact computation)
+        - ``target_std_error`` (float | None) — SE stopping target (Monte Carlo)
         - ``reference``      (str)  — SHAP paper URL
         - ``efficiency_sum`` (float)— Σ φ_i (should ≈ baseline_sim)
         - ``baseline_sim``   (float)— TF-IDF cosine of output vs. full prompt
@@ -767,6 +1490,7 @@ def compute_shapley_attribution(
               ``index``        (int)   — position in original prompt
               ``text``         (str)   — sentence text (truncated to 160 chars)
               ``shapley_value``(float) — credit assigned [approx −1, +1]
+              ``std_error``    (float) — Monte Carlo standard error (0.0 if exact)
               ``normalised``   (float) — φ_i / Σ|φ_j| (relative importance %)
 
         Returns a zeroed-out payload if prompt or output is empty.
@@ -795,16 +1519,12 @@ def compute_shapley_attribution(
         }
 
     n = len(sentences)
-    full_prompt = " ".join(sentences)
-    baseline_sim = round(_tfidf_cosine_sim(model_output, full_prompt), 4)
+    kernel = _build_kernel(model_output, sentences)
+    baseline_sim = kernel.rounded_similarity_of(range(n))
 
     # Choose exact vs. Monte Carlo based on prompt length.
-    if n <= _SHAPLEY_EXACT_MAX_SEGMENTS:
-        method_name = "shapley_exact"
-        raw_values = _shapley_exact(sentences, model_output)
-    else:
-        method_name = "shapley_monte_carlo"
-        raw_values = _shapley_monte_carlo(sentences, model_output)
+    method_name, engine, raw_values, std_errors, permutations_used = _shapley_values(kernel)
+    target_se = _SHAPLEY_MC_TARGET_SE if permutations_used is not None else None
 
     # Compute normalised importance: φ_i / Σ|φ_j|.
     # This expresses each sentence's credit as a fraction of total absolute
@@ -812,12 +1532,14 @@ def compute_shapley_attribution(
     total_abs = sum(abs(v) for v in raw_values)
 
     segment_dicts: list[dict[str, Any]] = []
-    for i, (sentence, phi) in enumerate(zip(sentences, raw_values)):
+    rows = zip(sentences, raw_values, std_errors, strict=True)
+    for i, (sentence, phi, std_error) in enumerate(rows):
         normalised = round(abs(phi) / total_abs, 4) if total_abs > 0 else 0.0
         segment_dicts.append({
             "index": i,
             "text": sentence[:160] + ("…" if len(sentence) > 160 else ""),
             "shapley_value": round(phi, 4),
+            "std_error": round(std_error, 4),
             "normalised": normalised,
         })
 
@@ -829,6 +1551,9 @@ def compute_shapley_attribution(
 
     return {
         "method": method_name,
+        "engine": engine,
+        "permutations_used": permutations_used,
+        "target_std_error": target_se,
         "reference": "https://arxiv.org/abs/1705.07874",
         "efficiency_sum": efficiency_sum,
         "baseline_sim": baseline_sim,
@@ -846,6 +1571,8 @@ def compute_counterfactual_summary(
     lineage_nodes: list[dict[str, Any]],
     redteam_summary: dict[str, Any],
     context_attribution: list[dict[str, Any]],
+    claim_attribution: dict[str, Any] | None = None,
+    context_ablation: dict[str, Any] | None = None,
 ) -> list[str]:
     """
     Synthesise narrative counterfactual statements from existing evidence.
@@ -860,8 +1587,10 @@ def compute_counterfactual_summary(
        "If [top source] were absent, aggregate grounding coverage would drop by
        approximately Y%."
 
-    2. **Claim support degradation** — derived from ``claim_support_rate`` in
-       eval results.
+    2. **Claim support degradation** — derived from the claim-to-source matrix
+       and the context ablation when available (claims left without support
+       and the recomputed metrics if a chunk is removed), and from
+       ``claim_support_rate`` in eval results.
        "If the retrieved contexts contained no supporting evidence, roughly X
        claims would become unsupported."
 
@@ -887,6 +1616,10 @@ def compute_counterfactual_summary(
             Red-team summary dict (from ``redteam_summary.json``).
         context_attribution:
             Context attribution list as returned by ``compute_context_attribution``.
+        claim_attribution:
+            Optional claim matrix as returned by ``compute_claim_attribution``.
+        context_ablation:
+            Optional measured metric deltas from ``compute_context_ablation``.
 
     Returns:
         A list of human-readable counterfactual statement strings, suitable
@@ -918,7 +1651,49 @@ def compute_counterfactual_summary(
                 "Removing or updating this source would materially change the answer."
             )
 
-    # ── 2. Claim support degradation (from eval metric claim_support_rate) ──
+    # ── 2. Claim support degradation (from the claim-to-source matrix) ─────
+    claim_rows = (claim_attribution or {}).get("claims", [])
+    if claim_rows:
+        impact = (claim_attribution or {}).get("removal_impact", [])
+        sole_source_chunks = [entry for entry in impact if entry.get("claims_losing_support", 0) > 0]
+        for entry in sole_source_chunks[:2]:
+            lost = entry["claims_losing_support"]
+            statements.append(
+                f"If '{entry.get('title', 'unknown')}' were removed, {lost} of "
+                f"{len(claim_rows)} output claim(s) would be left without any "
+                "supporting source (no other chunk meets the support threshold for them)."
+            )
+        unsupported_claims = (claim_attribution or {}).get("unsupported_claims", [])
+        if unsupported_claims:
+            statements.append(
+                f"{len(unsupported_claims)} of {len(claim_rows)} output claim(s) have no "
+                "supporting chunk in the claim-to-source matrix; no change to the "
+                "retrieved sources short of adding new evidence would ground them."
+            )
+
+    ablation = context_ablation or {}
+    ablations = ablation.get("ablations", [])
+    if ablations:
+        baseline = ablation["baseline"]
+        worst = min(ablations, key=lambda entry: (entry["deltas"]["claim_support_rate"], entry["label"] != "top_2"))
+        if worst["deltas"]["claim_support_rate"] < 0:
+            removed = " and ".join(f"'{title}'" for title in worst["titles"])
+            statements.append(
+                f"Removing {removed} would lower the measured claim support rate from "
+                f"{baseline['claim_support_rate']:.3f} to {worst['metrics']['claim_support_rate']:.3f} "
+                f"and evidence sufficiency from {baseline['evidence_sufficiency_score']:.3f} to "
+                f"{worst['metrics']['evidence_sufficiency_score']:.3f} (recomputed, not estimated)."
+            )
+        flips = [entry for entry in ablations if entry["deltas"]["contradiction_rate"] != 0]
+        if flips:
+            entry = max(flips, key=lambda item: abs(item["deltas"]["contradiction_rate"]))
+            removed = " and ".join(f"'{title}'" for title in entry["titles"])
+            statements.append(
+                f"Removing {removed} would move the contradiction rate from "
+                f"{baseline['contradiction_rate']:.3f} to {entry['metrics']['contradiction_rate']:.3f}, "
+                "because claims would be matched against different evidence."
+            )
+
     # Walk all eval result dicts looking for the claim_support_rate metric.
     claim_support_rate: float | None = None
     total_claims: int | None = None
@@ -1046,7 +1821,16 @@ _LLM_NARRATIVE_CACHE: dict[str, str] = {}
 # A local import inside the function would create a fresh binding on each call
 # that bypassed monkeypatching.  model_client is a leaf module (only imports
 # from schemas), so importing it at module scope here introduces no cycle.
-from trusted_ai_toolkit.model_client import invoke_model_safely  # noqa: E402
+from trusted_ai_toolkit.model_client import (  # noqa: E402
+    BUDGET_EXHAUSTED_REASON,
+    BudgetRefusal,
+    LLMBudget,
+    ModelInvocationError,
+    compose_model_prompt,
+    embed_texts,
+    invoke_model_safely,
+    resolve_embedding_model_name,
+)
 
 
 def compute_llm_narrative(
@@ -1056,6 +1840,7 @@ def compute_llm_narrative(
     metric_summary: dict[str, Any],
     model_output: str,
     contexts: list[dict[str, Any]] | None = None,
+    budget: LLMBudget | None = None,
 ) -> dict[str, Any]:
     """Generate a plain-language rationale for the deterministic verdict.
 
@@ -1080,6 +1865,9 @@ def compute_llm_narrative(
         The model's response text (truncated before sending).
     contexts:
         Retrieved context chunks for evidence excerpting (optional).
+    budget:
+        Run-scoped LLM budget.  When it is already spent (and the narrative
+        is not cached) the result carries ``reason="budget_exhausted"``.
     """
 
     if config is None or getattr(config.adapters, "provider", "stub") == "stub":
@@ -1139,9 +1927,21 @@ def compute_llm_narrative(
             "cache_hit": True,
         }
 
-    result = invoke_model_safely(prompt, config, deterministic=True)
-    if result is None:
-        return {"available": False, "narrative": None, "model": None, "cache_hit": False}
+    if budget is not None and budget.exhausted():
+        return {
+            "available": False,
+            "narrative": None,
+            "model": None,
+            "cache_hit": False,
+            "reason": BUDGET_EXHAUSTED_REASON,
+        }
+
+    result = invoke_model_safely(prompt, config, deterministic=True, budget=budget)
+    if result is None or isinstance(result, BudgetRefusal):
+        unavailable: dict[str, Any] = {"available": False, "narrative": None, "model": None, "cache_hit": False}
+        if isinstance(result, BudgetRefusal):
+            unavailable["reason"] = BUDGET_EXHAUSTED_REASON
+        return unavailable
 
     narrative = result.output_text.strip()
     _LLM_NARRATIVE_CACHE[cache_key] = narrative
@@ -1153,6 +1953,606 @@ def compute_llm_narrative(
     }
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Embedding-space attribution
+# ─────────────────────────────────────────────────────────────────────────────
+#
+# The lexical engines above give near-zero credit to paraphrases.  This engine
+# repeats context and sentence attribution in embedding space.  It reuses the
+# output/context vectors that ``compute_embedding_features`` already fetched
+# for the embedding metrics, and embeds whatever is still missing (prompt
+# sentences, or everything for a standalone report) in ONE batched
+# ``embed_texts`` call.  Chunk text comes from ``_indexed_context_texts``, the
+# same extraction the runner embeds, so a reused vector and a freshly embedded
+# one always stand for the same text.  Vectors are cached in-process by
+# (model, text) in a bounded LRU, so a repeated system prompt costs nothing.
+# Perturbations never touch the provider: LOO is computed on the vector
+# matrix by centroid subtraction, treating the mean of a set's vectors as the
+# embedding of the set.
+
+# Each entry is one embedding vector of up to a few thousand floats; 512 of
+# them keep a long-lived process to tens of megabytes.
+_EMBEDDING_CACHE: MemoryLRUCache = MemoryLRUCache(max_entries=512)
+
+
+def _unit_rows(matrix: Any) -> Any:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def _embedding_scores(output_vector: Any, vectors: Any) -> tuple[Any, Any, float]:
+    """
+    Cosine and LOO scores for each row of ``vectors`` against the output.
+
+    Returns ``(similarity, loo_impact, baseline)`` where ``baseline`` is the
+    cosine of the output with the centroid of all rows and ``loo_impact[i]``
+    is baseline minus the cosine with the centroid of the other rows.
+    """
+    output_unit = _unit_rows(output_vector)
+    similarity = _unit_rows(vectors) @ output_unit
+    total = vectors.sum(axis=0)
+    baseline = float(_unit_rows(total) @ output_unit)
+    if len(vectors) == 1:
+        return similarity, np.asarray([baseline]), baseline
+    others = _unit_rows(total[None, :] - vectors) @ output_unit
+    return similarity, baseline - others, baseline
+
+
+def compute_embedding_attribution(
+    config: Any,
+    prompt: str,
+    model_output: str,
+    contexts: list[dict[str, Any]],
+    embedding_features: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Attribute the output to context chunks and prompt sentences semantically.
+
+    Scores mirror the lexical engines: ``similarity`` is the cosine between
+    the unit output vector and each chunk/sentence vector, and
+    ``loo_impact`` is the drop in cosine with the set centroid when that
+    item is removed.  Both are single matrix products over the stacked
+    vectors.  The output's claims (``_claim_units``) are embedded in the same
+    batch and their cosine with every chunk forms the semantic layer of the
+    claim-to-source matrix.
+
+    Args:
+        config:             ``ToolkitConfig`` selecting the embedding provider.
+        prompt:             The prompt whose sentences are attributed.
+        model_output:       The model's response text.
+        contexts:           Retrieved context dicts.
+        embedding_features: Output of ``compute_embedding_features`` for this
+                            run; its vectors are reused when available.
+
+    Returns:
+        ``{available, reason, model, provider_calls, embedded_texts,
+        context_attribution, sentence_attribution, claim_support}`` where
+        ``claim_support`` lists, per claim, its ``top_contributors`` chunks
+        by embedding cosine.  ``available`` is
+        False (with ``reason``) for stub providers, provider errors or
+        missing inputs; no exception is raised.
+    """
+    payload: dict[str, Any] = {
+        "available": False,
+        "reason": None,
+        "model": None,
+        "provider_calls": 0,
+        "embedded_texts": 0,
+        "context_attribution": [],
+        "sentence_attribution": {"baseline_sim": 0.0, "segments": []},
+        "claim_support": [],
+    }
+    if not NUMPY_AVAILABLE:
+        payload["reason"] = "numpy_unavailable"
+        return payload
+    if not model_output.strip():
+        payload["reason"] = "empty_output"
+        return payload
+    if config is None or config.adapters.provider == "stub":
+        payload["reason"] = "stub_provider"
+        return payload
+
+    model = resolve_embedding_model_name(config)
+    payload["model"] = model
+    features = embedding_features or {}
+    reuse = bool(features.get("embedding_available")) and features.get("embedding_model", model) == model
+
+    # Texts needing a vector, keyed by role; reused vectors seed the cache.
+    # ``vectors`` holds this call's lookups so eviction cannot drop one
+    # between the fetch and its use.
+    _, chunk_titles = _context_chunks(contexts)
+    chunk_texts = dict(_indexed_context_texts({"retrieved_contexts": contexts}))
+    chunk_indices = list(chunk_texts)
+    vectors: dict[str, list[float]] = {}
+    if reuse:
+        vectors[model_output] = list(features["output_vector"])
+        indices = features.get("context_indices") or list(range(len(features.get("context_vectors", []))))
+        for index, vector in zip(indices, features["context_vectors"], strict=True):
+            if index in chunk_texts:
+                vectors[chunk_texts[index]] = list(vector)
+        for text, vector in vectors.items():
+            _EMBEDDING_CACHE[(model, text)] = vector
+    sentences = _split_sentences(prompt)
+    claims = _claim_units(model_output)
+
+    needed: list[str] = [model_output]
+    needed.extend(chunk_texts[index] for index in chunk_indices)
+    needed.extend(sentences)
+    needed.extend(claims)
+    missing: list[str] = []
+    for text in dict.fromkeys(needed):
+        if text in vectors:
+            continue
+        cached = _EMBEDDING_CACHE.get((model, text))
+        if cached is None:
+            missing.append(text)
+        else:
+            vectors[text] = cached
+    if missing:
+        try:
+            result = embed_texts(missing, config, model_name=model)
+        except ModelInvocationError as exc:
+            payload["reason"] = f"embedding_error: {exc}"
+            return payload
+        payload["provider_calls"] = 1
+        if len(result.embeddings) != len(missing):
+            payload["reason"] = "embedding_count_mismatch"
+            return payload
+        for text, vector in zip(missing, result.embeddings, strict=True):
+            vectors[text] = vector
+            _EMBEDDING_CACHE[(model, text)] = vector
+    payload["embedded_texts"] = len(missing)
+
+    output_vector = np.asarray(vectors[model_output], dtype=np.float64)
+
+    if chunk_indices:
+        matrix = np.asarray([vectors[chunk_texts[index]] for index in chunk_indices], dtype=np.float64)
+        similarity, loo, _ = _embedding_scores(output_vector, matrix)
+        ranked: list[dict[str, Any]] = [
+            {
+                "chunk_index": index,
+                "title": chunk_titles[index],
+                "similarity": round(float(similarity[row]), 4),
+                "loo_impact": round(float(loo[row]), 4),
+            }
+            for row, index in enumerate(chunk_indices)
+        ]
+        ranked.sort(key=lambda entry: entry["similarity"], reverse=True)
+        for rank, entry in enumerate(ranked, start=1):
+            entry["rank"] = rank
+        payload["context_attribution"] = ranked
+
+        if claims:
+            claim_matrix = np.asarray([vectors[claim] for claim in claims], dtype=np.float64)
+            cosines = _unit_rows(claim_matrix) @ _unit_rows(matrix).T
+            claim_support = []
+            for claim_index, claim in enumerate(claims):
+                order = np.argsort(-cosines[claim_index], kind="stable")[:_CLAIM_TOP_CONTRIBUTORS]
+                claim_support.append({
+                    "claim_index": claim_index,
+                    "claim": claim[:240],
+                    "top_contributors": [
+                        {
+                            "chunk_index": chunk_indices[row],
+                            "title": chunk_titles[chunk_indices[row]],
+                            "similarity": round(float(cosines[claim_index, row]), 4),
+                        }
+                        for row in order
+                    ],
+                })
+            payload["claim_support"] = claim_support
+
+    if sentences:
+        matrix = np.asarray([vectors[sentence] for sentence in sentences], dtype=np.float64)
+        similarity, loo, baseline = _embedding_scores(output_vector, matrix)
+        segments: list[dict[str, Any]] = [
+            {
+                "index": index,
+                "text": sentence[:160] + ("…" if len(sentence) > 160 else ""),
+                "similarity": round(float(similarity[index]), 4),
+                "loo_impact": round(float(loo[index]), 4),
+            }
+            for index, sentence in enumerate(sentences)
+        ]
+        segments.sort(key=lambda entry: entry["loo_impact"], reverse=True)
+        payload["sentence_attribution"] = {"baseline_sim": round(baseline, 4), "segments": segments}
+
+    payload["available"] = True
+    return payload
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Model-in-the-loop counterfactuals
+# ─────────────────────────────────────────────────────────────────────────────
+#
+# ``compute_counterfactual_summary`` estimates what-if effects from existing
+# metrics.  This opt-in engine measures them: for each of the top-k chunks
+# (by context attribution) it regenerates the answer through the configured
+# provider with that chunk removed from the prompt, then re-scores the new
+# answer with the grounding metrics against the contexts it actually saw.
+#
+# The original answer came from an uncapped ``invoke_model`` call, while the
+# regenerations use deterministic decoding with a capped output length, so
+# comparing them directly would mix the chunk removal with the decoding
+# change.  The engine therefore also regenerates an unablated baseline (all
+# chunks) under the same settings and reports deltas against that baseline.
+#
+# The N extra generations dominate the cost, so they run concurrently on a
+# thread pool (the calls are network-bound), every call goes through the
+# run-scoped LLMBudget, the engine never makes more than
+# ``xai.regeneration.max_calls`` provider calls (the baseline is requested
+# first), and answers are cached by (model, prompt, context subset) — in a
+# bounded in-process LRU and, when given, in the XAI result cache on disk —
+# so re-running a report costs no calls.
+
+_REGENERATION_CACHE: MemoryLRUCache = MemoryLRUCache(max_entries=256)
+
+# Grounding metrics re-scored for every regenerated answer, in report order.
+_REGENERATION_METRICS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "claim_support_rate": metric_claim_support_rate,
+    "unsupported_claim_rate": metric_unsupported_claim_rate,
+    "contradiction_rate": metric_contradiction_rate,
+    "evidence_sufficiency_score": metric_evidence_sufficiency_score,
+}
+
+
+def _regeneration_key(config: Any, prompt: str, contexts: list[dict[str, Any]]) -> str:
+    adapters = config.adapters
+    canonical = json.dumps(
+        {
+            "provider": adapters.provider,
+            "endpoint": adapters.endpoint,
+            "model": adapters.model,
+            "deployment": adapters.deployment,
+            "prompt": prompt,
+            "contexts": contexts,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return "regen-" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _grounding_metrics(model_output: str, contexts: list[dict[str, Any]]) -> dict[str, float]:
+    context = {"model_output": model_output, "retrieved_contexts": contexts}
+    return {metric_id: float(metric(context).value) for metric_id, metric in _REGENERATION_METRICS.items()}
+
+
+def compute_regeneration_counterfactuals(
+    config: Any,
+    prompt: str,
+    model_output: str,
+    contexts: list[dict[str, Any]],
+    context_attribution: list[dict[str, Any]],
+    budget: LLMBudget | None = None,
+    cache: XAIResultCache | None = None,
+) -> dict[str, Any]:
+    """
+    Measure counterfactuals by regenerating the answer without each top chunk.
+
+    For each of the ``config.xai.regeneration.top_k`` highest-ranked chunks
+    in ``context_attribution``, the prompt is rebuilt with
+    ``compose_model_prompt`` from the remaining contexts and sent through
+    ``invoke_model_safely`` (deterministic mode).  Each regenerated answer is
+    scored with ``claim_support_rate``, ``unsupported_claim_rate``,
+    ``contradiction_rate`` and ``evidence_sufficiency_score`` against the
+    contexts the model saw.  Deltas are relative to a baseline answer
+    regenerated from all contexts with the same settings, so they isolate the
+    chunk removal from the decoding change; the original answer's metrics are
+    reported alongside as ``original``.
+
+    Args:
+        config:              ``ToolkitConfig``; ``xai.regeneration`` holds
+                             the switch, ``top_k``, workers and call cap.
+        prompt:              The user prompt (without contexts).
+        model_output:        The original answer.
+        contexts:            Retrieved context dicts.
+        context_attribution: Output of ``compute_context_attribution``; sets
+                             which chunks are removed.
+        budget:              Run-scoped LLM budget shared with other stages.
+        cache:               Optional on-disk cache for regenerated answers.
+
+    Returns:
+        ``{enabled, available, reason, top_k, provider_calls, cache_hits,
+        original, baseline, baseline_status, counterfactuals}``.  Each
+        counterfactual carries ``chunk_index``, ``title``, ``status``
+        ("complete", "cached", "budget_exhausted", "call_cap_reached" or
+        "failed"), and for scored answers ``output_excerpt`` and ``metrics``;
+        when the baseline was regenerated it also carries
+        ``output_similarity`` (TF-IDF cosine with the baseline answer) and
+        ``deltas``.  Disabled, stub and empty-input runs, and runs whose
+        baseline could not be regenerated, return ``available=False`` with a
+        ``reason``.
+    """
+    settings = getattr(getattr(config, "xai", None), "regeneration", None)
+    payload: dict[str, Any] = {
+        "enabled": bool(settings and settings.enabled),
+        "available": False,
+        "reason": None,
+        "top_k": settings.top_k if settings else 0,
+        "provider_calls": 0,
+        "cache_hits": 0,
+        "original": {},
+        "baseline": {},
+        "baseline_status": None,
+        "counterfactuals": [],
+    }
+    if settings is None or not settings.enabled:
+        payload["reason"] = "disabled"
+        return payload
+    if config.adapters.provider == "stub":
+        payload["reason"] = "stub_provider"
+        return payload
+    ranked = sorted(
+        (entry for entry in context_attribution if 0 <= entry.get("chunk_index", -1) < len(contexts)),
+        key=lambda entry: entry.get("rank", 0),
+    )[: settings.top_k]
+    if not model_output.strip() or not ranked:
+        payload["reason"] = "no_contexts" if model_output.strip() else "empty_output"
+        return payload
+
+    payload["original"] = _grounding_metrics(model_output, contexts)
+
+    # Resolve cached answers first so only genuine misses consume calls.  The
+    # unablated baseline (chunk_index None) leads so the call cap reaches it
+    # before any counterfactual.
+    jobs: list[dict[str, Any]] = []
+    for entry in [{"chunk_index": None, "title": "Baseline"}, *ranked]:
+        chunk_index = entry["chunk_index"]
+        remaining = [item for index, item in enumerate(contexts) if index != chunk_index]
+        model_prompt = compose_model_prompt(prompt, remaining)
+        key = _regeneration_key(config, model_prompt, remaining)
+        answer = _REGENERATION_CACHE.get(key)
+        if answer is None and cache is not None:
+            stored = cache.get(key)
+            if stored is not None and isinstance(stored.get("output_text"), str):
+                answer = stored["output_text"]
+                _REGENERATION_CACHE[key] = answer
+        jobs.append({
+            "chunk_index": chunk_index,
+            "title": entry.get("title") or f"Context {chunk_index + 1}",
+            "remaining": remaining,
+            "prompt": model_prompt,
+            "key": key,
+            "answer": answer,
+            "status": "cached" if answer is not None else None,
+        })
+
+    misses = [job for job in jobs if job["answer"] is None]
+    for job in misses[settings.max_calls:]:
+        job["status"] = "call_cap_reached"
+    submitted = misses[: settings.max_calls]
+    if submitted:
+        with ThreadPoolExecutor(max_workers=min(settings.max_workers, len(submitted))) as pool:
+            results = list(pool.map(
+                lambda job: invoke_model_safely(job["prompt"], config, deterministic=True, budget=budget),
+                submitted,
+            ))
+        for job, result in zip(submitted, results, strict=True):
+            if result is None or isinstance(result, BudgetRefusal):
+                job["status"] = BUDGET_EXHAUSTED_REASON if isinstance(result, BudgetRefusal) else "failed"
+                continue
+            payload["provider_calls"] += 1
+            job["answer"] = result.output_text.strip()
+            job["status"] = "complete"
+            _REGENERATION_CACHE[job["key"]] = job["answer"]
+            if cache is not None:
+                cache.put(job["key"], {"output_text": job["answer"]})
+
+    baseline_job, *removal_jobs = jobs
+    baseline_answer = baseline_job["answer"]
+    payload["baseline_status"] = baseline_job["status"]
+    if baseline_answer is not None:
+        payload["baseline"] = _grounding_metrics(baseline_answer, contexts)
+    for job in removal_jobs:
+        record: dict[str, Any] = {"chunk_index": job["chunk_index"], "title": job["title"], "status": job["status"]}
+        if job["answer"] is not None:
+            metrics = _grounding_metrics(job["answer"], job["remaining"])
+            record.update({
+                "output_excerpt": job["answer"][:240] + ("…" if len(job["answer"]) > 240 else ""),
+                "metrics": metrics,
+            })
+            if baseline_answer is not None:
+                record["output_similarity"] = _tfidf_cosine_sim(baseline_answer, job["answer"])
+                record["deltas"] = {
+                    metric_id: round(value - payload["baseline"][metric_id], 3)
+                    for metric_id, value in metrics.items()
+                }
+        payload["counterfactuals"].append(record)
+
+    payload["cache_hits"] = sum(1 for job in jobs if job["status"] == "cached")
+    payload["available"] = any("deltas" in record for record in payload["counterfactuals"])
+    if not payload["available"]:
+        payload["reason"] = baseline_job["status"] if baseline_answer is None else removal_jobs[0]["status"]
+    return payload
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Engine scheduling — process pool with per-engine wall-clock limits
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Engines that depend only on (prompt, output, contexts) and can run in
+# parallel.  Counterfactuals consume the context attribution result, so they
+# run in the parent once that engine has settled.
+_PARALLEL_ENGINES: dict[str, Callable[..., Any]] = {
+    "context_attribution": compute_context_attribution,
+    "token_heatmap": compute_token_heatmap,
+    "claim_attribution": compute_claim_attribution,
+    "lime_attribution": compute_lime_attribution,
+    "kernel_lime_attribution": compute_kernel_lime_attribution,
+    "shapley_attribution": compute_shapley_attribution,
+}
+
+
+def xai_engine_parameters() -> dict[str, Any]:
+    """
+    Parameters that determine the engine payloads for a given input.
+
+    Part of the ``XAIResultCache`` key: changing any constant, the payload
+    schema version, or the toolkit version invalidates cached payloads.
+    Whether NumPy is present is included because it selects the Shapley
+    engine and enables kernel-LIME.
+    """
+    return {
+        "toolkit_version": __version__,
+        "payload_schema_version": _XAI_PAYLOAD_SCHEMA_VERSION,
+        "numpy": NUMPY_AVAILABLE,
+        "min_sentence_tokens": _MIN_SENTENCE_TOKENS,
+        "shapley_exact_max_segments": _SHAPLEY_EXACT_MAX_SEGMENTS,
+        "shapley_vectorized_max_segments": _SHAPLEY_VECTORIZED_MAX_SEGMENTS,
+        "shapley_mc_min_permutations": _SHAPLEY_MC_MIN_PERMUTATIONS,
+        "shapley_mc_max_permutations": _SHAPLEY_MC_MAX_PERMUTATIONS,
+        "shapley_mc_target_se": _SHAPLEY_MC_TARGET_SE,
+        "loo_bootstrap_samples": _LOO_BOOTSTRAP_SAMPLES,
+        "kernel_lime_samples": _KERNEL_LIME_SAMPLES,
+        "kernel_lime_width": _KERNEL_LIME_WIDTH,
+        "kernel_lime_ridge_alpha": _KERNEL_LIME_RIDGE_ALPHA,
+        "claim_support_threshold": _CLAIM_SUPPORT_THRESHOLD,
+        "claim_support_min_overlap": _CLAIM_SUPPORT_MIN_OVERLAP,
+        "rng_seed": _RNG_SEED,
+    }
+
+
+def _timed_engine(engine: str, *args: Any) -> tuple[Any, float]:
+    """Run one engine (in a worker process) and report its own runtime."""
+    started = time.perf_counter()
+    payload = _PARALLEL_ENGINES[engine](*args)
+    return payload, time.perf_counter() - started
+
+
+def _degraded_payload(engine: str, status: str, note: str) -> Any:
+    """
+    Stand-in payload for an engine that did not finish.
+
+    Shapes match each engine's own empty payload so the report template
+    renders the note in place of the missing table; ``status`` labels the
+    payload as degraded rather than genuinely empty.  Context attribution is
+    a list of chunk rows and stays empty; its label is carried by
+    ``run_xai_analysis``'s ``context_attribution_status``.
+    """
+    if engine == "context_attribution":
+        return []
+    if engine in ("token_heatmap", "claim_attribution"):
+        payload = _PARALLEL_ENGINES[engine]("", [])
+        payload.update({"status": status, "note": note})
+        return payload
+    method = {
+        "lime_attribution": "lime_loo_attribution",
+        "kernel_lime_attribution": "kernel_lime",
+        "shapley_attribution": "shapley_monte_carlo",
+    }[engine]
+    return {
+        "method": method,
+        "status": status,
+        "baseline_sim": 0.0,
+        "segment_count": 0,
+        "segments": [],
+        "note": note,
+    }
+
+
+# One worker pool per process, started on first use and reused by every
+# report so the interpreter start-up cost is paid once rather than per call.
+# A pool whose workers are still running abandoned engines is terminated and
+# replaced on the next request.
+_ENGINE_POOL: Pool | None = None
+_ENGINE_POOL_WORKERS: int = 0
+_ENGINE_POOL_LOCK = threading.Lock()
+
+
+def _engine_pool(workers: int) -> Pool | None:
+    """Return the shared engine pool, (re)starting it for a new worker count."""
+    global _ENGINE_POOL, _ENGINE_POOL_WORKERS
+    with _ENGINE_POOL_LOCK:
+        if _ENGINE_POOL is not None and _ENGINE_POOL_WORKERS == workers:
+            return _ENGINE_POOL
+        if _ENGINE_POOL is not None:
+            _ENGINE_POOL.terminate()
+            _ENGINE_POOL = None
+        try:
+            _ENGINE_POOL = multiprocessing.Pool(processes=workers)
+        except (OSError, NotImplementedError):
+            return None
+        _ENGINE_POOL_WORKERS = workers
+        return _ENGINE_POOL
+
+
+def _discard_engine_pool(pool: Pool | None = None) -> None:
+    """Terminate the shared pool (only if it is still ``pool``, when given)."""
+    global _ENGINE_POOL
+    with _ENGINE_POOL_LOCK:
+        if _ENGINE_POOL is None or (pool is not None and _ENGINE_POOL is not pool):
+            return
+        # ``terminate`` stops workers mid-task, so an over-limit engine stops
+        # consuming CPU once its result is abandoned.
+        _ENGINE_POOL.terminate()
+        _ENGINE_POOL = None
+
+
+atexit.register(_discard_engine_pool)
+
+
+def _run_engines(
+    engine_args: dict[str, tuple[Any, ...]],
+    execution: XAIExecutionConfig | None,
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """
+    Run the independent engines and return ``(payloads, engine_status)``.
+
+    With ``execution.mode == "process_pool"`` every engine is submitted at
+    once to the shared worker pool and awaited against its own limit,
+    measured from submission.  An engine that overruns or raises is replaced
+    by a labelled degraded payload (its status entry carries the same
+    ``note``); the others are unaffected.  Sequential mode, the default, and
+    the fallback when a pool cannot be started, runs in-process without
+    limits.
+    """
+    payloads: dict[str, Any] = {}
+    status: dict[str, dict[str, Any]] = {}
+
+    pool: Pool | None = None
+    if execution is not None and execution.mode == "process_pool":
+        pool = _engine_pool(execution.max_workers or len(_PARALLEL_ENGINES))
+
+    if pool is None or execution is None:
+        for engine, args in engine_args.items():
+            payloads[engine], elapsed = _timed_engine(engine, *args)
+            status[engine] = {"status": "complete", "elapsed_seconds": round(elapsed, 3)}
+        return payloads, status
+
+    limits = {
+        engine: execution.engine_time_limits.get(engine, execution.time_limit_seconds) for engine in engine_args
+    }
+    submitted_at = time.monotonic()
+    results = {engine: pool.apply_async(_timed_engine, (engine, *args)) for engine, args in engine_args.items()}
+    abandoned = False
+    # Await in deadline order so a tight limit is enforced on time rather
+    # than after slower engines with looser limits have been collected.
+    for engine in sorted(results, key=limits.__getitem__):
+        limit = limits[engine]
+        remaining = max(0.0, submitted_at + limit - time.monotonic())
+        try:
+            payloads[engine], elapsed = results[engine].get(timeout=remaining)
+            status[engine] = {"status": "complete", "elapsed_seconds": round(elapsed, 3)}
+        except multiprocessing.TimeoutError:
+            abandoned = True
+            note = f"No analysis: engine exceeded its {limit:g}s wall-clock limit."
+            payloads[engine] = _degraded_payload(engine, "timed_out", note)
+            status[engine] = {"status": "timed_out", "time_limit_seconds": limit, "note": note}
+        except Exception as exc:  # noqa: BLE001 - the engine's own exception, re-raised by the pool
+            note = f"No analysis: engine failed ({exc})."
+            payloads[engine] = _degraded_payload(engine, "failed", note)
+            status[engine] = {"status": "failed", "error": str(exc), "note": note}
+
+    payloads = {engine: payloads[engine] for engine in engine_args}
+    status = {engine: status[engine] for engine in engine_args}
+
+    if abandoned:
+        _discard_engine_pool(pool)
+    return payloads, status
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Orchestrator — run all XAI methods and return a unified payload
 # ─────────────────────────────────────────────────────────────────────────────
@@ -1164,21 +2564,31 @@ def run_xai_analysis(
     eval_results: list[dict[str, Any]],
     lineage_nodes: list[dict[str, Any]],
     redteam_summary: dict[str, Any],
+    execution: XAIExecutionConfig | None = None,
+    cache: XAIResultCache | None = None,
 ) -> dict[str, Any]:
     """
     Orchestrate all XAI engines and return a unified explainability payload.
 
     This is the primary entry point called by ``generate_reasoning_report``.
-    It runs the four XAI methods in sequence and assembles their outputs into
-    a single dict suitable for Jinja2 template rendering and JSON serialisation.
+    It runs the XAI methods and assembles their outputs into a single dict
+    suitable for Jinja2 template rendering and JSON serialisation.  When
+    ``execution`` selects the process pool, the independent engines (steps
+    1–3 below) run concurrently under per-engine wall-clock limits; without
+    it they run in sequence in-process.
 
     Execution order and rationale:
       1. ``compute_context_attribution`` first — cheapest, always produces signal.
+         ``compute_token_heatmap`` splits the same scores per output word and
+         ``compute_claim_attribution`` scores every claim against every chunk.
       2. ``compute_lime_attribution`` second — requires only prompt + output.
+         ``compute_kernel_lime_attribution`` follows on the same inputs.
       3. ``compute_shapley_attribution`` third — more expensive; benefits from the
          sentence segmentation already done in LIME.
-      4. ``compute_counterfactual_summary`` last — depends on the context
-         attribution results computed in step 1.
+      4. ``compute_context_ablation`` recomputes the grounding metrics with
+         chunks removed, using the context ranking from step 1.
+      5. ``compute_counterfactual_summary`` last — depends on the context
+         attribution, claim matrix and ablation results.
 
     All methods are designed to be safe-by-default: they return zeroed-out
     payloads for missing inputs rather than raising exceptions, so an
@@ -1197,25 +2607,77 @@ def run_xai_analysis(
             Lineage node dicts from the lineage report.
         redteam_summary:
             Red-team summary dict from the evidence pack.
+        execution:
+            Scheduling and time limits (``config.xai.execution``).  ``None``
+            runs every engine sequentially with no limits.
+        cache:
+            Optional content-addressed cache.  On a hit the attribution
+            engines are skipped; only fully completed payload sets are stored.
 
     Returns:
         A dict with top-level keys:
 
         - ``context_attribution``    (list)  — per-chunk influence scores
+        - ``context_attribution_status`` (dict) — ``{status, note}``; tells a
+          timed-out or failed engine apart from a run without contexts
+        - ``token_heatmap``           (dict)  — word × chunk support heatmap
+        - ``claim_attribution``       (dict)  — claim × chunk support matrix
         - ``lime_attribution``        (dict)  — LIME LOO attribution payload
+        - ``kernel_lime_attribution`` (dict)  — kernel-LIME surrogate payload
         - ``shapley_attribution``     (dict)  — Shapley value payload
+        - ``context_ablation``        (dict)  — metric deltas per removed chunk
         - ``counterfactual_summary``  (list)  — narrative counterfactuals
+        - ``engine_status``           (dict)  — per-engine status ("complete",
+          "timed_out" or "failed") and elapsed seconds
+        - ``cache``                   (dict)  — ``{enabled, hit, key}``
         - ``xai_available``           (bool)  — True if any analysis ran
         - ``method_labels``           (list)  — human-readable method names
     """
-    ctx_attr = compute_context_attribution(model_output, contexts)
-    lime_attr = compute_lime_attribution(prompt, model_output)
-    shapley_attr = compute_shapley_attribution(prompt, model_output)
+    cache_key: str | None = None
+    cached: dict[str, Any] | None = None
+    if cache is not None:
+        cache_key = XAIResultCache.digest(prompt, model_output, contexts, xai_engine_parameters())
+        cached = cache.get(cache_key)
+
+    if cached is not None and set(_PARALLEL_ENGINES) <= set(cached):
+        payloads = {engine: cached[engine] for engine in _PARALLEL_ENGINES}
+        engine_status = {engine: {"status": "complete", "cache_hit": True} for engine in _PARALLEL_ENGINES}
+    else:
+        cached = None
+        payloads, engine_status = _run_engines(
+            {
+                "context_attribution": (model_output, contexts),
+                "token_heatmap": (model_output, contexts),
+                "claim_attribution": (model_output, contexts),
+                "lime_attribution": (prompt, model_output),
+                "kernel_lime_attribution": (prompt, model_output),
+                "shapley_attribution": (prompt, model_output),
+            },
+            execution,
+        )
+        if cache is not None and cache_key is not None:
+            if all(state["status"] == "complete" for state in engine_status.values()):
+                cache.put(cache_key, payloads)
+    ctx_attr = payloads["context_attribution"]
+    ctx_attr_status = {
+        "status": engine_status["context_attribution"]["status"],
+        "note": engine_status["context_attribution"].get("note"),
+    }
+    token_heatmap = payloads["token_heatmap"]
+    claim_attr = payloads["claim_attribution"]
+    lime_attr = payloads["lime_attribution"]
+    kernel_lime_attr = payloads["kernel_lime_attribution"]
+    shapley_attr = payloads["shapley_attribution"]
+    # Cheap and dependent on the context ranking, so it runs here rather than
+    # in the pool.
+    context_ablation = compute_context_ablation(model_output, contexts, ctx_attr)
     cf_summary = compute_counterfactual_summary(
         eval_results=eval_results,
         lineage_nodes=lineage_nodes,
         redteam_summary=redteam_summary,
         context_attribution=ctx_attr,
+        claim_attribution=claim_attr,
+        context_ablation=context_ablation,
     )
 
     xai_available = bool(
@@ -1226,14 +2688,25 @@ def run_xai_analysis(
 
     return {
         "context_attribution": ctx_attr,
+        "context_attribution_status": ctx_attr_status,
+        "token_heatmap": token_heatmap,
+        "claim_attribution": claim_attr,
         "lime_attribution": lime_attr,
+        "kernel_lime_attribution": kernel_lime_attr,
         "shapley_attribution": shapley_attr,
+        "context_ablation": context_ablation,
         "counterfactual_summary": cf_summary,
+        "engine_status": engine_status,
+        "cache": {"enabled": cache is not None, "hit": cached is not None, "key": cache_key},
         "xai_available": xai_available,
         "method_labels": [
             "Context Attribution (TF-IDF leave-one-out, per retrieved chunk)",
+            "Word-level Support Heatmap (per-token TF-IDF share, per retrieved chunk)",
+            "Claim-to-source Matrix (per-claim TF-IDF support, shared with grounding metrics)",
             "LIME-style Feature Attribution (leave-one-out prompt segmentation, Ribeiro et al. 2016)",
+            "Kernel-LIME Surrogate (weighted ridge over sampled sentence masks, Ribeiro et al. 2016)",
             "SHAP-style Shapley Values (Monte Carlo permutation sampling, Lundberg & Lee 2017)",
+            "Context Ablation (grounding metrics recomputed with each chunk and the top-2 set removed)",
             "Counterfactual Analysis (evidence-gap narratives from eval metrics and lineage)",
         ],
     }
@@ -0,0 +1,406 @@
+"""
+Count-algebra TF-IDF kernel shared by the perturbation-based XAI engines.
+
+Context attribution, LIME-style LOO and Shapley all ask the same question
+thousands of times: "what is the TF-IDF cosine between the model output and
+the text formed by *this subset* of segments?"  The original engines rebuilt
+the subset text with string joins and re-ran ``_tfidf_cosine_sim`` for every
+coalition, re-tokenising and recomputing IDF each time.
+
+This kernel tokenises every segment exactly once and evaluates any subset by
+adding and subtracting integer token counts.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+WHY THE ALGEBRA IS EXACT
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+``_tfidf_cosine_sim(output, subset)`` scores a two-document corpus, so the
+smoothed IDF of a token takes one of two values:
+
+    idf(t) = log(3 / 3) + 1 = 1          if t occurs in both documents
+    idf(t) = log(3 / 2) + 1 = κ^(1/2)    if t occurs in only one
+
+With c_O / c_S the output / subset counts, the 1/|d| TF factors cancel in
+the cosine and it reduces to
+
+    cos = D / ( sqrt(A_shared + κ·A_only) · sqrt(Q_shared + κ·Q_only) )
+
+    D         = Σ_t c_O(t)·c_S(t)
+    A_shared  = Σ_{t ∈ O, c_S(t) > 0} c_O(t)²       A_only = A_total − A_shared
+    Q_shared  = Σ_{t ∈ O} c_S(t)²                   Q_only = Σ_{t ∉ O} c_S(t)²
+
+Every quantity except κ is an integer, so adding or removing a segment is an
+exact O(distinct tokens in segment) update, the document-frequency split
+(shared vs. only) is tracked implicitly by ``A_shared``, and the result is
+the same real number the string-based path computes.  Engines round through
+``rounded_similarity`` to 4 decimal places exactly as ``_tfidf_cosine_sim``
+does, so payloads are unchanged.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+VECTORISED COALITION TABLE (optional NumPy)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+``coalition_similarity_table`` evaluates v(S) for all 2^N bitmasks at once;
+``batch_similarity`` does the same for an arbitrary boolean mask matrix.
+Each sum above is rebuilt over the mask axis without touching tokens:
+
+- D and |S| are additive over segments (one doubling pass per segment);
+- Q_shared / Q_only are quadratic forms of the segment Gram matrices,
+  extended one segment at a time (Gray-code style: mask | bit_i reuses mask);
+- A_only(S) is a coverage function, computed as a superset-sum transform
+  over the "segments containing t" bitmask of each output token.
+
+NumPy is an optional dependency (``pip install trusted_ai_toolkit[xai]``);
+``NUMPY_AVAILABLE`` lets callers fall back to the pure-Python engines.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the xai extra
+    np = None  # type: ignore[assignment]
+
+NUMPY_AVAILABLE: bool = np is not None
+
+# IDF² for a token present in only one of the two documents.
+_IDF_ONLY_SQUARED: float = (math.log(3 / 2) + 1.0) ** 2
+
+# Rounding applied by ``_tfidf_cosine_sim``; every engine rounds v(S) to this
+# precision so kernel-backed results match the legacy string path.
+SIMILARITY_DECIMALS: int = 4
+
+
+class TfidfCountKernel:
+    """
+    Precomputed token counts for one reference text and a list of segments.
+
+    The reference is the fixed side of every comparison (the model output);
+    segments are the perturbable units (prompt sentences or context chunks).
+    Token ids are assigned over the union vocabulary so coalition state can
+    be kept in flat integer lists.
+
+    Args:
+        reference_tokens: Tokens of the model output.
+        segment_tokens:   Tokens of each segment, in segment order.
+    """
+
+    def __init__(self, reference_tokens: list[str], segment_tokens: list[list[str]]) -> None:
+        vocabulary: dict[str, int] = {}
+        reference_counts = Counter(reference_tokens)
+        for token in reference_counts:
+            vocabulary.setdefault(token, len(vocabulary))
+        segment_items: list[list[tuple[int, int]]] = []
+        for tokens in segment_tokens:
+            items: list[tuple[int, int]] = []
+            for token, count in Counter(tokens).items():
+                items.append((vocabulary.setdefault(token, len(vocabulary)), count))
+            segment_items.append(items)
+
+        self.vocabulary = vocabulary
+        self.reference_counts: list[int] = [0] * len(vocabulary)
+        for token, count in reference_counts.items():
+            self.reference_counts[vocabulary[token]] = count
+        self.reference_total: int = sum(reference_counts.values())
+        self.reference_square_sum: int = sum(count * count for count in reference_counts.values())
+        self.segment_items = segment_items
+        self.segment_totals: list[int] = [sum(count for _, count in items) for items in segment_items]
+
+    @property
+    def segment_count(self) -> int:
+        return len(self.segment_items)
+
+    def coalition(self) -> CoalitionCounts:
+        """Return an empty, incrementally updatable coalition."""
+
+        return CoalitionCounts(self)
+
+    def similarity_of(self, members: Iterable[int]) -> float:
+        """Unrounded cosine between the reference and the given segments.
+
+        ``members`` may repeat an index (bootstrap resamples); each repeat
+        adds another copy of the segment's counts.
+        """
+
+        state = CoalitionCounts(self)
+        for index in members:
+            state.add(index)
+        return state.similarity()
+
+    def rounded_similarity_of(self, members: Iterable[int]) -> float:
+        return round(self.similarity_of(members), SIMILARITY_DECIMALS)
+
+    def token_support(self, index: int) -> dict[int, float]:
+        """Split the cosine with one segment into per-reference-token terms.
+
+        The cosine is a sum over shared tokens of c_O(t)·c_S(t) / (‖O‖·‖S‖),
+        so term t is the share of ``similarity_of([index])`` carried by the
+        reference token t; the terms sum to that similarity exactly.  Cost is
+        O(distinct tokens in the segment).
+        """
+
+        reference_counts = self.reference_counts
+        shared: list[tuple[int, int]] = []
+        reference_shared = 0
+        shared_square = 0
+        only_square = 0
+        for token_id, count in self.segment_items[index]:
+            reference_count = reference_counts[token_id]
+            if reference_count:
+                shared.append((token_id, count))
+                reference_shared += reference_count * reference_count
+                shared_square += count * count
+            else:
+                only_square += count * count
+        if not shared:
+            return {}
+        reference_only = self.reference_square_sum - reference_shared
+        norm = math.sqrt(reference_shared + _IDF_ONLY_SQUARED * reference_only) * math.sqrt(
+            shared_square + _IDF_ONLY_SQUARED * only_square
+        )
+        return {token_id: reference_counts[token_id] * count / norm for token_id, count in shared}
+
+
+class CoalitionCounts:
+    """
+    Mutable multiset of segments with the integer sums needed for the cosine.
+
+    ``add`` and ``remove`` cost O(distinct tokens in the segment); reading the
+    similarity is O(1).
+    """
+
+    __slots__ = ("kernel", "counts", "total", "dot", "reference_shared", "shared_square", "only_square")
+
+    def __init__(self, kernel: TfidfCountKernel) -> None:
+        self.kernel = kernel
+        self.counts: list[int] = [0] * len(kernel.reference_counts)
+        self.total = 0
+        self.dot = 0
+        self.reference_shared = 0
+        self.shared_square = 0
+        self.only_square = 0
+
+    def add(self, index: int) -> None:
+        reference_counts = self.kernel.reference_counts
+        counts = self.counts
+        for token_id, count in self.kernel.segment_items[index]:
+            old = counts[token_id]
+            new = old + count
+            counts[token_id] = new
+            reference_count = reference_counts[token_id]
+            if reference_count:
+                self.dot += reference_count * count
+                self.shared_square += new * new - old * old
+                if old == 0:
+                    self.reference_shared += reference_count * reference_count
+            else:
+                self.only_square += new * new - old * old
+        self.total += self.kernel.segment_totals[index]
+
+    def remove(self, index: int) -> None:
+        reference_counts = self.kernel.reference_counts
+        counts = self.counts
+        for token_id, count in self.kernel.segment_items[index]:
+            old = counts[token_id]
+            new = old - count
+            counts[token_id] = new
+            reference_count = reference_counts[token_id]
+            if reference_count:
+                self.dot -= reference_count * count
+                self.shared_square += new * new - old * old
+                if new == 0:
+                    self.reference_shared -= reference_count * reference_count
+            else:
+                self.only_square += new * new - old * old
+        self.total -= self.kernel.segment_totals[index]
+
+    def similarity(self) -> float:
+        """Unrounded TF-IDF cosine between the reference and this coalition."""
+
+        if self.total == 0 or self.kernel.reference_total == 0 or self.dot == 0:
+            return 0.0
+        reference_only = self.kernel.reference_square_sum - self.reference_shared
+        norm_reference = math.sqrt(self.reference_shared + _IDF_ONLY_SQUARED * reference_only)
+        norm_coalition = math.sqrt(self.shared_square + _IDF_ONLY_SQUARED * self.only_square)
+        return self.dot / (norm_reference * norm_coalition)
+
+    def rounded_similarity(self) -> float:
+        return round(self.similarity(), SIMILARITY_DECIMALS)
+
+
+def _round_like_python(values: Any, decimals: int = SIMILARITY_DECIMALS) -> Any:
+    """
+    Round a float array exactly as the builtin ``round`` would.
+
+    ``np.round`` scales by 10**decimals before rounding, which can land on
+    the other side of a tie than Python's correctly-rounded ``round``.  Only
+    values whose scaled fractional part sits next to .5 can disagree, so
+    those few are re-rounded with the builtin.
+    """
+    scale = 10.0 ** decimals
+    scaled = values * scale
+    rounded = np.round(values, decimals)
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for index in np.flatnonzero(near_tie):
+        rounded[index] = round(float(values[index]), decimals)
+    return rounded
+
+
+class _SegmentArrays:
+    """
+    Per-segment integer summaries of a kernel, as NumPy arrays.
+
+    ``dot`` / ``totals`` are additive over a coalition; ``shared_gram`` and
+    ``only_gram`` give Q_shared / Q_only as quadratic forms; ``presence`` marks
+    which output tokens each segment contains (columns follow
+    ``reference_squares``, the c_O(t)² of every output token).
+    """
+
+    __slots__ = ("dot", "totals", "shared_gram", "only_gram", "presence", "reference_squares")
+
+    def __init__(self, kernel: TfidfCountKernel) -> None:
+        n = kernel.segment_count
+        reference_counts = kernel.reference_counts
+        reference_ids = [token_id for token_id, count in enumerate(reference_counts) if count]
+        column = {token_id: position for position, token_id in enumerate(reference_ids)}
+
+        self.dot = np.zeros(n, dtype=np.int64)
+        self.totals = np.asarray(kernel.segment_totals, dtype=np.int64)
+        self.shared_gram = np.zeros((n, n), dtype=np.int64)
+        self.only_gram = np.zeros((n, n), dtype=np.int64)
+        self.presence = np.zeros((n, len(reference_ids)), dtype=bool)
+        self.reference_squares = np.asarray(
+            [reference_counts[token_id] ** 2 for token_id in reference_ids], dtype=np.int64
+        )
+
+        shared_vectors: list[dict[int, int]] = []
+        only_vectors: list[dict[int, int]] = []
+        for index, items in enumerate(kernel.segment_items):
+            shared: dict[int, int] = {}
+            only: dict[int, int] = {}
+            for token_id, count in items:
+                if reference_counts[token_id]:
+                    shared[token_id] = count
+                    self.dot[index] += reference_counts[token_id] * count
+                    self.presence[index, column[token_id]] = True
+                else:
+                    only[token_id] = count
+            shared_vectors.append(shared)
+            only_vectors.append(only)
+        for i in range(n):
+            for j in range(i + 1):
+                self.shared_gram[i, j] = self.shared_gram[j, i] = sum(
+                    count * shared_vectors[j].get(token_id, 0) for token_id, count in shared_vectors[i].items()
+                )
+                self.only_gram[i, j] = self.only_gram[j, i] = sum(
+                    count * only_vectors[j].get(token_id, 0) for token_id, count in only_vectors[i].items()
+                )
+
+
+def _cosine_from_sums(
+    kernel: TfidfCountKernel,
+    dot: Any,
+    total: Any,
+    reference_shared: Any,
+    shared_square: Any,
+    only_square: Any,
+) -> Any:
+    """Vectorised form of ``CoalitionCounts.similarity`` followed by rounding."""
+    reference_only = kernel.reference_square_sum - reference_shared
+    with np.errstate(divide="ignore", invalid="ignore"):
+        norm_reference = np.sqrt(reference_shared + _IDF_ONLY_SQUARED * reference_only)
+        norm_coalition = np.sqrt(shared_square + _IDF_ONLY_SQUARED * only_square)
+        values = dot / (norm_reference * norm_coalition)
+    empty = (total == 0) | (dot == 0)
+    if kernel.reference_total == 0:
+        empty[:] = True
+    values[empty] = 0.0
+    return _round_like_python(values)
+
+
+def coalition_similarity_table(kernel: TfidfCountKernel) -> Any:
+    """
+    Return v(S) for every coalition bitmask as a NumPy float64 array.
+
+    Entry ``mask`` holds ``round(similarity, 4)`` for the coalition whose bit
+    j is set when segment j is a member, identical to evaluating each mask
+    with ``CoalitionCounts``.  Memory is a handful of 2^N arrays (about 8 MB
+    each at N = 20).
+
+    Raises:
+        RuntimeError: If NumPy is not installed.
+    """
+    if np is None:
+        raise RuntimeError("coalition_similarity_table requires numpy (install the 'xai' extra)")
+
+    n = kernel.segment_count
+    size = 1 << n
+    arrays = _SegmentArrays(kernel)
+
+    def _additive(weights: Any) -> Any:
+        table = np.zeros(size, dtype=np.int64)
+        for i in range(n):
+            table.reshape(-1, 2, 1 << i)[:, 1, :] += weights[i]
+        return table
+
+    def _quadratic(gram: Any) -> Any:
+        # Q(m | bit_i) = Q(m) + G_ii + 2 * Σ_{j ∈ m} G_ij for masks m < 2^i.
+        table = np.zeros(size, dtype=np.int64)
+        for i in range(n):
+            block = 1 << i
+            cross = np.zeros(block, dtype=np.int64)
+            for j in range(i):
+                cross.reshape(-1, 2, 1 << j)[:, 1, :] += gram[i, j]
+            table[block : 2 * block] = table[:block] + gram[i, i] + 2 * cross
+        return table
+
+    # Output tokens missing from S: superset-sum of weights placed at the
+    # complement of each token's segment mask.
+    full = size - 1
+    segment_bits = (1 << np.arange(n, dtype=np.int64)) if n else np.zeros(0, dtype=np.int64)
+    token_masks = segment_bits @ arrays.presence.astype(np.int64)
+    reference_only = np.zeros(size, dtype=np.int64)
+    np.add.at(reference_only, full & ~token_masks, arrays.reference_squares)
+    for i in range(n):
+        view = reference_only.reshape(-1, 2, 1 << i)
+        view[:, 0, :] += view[:, 1, :]
+
+    return _cosine_from_sums(
+        kernel,
+        dot=_additive(arrays.dot),
+        total=_additive(arrays.totals),
+        reference_shared=kernel.reference_square_sum - reference_only,
+        shared_square=_quadratic(arrays.shared_gram),
+        only_square=_quadratic(arrays.only_gram),
+    )
+
+
+def batch_similarity(kernel: TfidfCountKernel, masks: Any) -> Any:
+    """
+    Return v(S) for each row of a boolean (samples × segments) mask matrix.
+
+    Used when the coalitions of interest are a random sample rather than all
+    2^N subsets (kernel-LIME).  Every sum is a matrix product against the
+    per-segment summaries, so thousands of masks cost a few BLAS calls; values
+    are rounded exactly like ``CoalitionCounts.rounded_similarity``.
+
+    Raises:
+        RuntimeError: If NumPy is not installed.
+    """
+    if np is None:
+        raise RuntimeError("batch_similarity requires numpy (install the 'xai' extra)")
+
+    arrays = _SegmentArrays(kernel)
+    weights = np.asarray(masks, dtype=np.int64)
+    covered = (weights @ arrays.presence.astype(np.int64)) > 0
+    return _cosine_from_sums(
+        kernel,
+        dot=weights @ arrays.dot,
+        total=weights @ arrays.totals,
+        reference_shared=covered.astype(np.int64) @ arrays.reference_squares,
+        shared_square=np.einsum("si,ij,sj->s", weights, arrays.shared_gram, weights),
+        only_square=np.einsum("si,ij,sj->s", weights, arrays.only_gram, weights),
+    )
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import hashlib
-import json
 from pathlib import Path
 from typing import Any
 
-from trusted_ai_toolkit.artifacts import ArtifactStore
+from trusted_ai_toolkit.artifacts import ArtifactStore, load_json_artifact
+from trusted_ai_toolkit.run_state import RunState
 from trusted_ai_toolkit.schemas import AuthoritativeSource, LineageNode, LineageReport
 
 
@@ -15,14 +15,14 @@ def _load_prompt_bundle(store: ArtifactStore) -> dict[str, Any]:
     path = store.path_for("prompt_run.json")
     if not path.exists():
         return {}
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_json_artifact(path)
     return data if isinstance(data, dict) else {}
 
 
-def build_lineage_report(store: ArtifactStore) -> LineageReport:
-    """Build lineage report from prompt bundle contexts."""
+def build_lineage_report(store: ArtifactStore, prompt_bundle: dict[str, Any] | None = None) -> LineageReport:
+    """Build lineage report from prompt bundle contexts, loading prompt_run.json when no bundle is given."""
 
-    bundle = _load_prompt_bundle(store)
+    bundle = prompt_bundle if prompt_bundle is not None else _load_prompt_bundle(store)
     contexts = bundle.get("retrieved_contexts", []) if isinstance(bundle.get("retrieved_contexts", []), list) else []
 
     nodes: list[LineageNode] = []
@@ -97,10 +97,15 @@ def build_authoritative_source_index(lineage: LineageReport) -> list[Authoritati
     ]
 
 
-def generate_lineage_artifacts(store: ArtifactStore) -> tuple[Path, Path]:
+def generate_lineage_artifacts(store: ArtifactStore, state: RunState | None = None) -> tuple[Path, Path]:
     """Write lineage markdown and authoritative source index artifacts."""
 
-    lineage = build_lineage_report(store)
+    if state is not None and state.lineage is not None:
+        lineage = state.lineage
+    else:
+        lineage = build_lineage_report(store, state.prompt_bundle if state is not None else None)
+        if state is not None:
+            state.lineage = lineage
     sources = build_authoritative_source_index(lineage)
 
     lineage_path = store.save_rendered_md(
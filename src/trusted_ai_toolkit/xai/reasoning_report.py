@@ -3,8 +3,9 @@ Reasoning report generation for explainability governance artifacts.
 
 This module orchestrates the full reasoning-report pipeline:
 
-  1. Load prerequisite artifacts from the run directory (eval results,
-     prompt bundle, red-team summary, lineage report).
+  1. Load prerequisite artifacts (eval results, prompt bundle, red-team
+     summary, lineage report) from the in-memory ``RunState`` when the
+     prompt workflow supplies one, otherwise from the run directory.
   2. Run all four XAI engines via ``run_xai_analysis`` (context attribution,
      LIME-style LOO attribution, SHAP-style Shapley values, counterfactual
      summary).
@@ -19,13 +20,21 @@ external ML libraries — pure Python stdlib only.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
-from trusted_ai_toolkit.artifacts import ArtifactStore
+from trusted_ai_toolkit.artifacts import ArtifactStore, load_json_artifact
+from trusted_ai_toolkit.catalog import find_latest_artifact
+from trusted_ai_toolkit.model_client import LLMBudget
+from trusted_ai_toolkit.run_state import RunState
 from trusted_ai_toolkit.schemas import ToolkitConfig
-from trusted_ai_toolkit.xai.explainability import compute_llm_narrative, run_xai_analysis
+from trusted_ai_toolkit.xai.cache import XAIResultCache
+from trusted_ai_toolkit.xai.explainability import (
+    compute_embedding_attribution,
+    compute_llm_narrative,
+    compute_regeneration_counterfactuals,
+    run_xai_analysis,
+)
 from trusted_ai_toolkit.xai.lineage import build_lineage_report
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -49,7 +58,7 @@ TLDR_REFERENCES = [
 
 def _find_latest_artifact(output_dir: Path, filename: str) -> Path | None:
     """
-    Find the most recently modified artifact file at ``output_dir/*/<filename>``.
+    Find the latest artifact file at ``output_dir/*/<filename>``.
 
     Used as a fallback when the current run's artifact is not yet written (e.g.
     when the reasoning report is generated before the eval sweep completes).
@@ -59,13 +68,11 @@ def _find_latest_artifact(output_dir: Path, filename: str) -> Path | None:
         filename:   Name of the artifact file to search for.
 
     Returns:
-        The path to the most recently modified matching file, or ``None`` if
-        no matching files exist under any subdirectory.
+        The path to the matching file in the most recently completed run, or
+        ``None`` if no run has produced it.  Answered from the run catalog
+        when ``output_dir`` has one (see ``catalog.find_latest_artifact``).
     """
-    candidates = list(output_dir.glob(f"*/{filename}"))
-    if not candidates:
-        return None
-    return max(candidates, key=lambda p: p.stat().st_mtime)
+    return find_latest_artifact(output_dir, filename)
 
 
 def _try_load_eval_summary(output_dir: Path, run_id: str) -> list[dict[str, Any]]:
@@ -92,7 +99,7 @@ def _try_load_eval_summary(output_dir: Path, run_id: str) -> list[dict[str, Any]
             path = latest
     if not path.exists():
         return []
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_json_artifact(path)
     if isinstance(data, list):
         return data
     if isinstance(data, dict):
@@ -114,10 +121,25 @@ def _try_load_json_object(path: Path) -> dict[str, Any]:
     """
     if not path.exists():
         return {}
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = load_json_artifact(path)
     return payload if isinstance(payload, dict) else {}
 
 
+def _xai_cache_for(config: ToolkitConfig) -> XAIResultCache | None:
+    """
+    Build the XAI result cache configured for this toolkit run.
+
+    Defaults to ``<output_dir>/.xai_cache`` so cached payloads live alongside
+    the artifacts they were computed for; dot-directories are never treated
+    as run directories.
+    """
+    cache_config = config.xai.cache
+    if not cache_config.enabled:
+        return None
+    directory = cache_config.directory or str(Path(config.output_dir) / ".xai_cache")
+    return XAIResultCache(directory, max_entries=cache_config.max_entries)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Main entry point
 # ─────────────────────────────────────────────────────────────────────────────
@@ -125,13 +147,17 @@ def _try_load_json_object(path: Path) -> dict[str, Any]:
 def generate_reasoning_report(
     config: ToolkitConfig,
     store: ArtifactStore,
+    budget: LLMBudget | None = None,
+    embedding_features: dict[str, Any] | None = None,
+    state: RunState | None = None,
 ) -> tuple[Path, Path]:
     """
     Render and write the reasoning report markdown and JSON artifacts.
 
     Pipeline:
-      1. Load prerequisite artifacts (eval results, prompt bundle, red-team
-         summary) from the run directory.
+      1. Take prerequisite artifacts (eval results, prompt bundle, red-team
+         summary) from ``state``, loading from the run directory whatever
+         the state does not carry.
       2. Build the lineage report by parsing the prompt bundle's
          ``retrieved_contexts`` field.
       3. Run all XAI engines (context attribution, LIME attribution, Shapley
@@ -161,6 +187,17 @@ def generate_reasoning_report(
         store:
             Artifact store for the current run.  Provides the run ID, output
             directory, and write helpers.
+        budget:
+            Run-scoped LLM budget shared with ``run_eval``.  A fresh budget
+            from ``config.adapters.run_budget`` is used when omitted.
+        embedding_features:
+            Output of ``compute_embedding_features`` for this run.  Its
+            vectors are reused by the embedding-space attribution engine so
+            only prompt sentences need embedding.
+        state:
+            In-memory results of the earlier workflow stages.  Populated
+            fields replace the corresponding artifact reads; the lineage
+            report built here is stored back on it for the lineage stage.
 
     Returns:
         A tuple (md_path, json_path) pointing to the written artifacts.
@@ -169,13 +206,30 @@ def generate_reasoning_report(
         OSError:  If the artifact directory is not writable.
         ValueError: If the reasoning report template is not found.
     """
+    llm_budget = budget if budget is not None else LLMBudget.from_config(config)
+
     # ── Step 1: load prerequisite artifacts ───────────────────────────────────
-    eval_summary = _try_load_eval_summary(store.output_dir, store.run_id)
-    prompt_bundle = _try_load_json_object(store.path_for("prompt_run.json"))
-    redteam_findings = _try_load_json_object(store.path_for("redteam_summary.json"))
+    # Within the prompt workflow the scorecard stage runs after this one, so
+    # an absent in-memory scorecard means there is none yet to read.
+    read_scorecard_artifact = state is None
+    state = state if state is not None else RunState()
+    if state.eval_results is not None:
+        eval_summary = [item.model_dump(mode="json") for item in state.eval_results]
+    else:
+        eval_summary = _try_load_eval_summary(store.output_dir, store.run_id)
+    if state.prompt_bundle is not None:
+        prompt_bundle = state.prompt_bundle
+    else:
+        prompt_bundle = _try_load_json_object(store.path_for("prompt_run.json"))
+    if state.redteam_summary is not None:
+        redteam_findings = state.redteam_summary
+    else:
+        redteam_findings = _try_load_json_object(store.path_for("redteam_summary.json"))
 
     # ── Step 2: build lineage report from retrieved contexts ─────────────────
-    lineage_report = build_lineage_report(store)
+    if state.lineage is None:
+        state.lineage = build_lineage_report(store, prompt_bundle)
+    lineage_report = state.lineage
 
     # ── Step 3: run XAI analysis ──────────────────────────────────────────────
     # Extract raw inputs needed by the XAI engines.
@@ -191,6 +245,7 @@ def generate_reasoning_report(
     # payload.  It is safe to call with empty inputs — all engines degrade
     # gracefully.  Eval summary is passed as plain dicts (not Pydantic models)
     # since the counterfactual engine operates on the serialised form.
+    xai_cache = _xai_cache_for(config)
     xai_results = run_xai_analysis(
         prompt=prompt_text,
         model_output=model_output,
@@ -198,6 +253,20 @@ def generate_reasoning_report(
         eval_results=[r.model_dump(mode="json") if hasattr(r, "model_dump") else r for r in eval_summary],
         lineage_nodes=[node.model_dump(mode="json") for node in lineage_report.nodes],
         redteam_summary=redteam_findings,
+        execution=config.xai.execution,
+        cache=xai_cache,
+    )
+
+    # Opt-in measured counterfactuals: regenerate without each top chunk and
+    # re-score.  Shares the run budget; returns ``enabled=False`` by default.
+    regeneration_counterfactuals = compute_regeneration_counterfactuals(
+        config,
+        prompt=prompt_text,
+        model_output=model_output,
+        contexts=retrieved_contexts,
+        context_attribution=xai_results["context_attribution"],
+        budget=llm_budget,
+        cache=xai_cache,
     )
 
     # ── Step 3b: optional LLM narrative (Tim2 — Option A) ────────────────────
@@ -205,7 +274,12 @@ def generate_reasoning_report(
     # written earlier in the run, then asks the configured LLM to write a
     # plain-language rationale for the existing verdict.  Stub-safe: returns
     # ``available=False`` when no live adapter is configured.
-    scorecard_payload = _try_load_json_object(store.path_for("scorecard.json"))
+    if state.scorecard is not None:
+        scorecard_payload = state.scorecard.model_dump(mode="json")
+    elif read_scorecard_artifact:
+        scorecard_payload = _try_load_json_object(store.path_for("scorecard.json"))
+    else:
+        scorecard_payload = {}
     metric_summary_for_narrative: dict[str, Any] = {}
     truth = scorecard_payload.get("answer_truth_summary") or {} if isinstance(scorecard_payload, dict) else {}
     for key in ("claim_support_rate", "unsupported_claim_rate", "contradiction_rate", "evidence_sufficiency_score"):
@@ -217,6 +291,16 @@ def generate_reasoning_report(
     if isinstance(scorecard_payload, dict) and scorecard_payload.get("answer_trust_score") is not None:
         metric_summary_for_narrative["answer_trust_score"] = scorecard_payload.get("answer_trust_score")
 
+    # Embedding-space attribution: semantic counterpart of the lexical
+    # engines.  Stub-safe; unavailable without a live embedding provider.
+    embedding_attribution = compute_embedding_attribution(
+        config,
+        prompt=prompt_text,
+        model_output=model_output,
+        contexts=retrieved_contexts,
+        embedding_features=embedding_features,
+    )
+
     llm_narrative = compute_llm_narrative(
         config=config,
         verdict=scorecard_payload.get("answer_verdict") if isinstance(scorecard_payload, dict) else None,
@@ -224,6 +308,7 @@ def generate_reasoning_report(
         metric_summary=metric_summary_for_narrative,
         model_output=model_output,
         contexts=retrieved_contexts,
+        budget=llm_budget,
     )
 
     # ── Step 4: assemble Jinja2 template context ──────────────────────────────
@@ -275,13 +360,27 @@ def generate_reasoning_report(
         "xai_available": xai_results["xai_available"],
         "xai_method_labels": xai_results["method_labels"],
         "context_attribution": xai_results["context_attribution"],
+        "context_attribution_status": xai_results["context_attribution_status"],
+        "token_heatmap": xai_results["token_heatmap"],
+        "claim_attribution": xai_results["claim_attribution"],
+        "embedding_attribution": embedding_attribution,
         "lime_attribution": xai_results["lime_attribution"],
+        "kernel_lime_attribution": xai_results["kernel_lime_attribution"],
         "shapley_attribution": xai_results["shapley_attribution"],
+        "context_ablation": xai_results["context_ablation"],
         "counterfactual_summary": xai_results["counterfactual_summary"],
+        "regeneration_counterfactuals": regeneration_counterfactuals,
+        # Per-engine completion status; engines that hit their wall-clock
+        # limit or failed are rendered from labelled degraded payloads.
+        "xai_engine_status": xai_results["engine_status"],
+        # Whether the attribution payloads were served from the XAI cache.
+        "xai_cache": xai_results["cache"],
         # ── LLM narrative explanation (Tim2 — Option A) ────────────────────────
         # Stub-safe; the template renders a fallback note when ``available`` is
         # False so demo runs without a live adapter still produce a valid file.
         "llm_narrative": llm_narrative,
+        # Usage of the run-scoped LLM budget after every advisory stage ran.
+        "llm_budget": llm_budget.snapshot(),
     }
 
     # ── Step 5: render and write artifacts ────────────────────────────────────
@@ -1,7 +1,30 @@
 from __future__ import annotations
 
-from trusted_ai_toolkit.benchmarking import build_cohort_key
-from trusted_ai_toolkit.schemas import ToolkitConfig
+import json
+import math
+import multiprocessing
+import random
+import statistics
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from trusted_ai_toolkit.benchmark_registry import (
+    BaselineWindow,
+    BenchmarkRegistry,
+    registry_store_path,
+)
+from trusted_ai_toolkit.benchmarking import (
+    baseline_window,
+    benchmark_distributions,
+    build_cohort_key,
+    load_registry,
+    metric_z_from_history,
+    update_registry_for_config,
+    write_registry,
+)
+from trusted_ai_toolkit.schemas import MetricResult, ToolkitConfig
 
 
 def test_build_cohort_key_uses_adapter_model_identity() -> None:
@@ -32,3 +55,232 @@ def test_build_cohort_key_uses_adapter_model_identity() -> None:
     )
 
     assert build_cohort_key(cfg) == "medium|question_answering|gpt-4.1-mini"
+
+
+def _metric(value: float) -> MetricResult:
+    return MetricResult(metric_id="accuracy_stub", value=value, threshold=0.7, passed=value >= 0.7, details={})
+
+
+def test_registry_imports_json_and_upserts_by_run_id(tmp_path: Path) -> None:
+    registry_path = tmp_path / "benchmarks" / "metric_registry.json"
+    cfg = ToolkitConfig(
+        project_name="demo",
+        risk_tier="medium",
+        eval={"benchmark_registry_path": str(registry_path)},
+    )
+    cohort_key = build_cohort_key(cfg)
+    legacy = [
+        {
+            "project_name": "demo",
+            "cohort_key": cohort_key,
+            "run_id": f"legacy-{index}",
+            "metrics": {"accuracy_stub": {"value": value, "threshold": 0.7, "passed": True}},
+        }
+        for index, value in enumerate((0.7, 0.8))
+    ]
+    registry_path.parent.mkdir(parents=True)
+    registry_path.write_text(json.dumps({"runs": legacy}), encoding="utf-8")
+
+    store_path = update_registry_for_config(registry_path, cfg, "run-a", [_metric(0.5)])
+    update_registry_for_config(registry_path, cfg, "run-b", [_metric(0.9)])
+    update_registry_for_config(registry_path, cfg, "run-a", [_metric(0.6)])
+
+    assert store_path == registry_store_path(registry_path) == registry_path.with_suffix(".sqlite")
+    runs = load_registry(registry_path)["runs"]
+    assert [run["run_id"] for run in runs] == ["legacy-0", "legacy-1", "run-b", "run-a"]
+    assert runs[-1]["metrics"]["accuracy_stub"] == {"value": 0.6, "threshold": 0.7, "passed": False}
+    # Imported JSON entries are stamped with the JSON file's modification time.
+    assert runs[0].pop("recorded_at")
+    assert runs[0] == {**legacy[0], "metrics": {"accuracy_stub": {"value": 0.7, "threshold": 0.7, "passed": True}}}
+    # The JSON source is imported, never rewritten.
+    assert json.loads(registry_path.read_text(encoding="utf-8")) == {"runs": legacy}
+
+    values = [0.7, 0.8, 0.9]
+    mean = sum(values) / len(values)
+    std_dev = math.sqrt(sum((value - mean) ** 2 for value in values) / (len(values) - 1))
+    distributions = benchmark_distributions(registry_path, cfg, "run-a")
+    assert distributions == {"accuracy_stub": {"n": 3.0, "mean": round(mean, 6), "std_dev": round(std_dev, 6)}}
+    other = cfg.model_copy(update={"risk_tier": "high"})
+    assert benchmark_distributions(registry_path, other, "run-a") == {}
+
+    write_registry(registry_path, {"runs": runs[:1]})
+    assert [run["run_id"] for run in load_registry(registry_path)["runs"]] == ["legacy-0"]
+
+
+def test_running_stats_track_reruns_and_match_full_recompute(tmp_path: Path) -> None:
+    registry_path = tmp_path / "registry.sqlite"
+    cfg = ToolkitConfig(project_name="demo", risk_tier="low", eval={"benchmark_registry_path": str(registry_path)})
+    rng = random.Random(7)
+    latest: dict[str, float] = {}
+    for _ in range(60):
+        run_id = f"run-{rng.randrange(20)}"
+        latest[run_id] = round(rng.uniform(0.0, 1.0), 3)
+        update_registry_for_config(registry_path, cfg, run_id, [_metric(latest[run_id])])
+
+    stats = BenchmarkRegistry(registry_path).cohort_stats(cfg.project_name, build_cohort_key(cfg))["accuracy_stub"]
+    values = list(latest.values())
+    mean = sum(values) / len(values)
+    assert stats.n == len(values)
+    assert math.isclose(stats.mean, mean, abs_tol=1e-12)
+    assert math.isclose(stats.std_dev, statistics.stdev(values), abs_tol=1e-12)
+
+    # The current run is removed from its own baseline.
+    distributions = benchmark_distributions(registry_path, cfg, "run-3")
+    remaining = [value for run_id, value in latest.items() if run_id != "run-3"]
+    assert distributions["accuracy_stub"]["n"] == float(len(remaining))
+    assert distributions["accuracy_stub"]["mean"] == round(sum(remaining) / len(remaining), 6)
+    assert distributions["accuracy_stub"]["std_dev"] == round(statistics.stdev(remaining), 6)
+    baseline = distributions["accuracy_stub"]
+    expected_z = round((0.9 - baseline["mean"]) / baseline["std_dev"], 4)
+    assert metric_z_from_history(_metric(0.9), distributions) == expected_z
+
+
+def _record_runs(registry_path: str, worker: int, runs_per_worker: int) -> None:
+    cfg = ToolkitConfig(project_name="demo", risk_tier="low", eval={"benchmark_registry_path": registry_path})
+    for index in range(runs_per_worker):
+        run_id = f"worker-{worker}-run-{index}"
+        update_registry_for_config(registry_path, cfg, run_id, [_metric(worker / 100 + index / 1000)])
+        # Re-recording the same run must replace, not duplicate, its values.
+        update_registry_for_config(registry_path, cfg, run_id, [_metric(worker / 100 + index / 1000)])
+
+
+def test_concurrent_registry_writers_lose_no_updates(tmp_path: Path) -> None:
+    registry_path = tmp_path / "benchmarks" / "metric_registry.json"
+    registry_path.parent.mkdir()
+    registry_path.write_text(json.dumps({"runs": []}), encoding="utf-8")
+    workers, runs_per_worker = 32, 4
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_record_runs, args=(str(registry_path), worker, runs_per_worker))
+        for worker in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=120)
+    assert [process.exitcode for process in processes] == [0] * workers
+
+    runs = load_registry(registry_path)["runs"]
+    assert len(runs) == len({run["run_id"] for run in runs}) == workers * runs_per_worker
+    values = [run["metrics"]["accuracy_stub"]["value"] for run in runs]
+    cfg = ToolkitConfig(project_name="demo", risk_tier="low")
+    stats = BenchmarkRegistry(registry_path).cohort_stats(cfg.project_name, build_cohort_key(cfg))["accuracy_stub"]
+    assert stats.n == len(values)
+    assert math.isclose(stats.mean, statistics.fmean(values), abs_tol=1e-9)
+    assert math.isclose(stats.std_dev, statistics.stdev(values), abs_tol=1e-9)
+
+
+def _ewma(values: list[float], alpha: float) -> tuple[float, float]:
+    mean, variance = values[0], 0.0
+    for value in values[1:]:
+        delta = value - mean
+        mean += alpha * delta
+        variance = (1.0 - alpha) * (variance + delta * alpha * delta)
+    return mean, math.sqrt(variance)
+
+
+@pytest.mark.parametrize(
+    "baseline",
+    [
+        {"mode": "last_runs", "window_runs": 5},
+        {"mode": "last_days", "window_days": 3},
+        {"mode": "ewma", "ewma_alpha": 0.3},
+    ],
+)
+def test_windowed_baselines_are_maintained_incrementally(tmp_path: Path, monkeypatch, baseline: dict) -> None:
+    registry_path = tmp_path / "registry.sqlite"
+    cfg = ToolkitConfig(
+        project_name="demo",
+        risk_tier="low",
+        eval={"benchmark_registry_path": str(registry_path), "baseline": baseline},
+    )
+    registry = BenchmarkRegistry(registry_path)
+    window = baseline_window(cfg)
+    start = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    rng = random.Random(11)
+    history: dict[str, tuple[datetime, float]] = {}
+    cohort = {"project_name": "demo", "cohort_key": build_cohort_key(cfg)}
+    for day in range(12):
+        if day == 1:
+            # Built once from history on first request, then kept up to date by writes.
+            registry.cohort_stats("demo", cohort["cohort_key"], window=window, now=start)
+            monkeypatch.setattr(BenchmarkRegistry, "_build_window", _no_rebuild(window))
+        # Re-record an earlier run sometimes; it moves to the newest position.
+        run_id = f"run-{rng.randrange(day)}" if day > 2 and rng.random() < 0.3 else f"run-{day}"
+        now = start + timedelta(days=day)
+        history.pop(run_id, None)
+        history[run_id] = (now, round(rng.uniform(0.0, 1.0), 3))
+        registry.record_run(
+            {**cohort, "run_id": run_id, "metrics": {"accuracy_stub": {"value": history[run_id][1]}}},
+            now=now,
+        )
+
+    now = start + timedelta(days=11, hours=12)
+    ordered = list(history.values())
+    if window.mode == "last_runs":
+        expected = [value for _, value in ordered[-5:]]
+    elif window.mode == "last_days":
+        expected = [value for recorded, value in ordered if recorded >= now - timedelta(days=3)]
+    else:
+        expected = [value for _, value in ordered]
+    stats = registry.cohort_stats("demo", cohort["cohort_key"], window=window, now=now)["accuracy_stub"]
+    assert stats.n == len(expected)
+    if window.mode == "ewma":
+        mean, std_dev = _ewma(expected, 0.3)
+    else:
+        mean, std_dev = statistics.fmean(expected), statistics.stdev(expected)
+    assert math.isclose(stats.mean, mean, abs_tol=1e-9)
+    assert math.isclose(stats.std_dev, std_dev, abs_tol=1e-9)
+
+    distributions = benchmark_distributions(registry_path, cfg, "unrecorded-run")
+    if window.mode == "last_days":
+        # Scorecards read the window at the current time, long after these runs.
+        assert distributions == {}
+    else:
+        assert distributions["accuracy_stub"]["mean"] == round(stats.mean, 6)
+
+
+def _no_rebuild(window):
+    original = BenchmarkRegistry._build_window
+
+    def _build_window(self, *args, **kwargs):
+        # EWMA cannot subtract a re-recorded run, so it alone may rebuild.
+        assert window.mode == "ewma", "windowed baseline rescanned history"
+        return original(self, *args, **kwargs)
+
+    return _build_window
+
+
+def test_ewma_baseline_excludes_a_recorded_run_without_rescanning(tmp_path: Path, monkeypatch) -> None:
+    window = baseline_window(
+        ToolkitConfig(project_name="demo", eval={"baseline": {"mode": "ewma", "ewma_alpha": 0.3}})
+    )
+    rng = random.Random(3)
+    entries = []
+    for index in range(8):
+        metrics = {"accuracy_stub": {"value": round(rng.uniform(0.0, 1.0), 3)}}
+        if index % 3:
+            # A metric some runs do not report has its own contribution positions.
+            metrics["latency_stub"] = {"value": round(rng.uniform(10.0, 20.0), 3)}
+        entries.append({"project_name": "demo", "cohort_key": "c", "run_id": f"run-{index}", "metrics": metrics})
+    registry = BenchmarkRegistry(tmp_path / "registry.sqlite")
+    registry.cohort_stats("demo", "c", window=window)
+    for entry in entries:
+        registry.record_run(entry)
+    # Re-recording a run rebuilds the baseline; its contributions must be rebuilt with it.
+    registry.record_run(entries.pop(2))
+    entries.append(registry.runs()[-1])
+
+    monkeypatch.setattr(BenchmarkRegistry, "_build_window", _no_rebuild(BaselineWindow()))
+    for entry in entries:
+        stats = registry.cohort_stats("demo", "c", exclude_run_id=entry["run_id"], window=window)
+        for metric_id, item in stats.items():
+            expected = [
+                other["metrics"][metric_id]["value"]
+                for other in entries
+                if other is not entry and metric_id in other["metrics"]
+            ]
+            mean, std_dev = _ewma(expected, 0.3)
+            assert item.n == len(expected)
+            assert math.isclose(item.mean, mean, abs_tol=1e-9)
+            assert math.isclose(item.std_dev, std_dev, abs_tol=1e-9)
@@ -0,0 +1,608 @@
+from __future__ import annotations
+
+import os
+import time
+from itertools import combinations, permutations
+from random import Random
+
+import pytest
+
+from trusted_ai_toolkit.eval.metrics import (
+    _claim_analysis,
+    _claim_support_matrix,
+    _claim_units,
+    _sparse_cosine,
+    _tfidf_vectors,
+    metric_claim_support_rate,
+    metric_contradiction_rate,
+    metric_evidence_sufficiency_score,
+    metric_unsupported_claim_rate,
+)
+from trusted_ai_toolkit.eval.runner import compute_embedding_features
+from trusted_ai_toolkit.model_client import (
+    BudgetRefusal,
+    EmbeddingInvocationResult,
+    LLMBudget,
+    ModelInvocationError,
+    ModelInvocationResult,
+    compose_model_prompt,
+)
+from trusted_ai_toolkit.schemas import (
+    AdapterConfig,
+    ToolkitConfig,
+    XAIConfig,
+    XAIExecutionConfig,
+    XAIRegenerationConfig,
+)
+from trusted_ai_toolkit.xai import explainability
+from trusted_ai_toolkit.xai.cache import MemoryLRUCache, XAIResultCache
+from trusted_ai_toolkit.xai.explainability import (
+    _build_kernel,
+    _shapley_exact,
+    _shapley_exact_vectorized,
+    _shapley_monte_carlo,
+    _split_sentences,
+    _tfidf_cosine_sim,
+    compute_claim_attribution,
+    compute_context_ablation,
+    compute_context_attribution,
+    compute_counterfactual_summary,
+    compute_embedding_attribution,
+    compute_kernel_lime_attribution,
+    compute_lime_attribution,
+    compute_regeneration_counterfactuals,
+    compute_shapley_attribution,
+    compute_token_heatmap,
+    run_xai_analysis,
+)
+from trusted_ai_toolkit.xai.kernel import coalition_similarity_table
+
+_WORDS = (
+    "policy approval release control evidence review risk model data audit quarterly owner "
+    "the a of and is not deployment monitoring threshold incident lineage source"
+).split()
+
+PROMPT = (
+    "Summarize the release policy for the governance board. "
+    "Explain which approval controls must pass before deployment. "
+    "List the monitoring evidence reviewers should expect each quarter. "
+    "Flag any incident thresholds that would block the release."
+)
+OUTPUT = (
+    "Release requires approval controls to pass before deployment. "
+    "Reviewers expect quarterly monitoring evidence and incident thresholds block release."
+)
+CONTEXTS = [
+    {"title": "Release Policy", "snippet": "Approval controls must pass before any deployment release."},
+    {"title": "Monitoring Guide", "snippet": "Quarterly monitoring evidence is reviewed by the board."},
+    {"title": "Unrelated", "snippet": "Cafeteria menus rotate weekly."},
+    {"uri": "file://empty.md"},
+]
+
+
+def _random_sentence(rng: Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(3, 12))).capitalize() + "."
+
+
+def test_kernel_matches_string_similarity_for_every_subset() -> None:
+    rng = Random(7)
+    for _ in range(20):
+        segments = [_random_sentence(rng) for _ in range(5)]
+        output = " ".join(_random_sentence(rng) for _ in range(3))
+        kernel = _build_kernel(output, segments)
+        for size in range(1, len(segments) + 1):
+            for subset in combinations(range(len(segments)), size):
+                expected = _tfidf_cosine_sim(output, " ".join(segments[i] for i in subset))
+                assert kernel.rounded_similarity_of(subset) == expected
+
+
+def test_coalition_add_remove_is_reversible() -> None:
+    segments = _split_sentences(PROMPT)
+    kernel = _build_kernel(OUTPUT, segments)
+    coalition = kernel.coalition()
+    for idx in range(len(segments)):
+        coalition.add(idx)
+    full = coalition.similarity()
+    coalition.add(1)
+    coalition.remove(1)
+    assert coalition.similarity() == full
+    for idx in range(len(segments)):
+        coalition.remove(idx)
+    assert coalition.similarity() == 0.0
+    assert coalition.total == 0
+
+
+def test_context_attribution_ranks_supporting_chunks_first() -> None:
+    ranked = compute_context_attribution(OUTPUT, CONTEXTS)
+    assert [entry["title"] for entry in ranked][:2] == ["Release Policy", "Monitoring Guide"]
+    assert ranked[-1]["influence_score"] == 0.0
+    assert all(entry["chunk_index"] != 3 for entry in ranked)
+
+
+def test_lime_and_shapley_payloads_are_deterministic() -> None:
+    lime_first = compute_lime_attribution(PROMPT, OUTPUT)
+    lime_second = compute_lime_attribution(PROMPT, OUTPUT)
+    assert lime_first == lime_second
+    assert lime_first["segment_count"] == 4
+
+    shapley = compute_shapley_attribution(PROMPT, OUTPUT)
+    assert shapley["method"] == "shapley_exact"
+    assert shapley["permutations_used"] is None
+    assert all(seg["std_error"] == 0.0 for seg in shapley["segments"])
+    assert abs(shapley["efficiency_sum"] - shapley["baseline_sim"]) < 1e-3
+
+
+def test_shapley_exact_engines_agree() -> None:
+    pytest.importorskip("numpy")
+    rng = Random(11)
+    for n in (1, 4, 8):
+        segments = [_random_sentence(rng) for _ in range(n)]
+        output = " ".join(_random_sentence(rng) for _ in range(3))
+        kernel = _build_kernel(output, segments)
+        table = coalition_similarity_table(kernel)
+        for mask in range(1 << n):
+            members = [j for j in range(n) if mask >> j & 1]
+            assert table[mask] == (kernel.rounded_similarity_of(members) if members else 0.0)
+        pure = _shapley_exact(kernel)
+        vectorized = _shapley_exact_vectorized(kernel)
+        assert all(abs(a - b) < 1e-9 for a, b in zip(pure, vectorized, strict=True))
+
+
+def test_shapley_uses_vectorized_exact_engine_up_to_twenty_segments() -> None:
+    pytest.importorskip("numpy")
+    rng = Random(3)
+    prompt = " ".join(_random_sentence(rng) for _ in range(16))
+    output = " ".join(_random_sentence(rng) for _ in range(4))
+    payload = compute_shapley_attribution(prompt, output)
+    assert payload["segment_count"] == 11
+    assert payload["method"] == "shapley_exact"
+    assert payload["engine"] == "numpy"
+    assert abs(payload["efficiency_sum"] - payload["baseline_sim"]) < 1e-3
+
+
+def test_monte_carlo_shapley_stops_on_standard_error_target() -> None:
+    rng = Random(5)
+    segments = [_random_sentence(rng) for _ in range(12)]
+    output = " ".join(_random_sentence(rng) for _ in range(4))
+    kernel = _build_kernel(output, segments)
+    exact = _shapley_exact(kernel)
+
+    values, std_errors, used = _shapley_monte_carlo(kernel, target_se=0.005)
+    assert used % 2 == 0 and 32 <= used < 2000
+    assert max(std_errors) < 0.005
+    assert abs(sum(values) - kernel.rounded_similarity_of(range(12))) < 1e-9
+    assert all(abs(v - e) < 5 * se + 1e-9 for v, e, se in zip(values, exact, std_errors, strict=True))
+
+    _, _, capped = _shapley_monte_carlo(kernel, target_se=1e-9, max_permutations=64)
+    assert capped == 64
+    assert _shapley_monte_carlo(kernel) == (values, std_errors, used)
+
+
+def test_shapley_payload_reports_standard_errors_for_long_prompts() -> None:
+    rng = Random(5)
+    prompt = " ".join(_random_sentence(rng) for _ in range(60))
+    output = " ".join(_random_sentence(rng) for _ in range(5))
+    payload = compute_shapley_attribution(prompt, output)
+    assert payload["segment_count"] > 20
+    assert payload["method"] == "shapley_monte_carlo"
+    assert payload["permutations_used"] >= 32
+    assert payload["target_std_error"] == 0.005
+    assert all(0.0 <= seg["std_error"] <= 0.005 for seg in payload["segments"])
+
+
+def test_kernel_lime_fits_surrogate_with_standard_errors() -> None:
+    pytest.importorskip("numpy")
+    payload = compute_kernel_lime_attribution(PROMPT, OUTPUT)
+    assert payload == compute_kernel_lime_attribution(PROMPT, OUTPUT)
+    assert payload["method"] == "kernel_lime"
+    assert payload["n_samples"] == 4000
+    assert payload["segment_count"] == 4
+    assert payload["local_r2"] > 0.9
+    top = payload["segments"][0]
+    assert top["coefficient"] > 0 and top["std_error"] >= 0.0
+    assert payload["segments"][-1]["text"].startswith("Summarize")
+
+
+def test_kernel_lime_returns_note_for_empty_inputs() -> None:
+    payload = compute_kernel_lime_attribution("", OUTPUT)
+    assert payload["segment_count"] == 0
+    assert payload["note"].startswith("No analysis")
+
+
+def test_process_pool_matches_sequential_engines() -> None:
+    sequential = run_xai_analysis(PROMPT, OUTPUT, CONTEXTS, [], [], {})
+    pooled = run_xai_analysis(
+        PROMPT, OUTPUT, CONTEXTS, [], [], {}, execution=XAIExecutionConfig(mode="process_pool")
+    )
+    engines = ("context_attribution", "token_heatmap", "lime_attribution", "kernel_lime_attribution", "shapley_attribution")
+    for key in engines:
+        assert pooled[key] == sequential[key]
+    assert all(state["status"] == "complete" for state in pooled["engine_status"].values())
+
+
+def test_engine_over_time_limit_returns_labelled_degraded_payload() -> None:
+    rng = Random(5)
+    prompt = " ".join(_random_sentence(rng) for _ in range(60))
+    execution = XAIExecutionConfig(mode="process_pool", engine_time_limits={"shapley_attribution": 0.001})
+    result = run_xai_analysis(prompt, OUTPUT, CONTEXTS, [], [], {}, execution=execution)
+
+    assert result["engine_status"]["shapley_attribution"]["status"] == "timed_out"
+    assert result["shapley_attribution"]["status"] == "timed_out"
+    assert result["shapley_attribution"]["segments"] == []
+    assert result["engine_status"]["context_attribution"]["status"] == "complete"
+    assert result["context_attribution"]
+    assert result["context_attribution_status"] == {"status": "complete", "note": None}
+    assert result["xai_available"]
+
+
+def test_engine_pool_is_reused_across_reports() -> None:
+    execution = XAIExecutionConfig(mode="process_pool")
+    run_xai_analysis(PROMPT, OUTPUT, CONTEXTS, [], [], {}, execution=execution)
+    pool = explainability._ENGINE_POOL
+    assert pool is not None
+    run_xai_analysis(PROMPT, OUTPUT, CONTEXTS, [], [], {}, execution=execution)
+    assert explainability._ENGINE_POOL is pool
+
+
+def _slow_context_attribution(engine: str, *args: object) -> tuple[object, float]:
+    if engine == "context_attribution":
+        time.sleep(5)
+    return explainability._PARALLEL_ENGINES[engine](*args), 0.0
+
+
+def test_timed_out_context_attribution_is_labelled(monkeypatch) -> None:
+    monkeypatch.setattr(explainability, "_timed_engine", _slow_context_attribution)
+    execution = XAIExecutionConfig(mode="process_pool", engine_time_limits={"context_attribution": 0.2})
+    result = run_xai_analysis(PROMPT, OUTPUT, CONTEXTS, [], [], {}, execution=execution)
+
+    assert result["context_attribution"] == []
+    assert result["context_attribution_status"]["status"] == "timed_out"
+    assert "0.2s wall-clock limit" in result["context_attribution_status"]["note"]
+    assert result["engine_status"]["lime_attribution"]["status"] == "complete"
+    # The pool running the abandoned engine is discarded, not reused.
+    assert explainability._ENGINE_POOL is None
+
+
+def test_xai_cache_serves_repeat_inputs_without_recomputing(tmp_path, monkeypatch) -> None:
+    cache = XAIResultCache(tmp_path / "cache", max_entries=8)
+    first = run_xai_analysis(PROMPT, OUTPUT, CONTEXTS, [], [], {}, cache=cache)
+    assert first["cache"]["hit"] is False
+
+    def _fail(*_args: object) -> None:
+        raise AssertionError("engines should not run on a cache hit")
+
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability._run_engines", _fail)
+    second = run_xai_analysis(PROMPT, OUTPUT, CONTEXTS, [], [], {}, cache=cache)
+    assert second["cache"] == {"enabled": True, "hit": True, "key": first["cache"]["key"]}
+    assert second["shapley_attribution"] == first["shapley_attribution"]
+    assert second["context_attribution"] == first["context_attribution"]
+
+
+def test_xai_cache_misses_after_payload_schema_bump(tmp_path, monkeypatch) -> None:
+    cache = XAIResultCache(tmp_path / "cache", max_entries=8)
+    first = run_xai_analysis(PROMPT, OUTPUT, CONTEXTS, [], [], {}, cache=cache)
+    monkeypatch.setattr(
+        "trusted_ai_toolkit.xai.explainability._XAI_PAYLOAD_SCHEMA_VERSION",
+        explainability._XAI_PAYLOAD_SCHEMA_VERSION + 1,
+    )
+    second = run_xai_analysis(PROMPT, OUTPUT, CONTEXTS, [], [], {}, cache=cache)
+    assert second["cache"]["hit"] is False
+    assert second["cache"]["key"] != first["cache"]["key"]
+
+
+def test_xai_cache_is_bounded_and_keyed_by_inputs(tmp_path) -> None:
+    cache = XAIResultCache(tmp_path, max_entries=2)
+    keys = [XAIResultCache.digest(PROMPT, f"output {i}", CONTEXTS, {"seed": 42}) for i in range(3)]
+    assert len(set(keys)) == 3
+    for index, key in enumerate(keys):
+        cache.put(key, {"index": index})
+        os.utime(tmp_path / f"{key}.json", (index, index))
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == {"index": 2}
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+
+def test_token_heatmap_columns_sum_to_context_influence() -> None:
+    heatmap = compute_token_heatmap(OUTPUT, CONTEXTS)
+    ranked = compute_context_attribution(OUTPUT, CONTEXTS)
+    influence = {entry["chunk_index"]: entry["influence_score"] for entry in ranked}
+
+    assert heatmap["tokens"][0] == "release" and heatmap["token_counts"][0] == 2
+    assert [column["chunk_index"] for column in heatmap["contexts"]] == [0, 1, 2]
+    for column in heatmap["contexts"]:
+        total = sum(weight for _, col, weight in heatmap["cells"] if col == column["context_index"])
+        assert abs(total - influence[column["chunk_index"]]) < 1e-3
+    release = heatmap["tokens"].index("release")
+    assert heatmap["top_context"][release] == 0
+    assert "incident" in heatmap["unsupported_tokens"]
+    assert 0.0 < heatmap["supported_fraction"] < 1.0
+
+
+def test_token_heatmap_is_empty_without_contexts() -> None:
+    assert compute_token_heatmap(OUTPUT, [])["cells"] == []
+    assert compute_token_heatmap("", CONTEXTS)["tokens"] == []
+
+
+def test_claim_support_matrix_matches_per_claim_tfidf() -> None:
+    rng = Random(11)
+    for _ in range(30):
+        claims = [_random_sentence(rng) for _ in range(rng.randint(1, 5))]
+        contexts = [_random_sentence(rng) for _ in range(rng.randint(1, 6))]
+        matrix = _claim_support_matrix(claims, contexts)
+        for claim, row in zip(claims, matrix, strict=True):
+            vectors = _tfidf_vectors([claim, *contexts])
+            for index in range(len(contexts)):
+                expected = _sparse_cosine(vectors[0], vectors[index + 1])
+                assert abs(row.get(index, 0.0) - expected) < 1e-9
+
+
+def test_claim_attribution_agrees_with_claim_analysis_and_feeds_counterfactuals() -> None:
+    contexts = CONTEXTS + [{"title": "Incidents", "snippet": "Incident thresholds block the release."}]
+    payload = compute_claim_attribution(OUTPUT, contexts)
+    analysis = _claim_analysis(OUTPUT, [f"{item['title']} {item['snippet']}" for item in contexts if "snippet" in item])
+
+    assert len(payload["claims"]) == analysis["claim_count"] == 2
+    for row, claim in zip(payload["claims"], analysis["claims"], strict=True):
+        assert abs(row["best_score"] - claim["support_score"]) <= 5e-4 + 1e-9
+        assert bool(row["supporting_chunks"]) == (claim["status"] != "unsupported")
+    assert all(cell[1] != 3 for cell in payload["cells"])
+    assert payload["claims"][0]["top_contributors"][0]["chunk_index"] == 0
+
+    statements = compute_counterfactual_summary([], [], {}, [], claim_attribution=payload)
+    sole = [entry for entry in payload["removal_impact"] if entry["claims_losing_support"]]
+    assert sole and f"If '{sole[0]['title']}' were removed" in statements[0]
+    assert compute_claim_attribution("", contexts)["claims"] == []
+
+
+def _fake_vector(text: str) -> list[float]:
+    tokens = text.lower().split()
+    return [float(sum(word.startswith(letter) for word in tokens)) for letter in "abcdefghijklmnopqrstuvwxyz"]
+
+
+def _embedding_config() -> ToolkitConfig:
+    return ToolkitConfig(
+        project_name="t",
+        adapters=AdapterConfig(provider="ollama", endpoint="http://localhost:11434", embedding_model="embed-test"),
+    )
+
+
+def test_embedding_attribution_batches_missing_vectors_once(monkeypatch) -> None:
+    pytest.importorskip("numpy")
+    calls: list[list[str]] = []
+
+    def _fake_embed(
+        texts: list[str], config: ToolkitConfig, model_name: str | None = None
+    ) -> EmbeddingInvocationResult:
+        calls.append(list(texts))
+        return EmbeddingInvocationResult(
+            provider="ollama",
+            model=model_name or "",
+            route="embeddings",
+            embeddings=[_fake_vector(text) for text in texts],
+            request_payload={},
+            response_payload={},
+            request_url="",
+        )
+
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability.embed_texts", _fake_embed)
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability._EMBEDDING_CACHE", {})
+    features = {
+        "embedding_available": True,
+        "embedding_model": "embed-test",
+        "output_vector": _fake_vector(OUTPUT),
+        "context_vectors": [_fake_vector(f"{item['title']} {item['snippet']}") for item in CONTEXTS[:3]],
+        "context_indices": [0, 1, 2],
+    }
+
+    first = compute_embedding_attribution(_embedding_config(), PROMPT, OUTPUT, CONTEXTS, features)
+    assert first["available"] is True
+    assert first["provider_calls"] == 1
+    assert calls == [_split_sentences(PROMPT) + _claim_units(OUTPUT)]
+    assert [entry["chunk_index"] for entry in first["context_attribution"]][0] in {0, 1}
+    assert len(first["sentence_attribution"]["segments"]) == 4
+    assert [row["claim_index"] for row in first["claim_support"]] == [0, 1]
+
+    second = compute_embedding_attribution(_embedding_config(), PROMPT, OUTPUT, CONTEXTS, features)
+    assert second["provider_calls"] == 0
+    assert second["context_attribution"] == first["context_attribution"]
+    assert len(calls) == 1
+
+
+def test_embedding_attribution_reuses_runner_vectors_for_the_same_chunk_text(monkeypatch) -> None:
+    pytest.importorskip("numpy")
+    embedded: list[str] = []
+
+    def _fake_embed(
+        texts: list[str], config: ToolkitConfig, model_name: str | None = None
+    ) -> EmbeddingInvocationResult:
+        embedded.extend(texts)
+        return EmbeddingInvocationResult(
+            "ollama", model_name or "", "embeddings", [_fake_vector(text) for text in texts], {}, {}, ""
+        )
+
+    monkeypatch.setattr("trusted_ai_toolkit.eval.runner.embed_texts", _fake_embed)
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability.embed_texts", _fake_embed)
+    contexts = [dict(item, chunk_text=f"chunk body {index}") for index, item in enumerate(CONTEXTS)]
+    features = compute_embedding_features(
+        _embedding_config(), {"prompt": PROMPT, "model_output": OUTPUT, "retrieved_contexts": contexts}
+    )
+    chunk_texts, before = set(embedded[2:]), len(embedded)
+    assert all("chunk body" not in text for text in chunk_texts)
+
+    # A cache too small for one report must not drop vectors mid-call.
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability._EMBEDDING_CACHE", MemoryLRUCache(max_entries=1))
+    reused = compute_embedding_attribution(_embedding_config(), PROMPT, OUTPUT, contexts, features)
+    assert reused["available"] is True
+    assert not chunk_texts & set(embedded[before:])
+
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability._EMBEDDING_CACHE", {})
+    standalone = compute_embedding_attribution(_embedding_config(), PROMPT, OUTPUT, contexts)
+    assert standalone["context_attribution"] == reused["context_attribution"]
+
+
+def test_embedding_attribution_is_unavailable_for_stub_provider() -> None:
+    payload = compute_embedding_attribution(ToolkitConfig(project_name="t"), PROMPT, OUTPUT, CONTEXTS)
+    assert payload["available"] is False
+    assert payload["reason"] in {"stub_provider", "numpy_unavailable"}
+
+
+def _regeneration_config(max_calls: int) -> ToolkitConfig:
+    return ToolkitConfig(
+        project_name="t",
+        adapters=AdapterConfig(provider="ollama", endpoint="http://localhost:11434", model="gen-test"),
+        xai=XAIConfig(regeneration=XAIRegenerationConfig(enabled=True, top_k=2, max_calls=max_calls)),
+    )
+
+
+def test_regeneration_counterfactuals_score_deltas_with_cache_and_call_cap(monkeypatch, tmp_path) -> None:
+    prompts: list[str] = []
+
+    def _fake_invoke(prompt: str, config: ToolkitConfig, deterministic: bool = True, budget=None):
+        prompts.append(prompt)
+        if budget is not None and not budget.acquire():
+            return BudgetRefusal("max_calls")
+        answer = "Quarterly monitoring evidence is reviewed. Vendors negotiate licensing terms privately."
+        if "Release Policy" in prompt:
+            answer = OUTPUT
+        return ModelInvocationResult("ollama", "gen-test", "ollama_generate", answer, {}, {}, "")
+
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability.invoke_model_safely", _fake_invoke)
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability._REGENERATION_CACHE", {})
+    ranked = compute_context_attribution(OUTPUT, CONTEXTS)
+    cache = XAIResultCache(tmp_path)
+
+    first = compute_regeneration_counterfactuals(
+        _regeneration_config(2), PROMPT, OUTPUT, CONTEXTS, ranked, cache=cache
+    )
+    assert first["available"] is True and first["provider_calls"] == 2
+    # The unablated baseline is regenerated first, with every source, under the same settings.
+    assert prompts[0] == compose_model_prompt(PROMPT, CONTEXTS) and first["baseline_status"] == "complete"
+    assert first["baseline"] == first["original"]
+    removed = first["counterfactuals"][0]
+    assert removed["chunk_index"] == ranked[0]["chunk_index"] and removed["status"] == "complete"
+    assert "[Source" in prompts[1] and "Release Policy" not in prompts[1]
+    assert removed["deltas"]["claim_support_rate"] < 0
+    assert first["counterfactuals"][1]["status"] == "call_cap_reached"
+
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability._REGENERATION_CACHE", {})
+    second = compute_regeneration_counterfactuals(
+        _regeneration_config(5), PROMPT, OUTPUT, CONTEXTS, ranked, budget=LLMBudget(max_calls=0), cache=cache
+    )
+    assert [cf["status"] for cf in second["counterfactuals"]] == ["cached", "budget_exhausted"]
+    assert second["cache_hits"] == 2 and second["counterfactuals"][0]["deltas"] == removed["deltas"]
+
+
+def test_regeneration_deltas_are_relative_to_regenerated_baseline(monkeypatch) -> None:
+    drifted = OUTPUT.split(".")[0] + ". Vendors negotiate licensing terms privately."
+
+    def _fake_invoke(prompt: str, config: ToolkitConfig, deterministic: bool = True, budget=None):
+        # Deterministic decoding drifts from the original whether or not a source was removed.
+        return ModelInvocationResult("ollama", "gen-test", "ollama_generate", drifted, {}, {}, "")
+
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability.invoke_model_safely", _fake_invoke)
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability._REGENERATION_CACHE", {})
+    ranked = compute_context_attribution(OUTPUT, CONTEXTS)
+    payload = compute_regeneration_counterfactuals(_regeneration_config(5), PROMPT, OUTPUT, CONTEXTS, ranked)
+    assert payload["baseline"] != payload["original"]
+    for record in payload["counterfactuals"]:
+        assert record["output_similarity"] == pytest.approx(1.0)
+        expected = {key: round(value - payload["baseline"][key], 3) for key, value in record["metrics"].items()}
+        assert record["deltas"] == expected
+
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability._REGENERATION_CACHE", {})
+    capped = compute_regeneration_counterfactuals(_regeneration_config(0), PROMPT, OUTPUT, CONTEXTS, ranked)
+    assert capped["available"] is False and capped["reason"] == "call_cap_reached"
+    assert capped["baseline"] == {} and all("deltas" not in record for record in capped["counterfactuals"])
+
+
+def test_regeneration_failure_on_last_budget_unit_is_not_budget_exhaustion(monkeypatch) -> None:
+    def _failing_invoke(*args, **kwargs):
+        raise ModelInvocationError("provider unavailable")
+
+    monkeypatch.setattr("trusted_ai_toolkit.model_client.invoke_model", _failing_invoke)
+    monkeypatch.setattr("trusted_ai_toolkit.xai.explainability._REGENERATION_CACHE", {})
+    ranked = compute_context_attribution(OUTPUT, CONTEXTS)
+    payload = compute_regeneration_counterfactuals(
+        _regeneration_config(5), PROMPT, OUTPUT, CONTEXTS, ranked, budget=LLMBudget(max_calls=1)
+    )
+    # The baseline spent the only unit and then failed; only the later calls were refused.
+    assert payload["baseline_status"] == "failed" and payload["reason"] == "failed"
+    assert {record["status"] for record in payload["counterfactuals"]} == {"budget_exhausted"}
+
+
+def test_memory_lru_cache_evicts_least_recently_used() -> None:
+    cache = MemoryLRUCache(max_entries=2)
+    cache["a"], cache["b"] = 1, 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    assert "b" not in cache and "a" in cache and len(cache) == 2
+
+
+def test_regeneration_counterfactuals_are_opt_in() -> None:
+    payload = compute_regeneration_counterfactuals(_embedding_config(), PROMPT, OUTPUT, CONTEXTS, [])
+    assert payload["enabled"] is False and payload["reason"] == "disabled"
+
+
+def test_context_shapley_matches_permutation_definition_and_splits_duplicates() -> None:
+    contexts = CONTEXTS + [dict(CONTEXTS[0])]
+    ranked = compute_context_attribution(OUTPUT, contexts)
+    by_index = {entry["chunk_index"]: entry for entry in ranked}
+    texts = [f"{item['title']} {item['snippet']}" for item in contexts if "snippet" in item]
+    kernel = _build_kernel(OUTPUT, texts)
+
+    players = list(range(len(texts)))
+    expected = [0.0] * len(players)
+    orders = list(permutations(players))
+    for order in orders:
+        members: list[int] = []
+        for player in order:
+            before = kernel.similarity_of(members)
+            members.append(player)
+            expected[player] += (kernel.similarity_of(members) - before) / len(orders)
+
+    for segment, chunk_index in enumerate([0, 1, 2, 4]):
+        assert abs(by_index[chunk_index]["shapley_value"] - expected[segment]) < 1e-3
+        assert by_index[chunk_index]["shapley_std_error"] == 0.0
+    assert abs(sum(expected) - kernel.similarity_of(players)) < 1e-9
+    # A duplicated source looks dispensable under LOO; Shapley splits its credit evenly.
+    assert by_index[0]["loo_impact"] < by_index[0]["shapley_value"] < by_index[0]["influence_score"]
+    assert by_index[0]["shapley_value"] == by_index[4]["shapley_value"]
+
+
+def test_context_shapley_samples_with_std_error_beyond_exact_limit() -> None:
+    rng = Random(5)
+    contexts = [{"title": f"C{i}", "snippet": _random_sentence(rng)} for i in range(24)]
+    ranked = compute_context_attribution(OUTPUT + " " + _random_sentence(rng), contexts)
+    assert len(ranked) == 24
+    assert any(entry["shapley_std_error"] > 0.0 for entry in ranked)
+
+
+def test_context_ablation_matches_metrics_recomputed_without_each_chunk() -> None:
+    contexts = CONTEXTS + [
+        {"title": "Incidents", "snippet": "Incident thresholds never block the release."},
+        "not-a-dict",
+    ]
+    ranked = compute_context_attribution(OUTPUT, contexts)
+    payload = compute_context_ablation(OUTPUT, contexts, ranked)
+
+    def _measured(remaining: list) -> dict[str, float]:
+        context = {"model_output": OUTPUT, "retrieved_contexts": remaining}
+        return {
+            "claim_support_rate": metric_claim_support_rate(context).value,
+            "unsupported_claim_rate": metric_unsupported_claim_rate(context).value,
+            "contradiction_rate": metric_contradiction_rate(context).value,
+            "evidence_sufficiency_score": metric_evidence_sufficiency_score(context).value,
+        }
+
+    assert payload["baseline"] == _measured(contexts)
+    labels = [(entry["label"], entry["removed"]) for entry in payload["ablations"]]
+    assert labels[:4] == [("single", [0]), ("single", [1]), ("single", [2]), ("single", [4])]
+    assert labels[-1] == ("top_2", sorted(entry["chunk_index"] for entry in ranked[:2]))
+    for entry in payload["ablations"]:
+        remaining = [item for index, item in enumerate(contexts) if index not in entry["removed"]]
+        assert entry["metrics"] == _measured(remaining)
+    assert any(entry["deltas"]["contradiction_rate"] != 0 for entry in payload["ablations"])
+
+    statements = compute_counterfactual_summary([], [], {}, ranked, context_ablation=payload)
+    assert any("recomputed, not estimated" in statement for statement in statements)
+    assert compute_context_ablation("", contexts, ranked)["ablations"] == []
@@ -24,6 +24,7 @@ from trusted_ai_toolkit.eval.metrics.llm_judges import (
     metric_llm_contradiction_judge,
 )
 from trusted_ai_toolkit.model_client import (
+    BudgetRefusal,
     ModelInvocationResult,
     _build_request_payload,
     _deterministic_extra_payload,
@@ -233,7 +234,7 @@ class TestLLMJudgeMetrics:
         # Return YES for the first claim (contradiction), NO for the rest.
         call_count = {"n": 0}
 
-        def _fake(prompt: str, config: ToolkitConfig, deterministic: bool = True):  # type: ignore[no-untyped-def]
+        def _fake(prompt: str, config: ToolkitConfig, deterministic: bool = True, budget: Any = None):  # type: ignore[no-untyped-def]
             call_count["n"] += 1
             return _make_result("YES" if call_count["n"] == 1 else "NO")
 
@@ -413,3 +414,224 @@ class TestLLMNarrative:
         )
         assert result["available"] is False
         assert result["narrative"] is None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Section 6 — Adaptive claim sampling
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestAdaptiveClaimSampling:
+
+    def _long_context(self, config: ToolkitConfig, claims: int = 120) -> dict:
+        sentences = " ".join(
+            f"Control {idx} requires quarterly approval evidence review." for idx in range(claims)
+        )
+        return {
+            "toolkit_config": config,
+            "model_output": sentences,
+            "retrieved_contexts": [
+                {"title": "Policy", "snippet": "Each control requires quarterly approval evidence review."}
+            ],
+        }
+
+    def _adaptive_config(self, ci_width: float = 0.2) -> ToolkitConfig:
+        config = _live_config()
+        config.eval.llm_judge.sampling = "adaptive"
+        config.eval.llm_judge.ci_width = ci_width
+        return config
+
+    def test_wilson_interval_bounds(self) -> None:
+        from trusted_ai_toolkit.eval.metrics.llm_judges import _wilson_interval
+
+        low, high = _wilson_interval(0, 20)
+        assert low == 0.0
+        assert 0.0 < high < 0.2
+        low, high = _wilson_interval(10, 20)
+        assert low < 0.5 < high
+        assert _wilson_interval(0, 0) == (0.0, 1.0)
+
+    def test_exhaustive_mode_reports_interval(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from trusted_ai_toolkit.eval.metrics import llm_judges
+
+        monkeypatch.setattr(llm_judges, "invoke_model_safely", lambda *a, **k: _make_result("YES"))
+        m = metric_llm_claim_entailment(self._long_context(_live_config(), claims=12))
+        sampling = m.details["sampling"]
+        assert sampling["method"] == "exhaustive"
+        assert sampling["stopped_early"] is False
+        assert m.details["judged_count"] == m.details["claim_count"] == 12
+        assert sampling["ci_95"][1] == 1.0
+
+    def test_adaptive_mode_stops_once_interval_is_narrow(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from trusted_ai_toolkit.eval.metrics import llm_judges
+
+        call_count = {"n": 0}
+
+        def _fake(*args: Any, **kwargs: Any):
+            call_count["n"] += 1
+            return _make_result("YES")
+
+        monkeypatch.setattr(llm_judges, "invoke_model_safely", _fake)
+        m = metric_llm_claim_entailment(self._long_context(self._adaptive_config()))
+        sampling = m.details["sampling"]
+        assert sampling["method"] == "adaptive_wilson"
+        assert sampling["stopped_early"] is True
+        assert sampling["ci_95"][1] - sampling["ci_95"][0] <= 0.2
+        assert m.details["claim_count"] == 120
+        assert call_count["n"] == m.details["judged_count"] < 120
+        assert m.value == 1.0
+
+    def test_adaptive_mode_is_reproducible(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from trusted_ai_toolkit.eval.metrics import llm_judges
+
+        def _fake(prompt: str, *args: Any, **kwargs: Any):
+            # Deterministic but claim-dependent verdicts so the sampled order matters.
+            return _make_result("YES" if sum(map(ord, prompt)) % 3 else "NO")
+
+        monkeypatch.setattr(llm_judges, "invoke_model_safely", _fake)
+        ctx = self._long_context(self._adaptive_config(ci_width=0.35))
+        first = metric_llm_contradiction_judge(ctx)
+        _LLM_JUDGE_CACHE.clear()
+        second = metric_llm_contradiction_judge(ctx)
+        assert first.value == second.value
+        assert first.details["judgments"] == second.details["judgments"]
+        assert first.details["sampling"] == second.details["sampling"]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Section 7 — Run-scoped LLM budget
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestLLMBudget:
+
+    def _budget_config(self, **limits: Any) -> ToolkitConfig:
+        config = _live_config()
+        config.adapters.run_budget = config.adapters.run_budget.model_copy(update=limits)
+        return config
+
+    def test_unlimited_budget_never_exhausts(self) -> None:
+        from trusted_ai_toolkit.model_client import LLMBudget
+
+        budget = LLMBudget.from_config(_live_config())
+        for _ in range(50):
+            assert budget.acquire() is True
+        assert budget.exhausted() is False
+        assert budget.snapshot()["calls"] == 50
+
+    def test_max_calls_blocks_invocation(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from trusted_ai_toolkit import model_client
+        from trusted_ai_toolkit.model_client import LLMBudget
+
+        call_count = {"n": 0}
+
+        def _spy(*args: Any, **kwargs: Any):
+            call_count["n"] += 1
+            return _make_result("ok")
+
+        monkeypatch.setattr(model_client, "invoke_model", _spy)
+        config = self._budget_config(max_calls=2)
+        budget = LLMBudget.from_config(config)
+        results = [invoke_model_safely("hi", config, budget=budget) for _ in range(4)]
+        assert [isinstance(r, BudgetRefusal) for r in results] == [False, False, True, True]
+        assert results[2] == BudgetRefusal("max_calls")
+        assert call_count["n"] == 2
+        assert budget.exhausted_reason == "max_calls"
+
+    def test_token_usage_from_provider_counts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from trusted_ai_toolkit import model_client
+        from trusted_ai_toolkit.model_client import LLMBudget
+
+        def _spy(*args: Any, **kwargs: Any):
+            result = _make_result("ok")
+            result.response_payload = {"prompt_eval_count": 40, "eval_count": 30}
+            return result
+
+        monkeypatch.setattr(model_client, "invoke_model", _spy)
+        config = self._budget_config(max_tokens=100)
+        budget = LLMBudget.from_config(config)
+        assert invoke_model_safely("hi", config, budget=budget) is not None
+        assert invoke_model_safely("hi", config, budget=budget) is not None
+        assert budget.tokens == 140
+        assert invoke_model_safely("hi", config, budget=budget) == BudgetRefusal("max_tokens")
+
+    def test_expired_deadline_degrades_judges(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from trusted_ai_toolkit.eval.metrics import llm_judges
+        from trusted_ai_toolkit.model_client import LLMBudget
+
+        monkeypatch.setattr(llm_judges, "invoke_model_safely", lambda *a, **k: pytest.fail("must not call"))
+        budget = LLMBudget(deadline=0.0)
+        ctx = TestLLMJudgeMetrics()._context_with_claims(_live_config())
+        ctx["llm_budget"] = budget
+        m = metric_llm_claim_entailment(ctx)
+        assert m.value is None
+        assert m.details["data_basis"] == "llm_unavailable"
+        assert m.details["reason"] == "budget_exhausted"
+        assert m.details["budget"]["exhausted_reason"] == "wall_clock_deadline"
+
+    def test_failure_on_last_budget_unit_is_graded_unknown(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from trusted_ai_toolkit import model_client
+        from trusted_ai_toolkit.eval.metrics.llm_judges import _grade_claim
+        from trusted_ai_toolkit.model_client import LLMBudget
+
+        def _boom(*args: Any, **kwargs: Any) -> Any:
+            raise model_client.ModelInvocationError("simulated")
+
+        monkeypatch.setattr(model_client, "invoke_model", _boom)
+        budget = LLMBudget(max_calls=1)
+        args = ("llm_claim_entailment", _live_config(), "m", "The sky is blue.", "Sky: blue.", "Judge.")
+        # The call spent the only unit and then failed: a provider failure, not a refusal.
+        assert _grade_claim(*args, budget=budget) == "unknown"
+        assert budget.exhausted() is True
+        _LLM_JUDGE_CACHE.clear()
+        assert _grade_claim(*args, budget=budget) is None
+
+    def test_budget_exhausted_mid_exhaustive_metric_is_unavailable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from trusted_ai_toolkit import model_client
+        from trusted_ai_toolkit.model_client import LLMBudget
+
+        monkeypatch.setattr(model_client, "invoke_model", lambda *a, **k: _make_result("YES"))
+        config = self._budget_config(max_calls=2)
+        ctx = TestLLMJudgeMetrics()._context_with_claims(config)
+        ctx["llm_budget"] = LLMBudget.from_config(config)
+        m = metric_llm_claim_entailment(ctx)
+        # The first two claims in extraction order are not a sample of the answer.
+        assert m.value is None
+        assert m.details["data_basis"] == "llm_unavailable"
+        assert m.details["reason"] == "budget_exhausted"
+        assert m.details["judged_count"] == 2
+        assert m.details["claim_count"] == 3
+
+        # The next metric in the same run finds the budget already spent.
+        second = metric_llm_contradiction_judge(ctx)
+        assert second.details["reason"] == "budget_exhausted"
+
+    def test_budget_exhausted_mid_adaptive_metric_reports_sampled_rate(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from trusted_ai_toolkit import model_client
+        from trusted_ai_toolkit.model_client import LLMBudget
+
+        monkeypatch.setattr(model_client, "invoke_model", lambda *a, **k: _make_result("YES"))
+        config = TestAdaptiveClaimSampling()._adaptive_config(ci_width=0.01)
+        config.adapters.run_budget = config.adapters.run_budget.model_copy(update={"max_calls": 5})
+        ctx = TestAdaptiveClaimSampling()._long_context(config, claims=12)
+        ctx["llm_budget"] = LLMBudget.from_config(config)
+        m = metric_llm_claim_entailment(ctx)
+        assert m.value == 1.0
+        assert m.details["data_basis"] == "llm_judged"
+        assert m.details["judged_count"] == 5
+        assert m.details["sampling"]["method"] == "adaptive_wilson"
+        assert m.details["sampling"]["budget_exhausted"] is True
+
+    def test_narrative_reports_budget_exhausted(self) -> None:
+        from trusted_ai_toolkit.model_client import LLMBudget
+
+        result = compute_llm_narrative(
+            config=_live_config(),
+            verdict="trusted",
+            reasons=[],
+            metric_summary={},
+            model_output="hi",
+            budget=LLMBudget(max_calls=0),
+        )
+        assert result["available"] is False
+        assert result["reason"] == "budget_exhausted"
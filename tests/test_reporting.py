@@ -3,11 +3,13 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from tat.schemas import SystemSpec
+from trusted_ai_toolkit import reporting
 from trusted_ai_toolkit.artifacts import ArtifactStore
 from trusted_ai_toolkit.benchmarking import update_registry_for_config
-from trusted_ai_toolkit.reporting import generate_scorecard
-from trusted_ai_toolkit.schemas import MetricResult, ToolkitConfig
-from tat.schemas import SystemSpec
+from trusted_ai_toolkit.reporting import generate_scorecard, refresh_scorecard_evidence
+from trusted_ai_toolkit.run_state import RunState
+from trusted_ai_toolkit.schemas import EvalResult, MetricResult, ToolkitConfig
 
 
 def test_reporting_generates_scorecard_with_stage_gates(tmp_path: Path) -> None:
@@ -249,3 +251,46 @@ def test_reporting_uses_historical_metric_distribution_for_trust_score(tmp_path:
     assert scorecard.trust_score > 1.0
     assert payload["registry_path"].endswith("registry.json")
     assert "accuracy_stub" in payload["metric_distributions"]
+
+
+def test_refresh_scorecard_evidence_matches_full_regeneration(tmp_path: Path, monkeypatch) -> None:
+    cfg = ToolkitConfig(
+        project_name="demo",
+        risk_tier="low",
+        output_dir=str(tmp_path / "artifacts"),
+        eval={"benchmark_registry_path": str(tmp_path / "registry.json")},
+    )
+    store = ArtifactStore(output_dir=cfg.output_dir, run_id="run5")
+    eval_result = EvalResult(
+        suite_name="low",
+        run_id="run5",
+        started_at="2026-01-01T00:00:00Z",
+        completed_at="2026-01-01T00:00:01Z",
+        overall_passed=True,
+        metric_results=[MetricResult(metric_id="accuracy_stub", value=0.8, threshold=0.7, passed=True, details={})],
+    )
+    store.write_json("eval_results.json", {"results": [eval_result.model_dump(mode="json")]})
+    store.write_json("redteam_findings.json", {"findings": []})
+    state = RunState(eval_results=[eval_result], findings=[])
+
+    first = generate_scorecard(cfg, store, state=state)
+    assert first.stage_gate_status["documentation"] == "needs_review"
+
+    for name in ("prompt_run.json", "embedding_trace.json", "telemetry.jsonl"):
+        store.write_json(name, {})
+    store.write_md("reasoning_report.md", "# Reasoning")
+
+    def _no_recompute(*_args, **_kwargs):
+        raise AssertionError("refresh recomputed benchmark distributions")
+
+    monkeypatch.setattr(reporting, "benchmark_distributions", _no_recompute)
+    refreshed = refresh_scorecard_evidence(cfg, store, state)
+    refreshed_html = store.path_for("scorecard.html").read_text(encoding="utf-8")
+    monkeypatch.undo()
+
+    assert refreshed.evidence_completeness == 100.0
+    assert refreshed.stage_gate_status["documentation"] == "pass"
+    assert state.scorecard is refreshed
+    full = generate_scorecard(cfg, store)
+    assert refreshed.model_dump(mode="json") == full.model_dump(mode="json")
+    assert refreshed_html == store.path_for("scorecard.html").read_text(encoding="utf-8")